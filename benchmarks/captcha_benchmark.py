@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Measure offline captcha solver accuracy and solve latency on the labelled fixture set
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scraper.captcha_solver import TemplateCaptchaSolver, TesseractCaptchaSolver, load_labelled_fixtures
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'captcha')
+
+
+def evaluate(solver_factory, fixtures, folds):
+    """Cross-validate: train on all folds but one, solve the held-out fold"""
+    results = []
+    for fold in range(folds):
+        train = [f for i, f in enumerate(fixtures) if i % folds != fold]
+        test = [f for i, f in enumerate(fixtures) if i % folds == fold]
+        solver = solver_factory(train)
+        for image_path, label in test:
+            with open(image_path, 'rb') as f:
+                image_bytes = f.read()
+            started = time.perf_counter()
+            solution = solver.solve(image_bytes)
+            elapsed = time.perf_counter() - started
+            text = solution.text if solution else ''
+            confidence = solution.confidence if solution else 0.0
+            results.append((text == label, confidence, elapsed))
+    return results
+
+
+def report(name, results, threshold):
+    if not results:
+        print(f"{name}: no fixtures evaluated")
+        return
+    latencies = sorted(r[2] for r in results)
+    accepted = [r for r in results if r[1] >= threshold]
+    accuracy = sum(r[0] for r in results) / len(results)
+    print(f"\n{name} ({len(results)} captchas)")
+    print(f"  Accuracy (all):              {accuracy:.1%}")
+    print(f"  {f'Coverage at >= {threshold:.2f}:':<29}{len(accepted) / len(results):.1%}")
+    if accepted:
+        print(f"  Accuracy above threshold:    {sum(r[0] for r in accepted) / len(accepted):.1%}")
+    print(f"  Solve latency mean / p95:    {sum(latencies) / len(latencies) * 1000:.1f} ms / "
+          f"{latencies[int(0.95 * (len(latencies) - 1))] * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Captcha solver accuracy/latency benchmark')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.8)
+    parser.add_argument('--tesseract', action='store_true', help='Also evaluate the Tesseract backend')
+    args = parser.parse_args()
+
+    fixtures = load_labelled_fixtures(args.fixtures)
+    print(f"Loaded {len(fixtures)} labelled captchas from {os.path.abspath(args.fixtures)}")
+
+    def template_factory(train):
+        solver = TemplateCaptchaSolver()
+        solver.train(train)
+        return solver
+
+    report("Template matching", evaluate(template_factory, fixtures, args.folds), args.threshold)
+
+    if args.tesseract:
+        tesseract = TesseractCaptchaSolver()
+        report("Tesseract OCR", evaluate(lambda train: tesseract, fixtures, 1), args.threshold)
+
+
+if __name__ == "__main__":
+    main()
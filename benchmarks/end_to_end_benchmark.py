@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Time complete scraping runs against the local mock portal and report tenders per minute per run mode
+
+Each browser mode runs search, captcha (offline template solver on the
+fixture images the mock serves), pagination, details and PDF downloads.
+The replay mode re-extracts the pages archived by the browser runs,
+without a browser or network.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mock_portal import DEFAULT_FIXTURES, MockPortal
+from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+
+MODES = {
+    'browser': {},
+    'lean': {'lean_browser': True},
+    'http': {'fetch_backend': 'http'},
+    'replay': None,
+}
+
+
+def write_config(workdir, portal, overrides):
+    """Scraper config pointing at the mock portal, with every file kept in workdir"""
+    config = {
+        'portal_name': 'Mock',
+        'base_url': portal.base_url,
+        'target_url': portal.target_url,
+        'headless_mode': True,
+        'delay_between_requests': 0,
+        'reuse_session': False,
+        'keepalive_enabled': False,
+        'captcha_solver': 'template',
+        'captcha_solver_threshold': 0.0,
+        'captcha_fixture_dir': os.path.abspath(DEFAULT_FIXTURES),
+        'download_folder': os.path.join(workdir, 'downloads'),
+        'session_cache_file': os.path.join(workdir, 'session_cache.json'),
+        'page_cursor_file': os.path.join(workdir, 'page_cursor.json'),
+        'driver_cache_file': os.path.join(workdir, 'driver_cache.json'),
+        'store_file': os.path.join(workdir, 'tenders.db'),
+        'archive_pages': True,
+        'archive_dir': os.path.join(workdir, 'archive'),
+    }
+    config.update(overrides)
+    path = os.path.join(workdir, 'config.json')
+    with open(path, 'w') as f:
+        json.dump(config, f, indent=4)
+    return path
+
+
+def run_browser_mode(name, overrides, args, workdir):
+    portal = MockPortal(args.tenders, args.latency_ms, args.jitter_ms, args.error_rate, args.expire_rate).start()
+    try:
+        mode_dir = os.path.join(workdir, name)
+        os.makedirs(mode_dir, exist_ok=True)
+        config_file = write_config(mode_dir, portal, overrides)
+        scraper = OdishaTenderScraperEnhanced(config_file, max_records=args.records)
+        started = time.perf_counter()
+        records = scraper.scrape_records('manual')
+        elapsed = time.perf_counter() - started
+        return {
+            'mode': name,
+            'tenders': len(records),
+            'failed': len(scraper.failed_tenders),
+            'seconds': round(elapsed, 2),
+            'requests': portal.stats['requests'],
+            'errors_injected': portal.stats['errors_injected'],
+            'sessions_expired': portal.stats['sessions_expired'],
+            'archive_dir': scraper.config['archive_dir'],
+            'config_file': config_file,
+        }
+    finally:
+        portal.stop()
+
+
+def run_replay_mode(source, workdir):
+    from scraper.reprocessor import reprocess_archive
+    from utils.page_archive import open_archive
+    from utils.tender_store import TenderStore
+
+    archive = open_archive(source['archive_dir'])
+    store = TenderStore(os.path.join(workdir, 'replay.db'))
+    started = time.perf_counter()
+    tenders = reprocess_archive(archive, store, source['config_file'])
+    elapsed = time.perf_counter() - started
+    return {'mode': 'replay', 'tenders': tenders, 'failed': 0, 'seconds': round(elapsed, 2),
+            'requests': 0, 'errors_injected': 0, 'sessions_expired': 0, 'source': source['mode']}
+
+
+def report(results):
+    print(f"{'mode':8s} {'tenders':>8s} {'failed':>7s} {'seconds':>9s} {'per min':>9s} {'requests':>9s} "
+          f"{'errors':>7s} {'expired':>8s}")
+    for result in results:
+        print(f"{result['mode']:8s} {result['tenders']:8d} {result['failed']:7d} {result['seconds']:9.2f} "
+              f"{result['tenders_per_minute']:9.1f} {result['requests']:9d} {result['errors_injected']:7d} "
+              f"{result['sessions_expired']:8d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--records', type=int, default=50, help='Tenders to scrape per run')
+    parser.add_argument('--tenders', type=int, default=200, help='Tenders listed by the mock portal')
+    parser.add_argument('--latency-ms', type=float, default=100, help='Delay the mock adds to every response')
+    parser.add_argument('--jitter-ms', type=float, default=50)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--expire-rate', type=float, default=0.0, help='Fraction of requests that expire the session')
+    parser.add_argument('--json', help='Also write the results to this file')
+    args = parser.parse_args()
+
+    # Keep the per-request scraper logging out of the report
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='e2e_benchmark_') as workdir:
+        for mode in args.modes:
+            if MODES[mode] is not None:
+                result = run_browser_mode(mode, MODES[mode], args, workdir)
+            else:
+                recorded = [r for r in results if r.get('archive_dir')]
+                if not recorded:
+                    print("replay: skipped, needs a browser mode in the same run to record pages")
+                    continue
+                result = run_replay_mode(recorded[-1], workdir)
+            result['tenders_per_minute'] = result['tenders'] / result['seconds'] * 60 if result['seconds'] else 0.0
+            results.append(result)
+
+    report(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump([{k: v for k, v in r.items() if k not in ('archive_dir', 'config_file')} for r in results],
+                      f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
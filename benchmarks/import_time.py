@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Guard startup time: measure module import and --help time in fresh interpreters
+and check that heavy dependencies are not loaded until they are needed
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+HEAVY_MODULES = ['selenium', 'webdriver_manager', 'pandas', 'numpy', 'requests', 'openpyxl']
+
+# name -> (statement, heavy modules that must stay unloaded)
+TARGETS = {
+    'import scraper': ("import scraper.tender_scrapper", HEAVY_MODULES + ['tkinter']),
+    'import gui': ("import gui.main_window", HEAVY_MODULES),
+    'cli --help': ("import sys; sys.argv = ['tender_scrapper', '--help']\n"
+                   "import scraper.tender_scrapper as t\n"
+                   "try:\n    t.main()\nexcept SystemExit:\n    pass", HEAVY_MODULES + ['tkinter']),
+}
+
+PROBE = """
+import io, json, sys, time, contextlib
+sys.path.insert(0, {src!r})
+started = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    exec({statement!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{'ms': elapsed * 1000, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement, heavy, repeats, workdir):
+    timings = []
+    loaded = []
+    for _ in range(repeats):
+        probe = PROBE.format(src=SRC, statement=statement, heavy=heavy)
+        output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, cwd=workdir)
+        if output.returncode != 0:
+            raise SystemExit(f"Probe failed:\n{output.stderr}")
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        timings.append(result['ms'])
+        loaded = result['loaded']
+    return statistics.median(timings), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeats', type=int, default=5, help='Fresh interpreters per target')
+    parser.add_argument('--max-ms', type=float, default=250,
+                        help='Fail when a median exceeds this many milliseconds')
+    args = parser.parse_args()
+
+    # Run in a scratch directory so log/config files created on import stay out of the tree
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, (statement, heavy) in TARGETS.items():
+            median_ms, loaded = measure(statement, heavy, args.repeats, workdir)
+            status = 'ok'
+            if loaded:
+                status = f"FAIL: loaded {', '.join(loaded)}"
+                failed = True
+            elif median_ms > args.max_ms:
+                status = f"FAIL: over {args.max_ms:.0f} ms"
+                failed = True
+            print(f"{name:15s} median={median_ms:7.1f} ms  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Save listing and tender detail pages from the mock portal as the parser benchmark corpus.
+
+Pages archived from the real portal (archive_pages / --archive) can be
+benchmarked directly with parser_benchmark.py --archive DIR.
+"""
+
+import argparse
+import csv
+import os
+
+import requests
+
+from mock_portal import MockPortal
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'pages')
+# Fixture URLs do not depend on the port the mock happened to use
+FIXTURE_BASE_URL = "https://tenders.example.gov.in"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--listing-pages', type=int, default=2)
+    parser.add_argument('--page-size', type=int, default=50, choices=(10, 20, 50))
+    parser.add_argument('--details', type=int, default=30, help='Detail pages to save')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    portal = MockPortal(max(args.details, args.listing_pages * args.page_size), seed=args.seed).start()
+    session = requests.Session()
+    pages = []
+    try:
+        session.get(portal.target_url)
+        session.post(f"{portal.base_url}/nicgep/app?page=WebTenderStatusLists&submit=1",
+                     data={'tenderStatus': 'AOC', 'captcha': 'FIXTURE'})
+        for page_no in range(1, args.listing_pages + 1):
+            path = (f"/nicgep/app?page=WebTenderStatusLists&service=direct&sp=results"
+                    f"&pageNo={page_no}&pageSize={args.page_size}")
+            pages.append(('listing', path, session.get(portal.base_url + path).text))
+        for tender_id in range(1, args.details + 1):
+            path = f"/nicgep/app?page=WebTenderStatusView&service=direct&id={tender_id}"
+            pages.append(('detail', path, session.get(portal.base_url + path).text))
+    finally:
+        portal.stop()
+
+    os.makedirs(args.output, exist_ok=True)
+    counters = {}
+    with open(os.path.join(args.output, 'manifest.csv'), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['filename', 'kind', 'url'])
+        for kind, path, html in pages:
+            counters[kind] = counters.get(kind, 0) + 1
+            filename = f"{kind}_{counters[kind]:03d}.html"
+            with open(os.path.join(args.output, filename), 'w', encoding='utf-8') as page:
+                page.write(html)
+            writer.writerow([filename, kind, FIXTURE_BASE_URL + path])
+    print(f"Wrote {len(pages)} pages to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
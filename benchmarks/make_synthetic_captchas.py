@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Generate the synthetic part of the labelled captcha fixture set.
+
+Real portal captchas are added to the same folder automatically when
+"captcha_fixture_capture" is enabled and a human-solved search succeeds.
+"""
+
+import argparse
+import csv
+import os
+import random
+
+from PIL import Image, ImageDraw, ImageFont
+
+ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+
+
+def make_captcha(text, rng):
+    """Draw dark jittered characters with thin noise lines on a light background"""
+    image = Image.new('L', (170, 50), color=rng.randint(225, 250))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=30)
+
+    x = 8
+    for char in text:
+        draw.text((x, rng.randint(4, 12)), char, fill=rng.randint(10, 70), font=font)
+        x += rng.randint(25, 28)
+
+    for _ in range(rng.randint(1, 3)):
+        draw.line([(0, rng.randint(0, 49)), (169, rng.randint(0, 49))], fill=rng.randint(150, 200), width=1)
+    for _ in range(60):
+        draw.point((rng.randint(0, 169), rng.randint(0, 49)), fill=rng.randint(120, 200))
+    return image
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic labelled captchas')
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'captcha'))
+    parser.add_argument('--count', type=int, default=60)
+    parser.add_argument('--length', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=2025)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    os.makedirs(args.output, exist_ok=True)
+    labels_path = os.path.join(args.output, 'labels.csv')
+    existing = []
+    if os.path.exists(labels_path):
+        with open(labels_path, newline='', encoding='utf-8') as f:
+            existing = [row for row in csv.DictReader(f) if row.get('source') != 'synthetic']
+
+    rows = []
+    for i in range(args.count):
+        text = ''.join(rng.choice(ALPHABET) for _ in range(args.length))
+        filename = f"synthetic_{i:03d}.png"
+        make_captcha(text, rng).save(os.path.join(args.output, filename), optimize=True)
+        rows.append({'filename': filename, 'text': text, 'source': 'synthetic'})
+
+    with open(labels_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['filename', 'text', 'source'])
+        writer.writeheader()
+        writer.writerows(existing + rows)
+    print(f"Wrote {len(rows)} synthetic captchas to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
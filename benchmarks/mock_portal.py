@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for a GePNIC tender portal, for end-to-end benchmarks without the real site
+
+Serves the tender status search form with a captcha (images from the labelled
+captcha fixtures), the paginated AOC listing, tender detail pages, stage summary
+details and AOC PDFs, with configurable latency, HTTP errors and session expiry.
+"""
+
+import argparse
+import csv
+import html
+import os
+import random
+import threading
+import time
+import uuid
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'captcha')
+APP = "/nicgep/app"
+STATUSES = ["To Be Opened", "Technical Evaluation", "Financial Evaluation", "AOC", "Retender", "Cancelled"]
+PAGE_SIZES = (10, 20, 50)
+
+STALE_PAGE = ("<html><body><h2>Stale Session</h2>"
+              "<p>Your session has timed out. Please restart the search.</p></body></html>")
+
+DEPARTMENTS = ["Works Department", "Water Resources Department", "Rural Development Department",
+               "Housing and Urban Development Department", "Energy Department"]
+FIRMS = ["Kalinga Builders", "Utkal Infra Projects", "Mahanadi Constructions", "Konark Engineering Works",
+         "Chilika Structures", "Jagannath Civil Contractors", "Eastern Ghats Infra"]
+
+
+def make_tenders(count, seed=0):
+    """Deterministic synthetic AOC tenders"""
+    rng = random.Random(seed)
+    tenders = []
+    for n in range(1, count + 1):
+        department = rng.choice(DEPARTMENTS)
+        firm = f"M/s {rng.choice(FIRMS)} Pvt Ltd"
+        value = rng.randint(5, 5000) * 10000 + rng.randint(0, 99)
+        tenders.append({
+            'id': n,
+            'tender_id': f"2024_{department.split()[0][:4].upper()}_{100000 + n}_1",
+            'title': f"Improvement of road and drainage works package {n} [{department.split()[0][:2].upper()}/{n}/2024]",
+            'organisation': f"{department}||Chief Engineer||Executive Engineer Division {1 + n % 9}",
+            'contract_value': f"INR {value:,}.00",
+            'contractor': firm,
+            'email': f"tenders{n}@{firm.split()[1].lower()}.example.com",
+            'mobile': f"9{rng.randint(100000000, 999999999)}",
+            'gst': f"21ABCDE{1000 + n % 9000}F1Z{n % 10}",
+        })
+    return tenders
+
+
+def make_pdf(kilobytes):
+    """Minimal valid-looking PDF padded to roughly the requested size"""
+    body = b"%PDF-1.4\n1 0 obj << /Type /Catalog >> endobj\n"
+    padding = max(0, kilobytes * 1024 - len(body) - 16)
+    return body + b"%" + b"0" * padding + b"\ntrailer\n%%EOF\n"
+
+
+class MockPortal:
+    """Threaded HTTP server imitating the portal; start() returns the running portal"""
+
+    def __init__(self, tenders=200, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, expire_rate=0.0,
+                 fixture_dir=DEFAULT_FIXTURES, strict_captcha=False, pdf_kb=64, seed=0,
+                 host='127.0.0.1', port=0):
+        self.tenders = make_tenders(tenders, seed)
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.expire_rate = expire_rate
+        self.strict_captcha = strict_captcha
+        self.pdf = make_pdf(pdf_kb)
+        self.captchas = self._load_captchas(fixture_dir)
+        self.sessions = {}
+        self.stats = {'requests': 0, 'errors_injected': 0, 'sessions_expired': 0, 'searches': 0,
+                      'listing_pages': 0, 'detail_pages': 0, 'pdfs': 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @staticmethod
+    def _load_captchas(fixture_dir):
+        captchas = []
+        labels_path = os.path.join(fixture_dir, 'labels.csv')
+        if os.path.exists(labels_path):
+            with open(labels_path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    path = os.path.join(fixture_dir, row['filename'])
+                    if os.path.exists(path):
+                        with open(path, 'rb') as image:
+                            captchas.append((image.read(), row['text']))
+        return captchas
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def target_url(self):
+        return f"{self.base_url}{APP}?page=WebTenderStatusLists&service=page"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-portal", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def chance(self, probability):
+        with self._lock:
+            return probability > 0 and self._rng.random() < probability
+
+    def _handler_class(self):
+        portal = self
+
+        class Handler(PortalHandler):
+            pass
+
+        Handler.portal = portal
+        return Handler
+
+
+class PortalHandler(BaseHTTPRequestHandler):
+    portal = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    # -- plumbing -----------------------------------------------------------
+
+    def session(self):
+        """(session id, session dict), creating a fresh session when the cookie is unknown"""
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        session_id = cookie['JSESSIONID'].value if 'JSESSIONID' in cookie else None
+        with self.portal._lock:
+            if session_id not in self.portal.sessions:
+                session_id = uuid.uuid4().hex
+                self.portal.sessions[session_id] = {'authenticated': False, 'new': True}
+            return session_id, self.portal.sessions[session_id]
+
+    def send(self, status, body, content_type="text/html; charset=utf-8", session_id=None, headers=None):
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', 'no-store')
+        if session_id:
+            self.send_header('Set-Cookie', f"JSESSIONID={session_id}; Path=/; HttpOnly")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def redirect(self, location, session_id=None):
+        self.send(302, "", session_id=session_id, headers={'Location': location})
+
+    def do_GET(self):
+        self.handle_request(parse_qs(urlparse(self.path).query))
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        params = parse_qs(urlparse(self.path).query)
+        params.update(parse_qs(self.rfile.read(length).decode('utf-8')))
+        self.handle_request(params)
+
+    def handle_request(self, params):
+        portal = self.portal
+        portal.count('requests')
+        if portal.latency or portal.jitter:
+            time.sleep(portal.latency + random.uniform(0, portal.jitter))
+        if portal.chance(portal.error_rate):
+            portal.count('errors_injected')
+            self.send(500, "<html><body><h1>Internal Server Error</h1></body></html>")
+            return
+
+        path = urlparse(self.path).path
+        session_id, session = self.session()
+        new_session = session.pop('new', False)
+        cookie = session_id if new_session else None
+        value = lambda name, default='': params.get(name, [default])[0]
+
+        try:
+            if path.startswith('/nicgep/captcha'):
+                self.captcha(session, cookie)
+            elif path.startswith('/nicgep/files/'):
+                self.pdf_file(session, cookie)
+            elif path == APP and value('page') == 'WebTenderStatusLists' and value('service') == 'page':
+                self.search_form(session, cookie)
+            elif path == APP and value('page') == 'WebTenderStatusLists' and value('submit'):
+                self.submit_search(session, cookie, value)
+            elif not session['authenticated']:
+                self.send(200, STALE_PAGE, session_id=cookie)
+            elif portal.chance(portal.expire_rate):
+                portal.count('sessions_expired')
+                session['authenticated'] = False
+                self.send(200, STALE_PAGE)
+            elif path == APP and value('page') == 'WebTenderStatusLists':
+                self.listing(session, value)
+            elif path == APP and value('page') == 'WebTenderStatusView':
+                self.detail(int(value('id', '0')))
+            elif path == APP and value('page') == 'StageSummary':
+                self.stage_summary(int(value('id', '0')))
+            else:
+                self.send(404, "<html><body>Not found</body></html>", session_id=cookie)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    # -- pages ----------------------------------------------------------------
+
+    def search_form(self, session, cookie):
+        options = ''.join(f'<option value="{s if s != "AOC" else "AOC"}">{s}</option>' for s in STATUSES)
+        departments = ''.join(f'<option value="{d}">{d}</option>' for d in DEPARTMENTS)
+        self.send(200, f"""<html><head><title>Tender Status</title></head><body>
+<form method="post" action="{APP}?page=WebTenderStatusLists&amp;submit=1">
+<table class="search-form">
+<tr><td>Tender Status</td><td><select name="tenderStatus"><option value="">--Select--</option>{options}</select></td></tr>
+<tr><td>Date Criteria</td><td><select name="dateCriteria"><option value="">--Select--</option>
+<option value="Published Date">Published Date</option><option value="Bid Opening Date">Bid Opening Date</option></select></td></tr>
+<tr><td>From Date</td><td><input type="text" name="fromDate"/></td></tr>
+<tr><td>To Date</td><td><input type="text" name="toDate"/></td></tr>
+<tr><td>Organisation</td><td><select name="organisationName"><option value="">--Select--</option>{departments}</select></td></tr>
+<tr><td>Captcha</td><td><img id="captchaImage" src="/nicgep/captcha.png?r={uuid.uuid4().hex[:8]}" alt="captcha"/>
+<input type="text" name="captcha" id="captcha"/></td></tr>
+<tr><td colspan="2"><input type="submit" name="search" id="searchButton" value="Search"/></td></tr>
+</table></form></body></html>""", session_id=cookie)
+
+    def captcha(self, session, cookie):
+        if not self.portal.captchas:
+            self.send(404, "no captcha fixtures", session_id=cookie)
+            return
+        image, label = random.choice(self.portal.captchas)
+        session['captcha'] = label
+        self.send(200, image, content_type="image/png", session_id=cookie)
+
+    def submit_search(self, session, cookie, value):
+        entered = value('captcha').strip()
+        if not entered or (self.portal.strict_captcha and entered != session.get('captcha')):
+            self.send(200, "<html><body><div class='error'>Invalid Captcha! Please try again.</div></body></html>",
+                      session_id=cookie)
+            return
+        self.portal.count('searches')
+        session.update(authenticated=True, status=value('tenderStatus') or 'AOC')
+        self.redirect(f"{APP}?page=WebTenderStatusLists&service=direct&sp=results&pageNo=1&pageSize=10",
+                      session_id=cookie)
+
+    def listing_url(self, page_no, page_size):
+        return html.escape(f"{APP}?" + urlencode({'page': 'WebTenderStatusLists', 'service': 'direct',
+                                                  'sp': 'results', 'pageNo': page_no, 'pageSize': page_size}))
+
+    def listing(self, session, value):
+        self.portal.count('listing_pages')
+        page_size = int(value('pageSize', '10'))
+        page_size = page_size if page_size in PAGE_SIZES else 10
+        pages = max(1, -(-len(self.portal.tenders) // page_size))
+        page_no = min(max(1, int(value('pageNo', '1'))), pages)
+        start = (page_no - 1) * page_size
+        rows = []
+        for offset, tender in enumerate(self.portal.tenders[start:start + page_size]):
+            rows.append(
+                f"<tr><td>{start + offset + 1}</td><td>{tender['tender_id']}</td>"
+                f"<td>{html.escape(tender['title'])}</td><td>{html.escape(tender['organisation'])}</td>"
+                f"<td>AOC</td><td><a href=\"{APP}?page=WebTenderStatusView&amp;service=direct&amp;id={tender['id']}\">"
+                f"{html.escape(session.get('status', 'AOC'))}</a></td></tr>")
+
+        window = range(max(1, page_no - 4), min(pages, page_no + 5) + 1)
+        pager = ' '.join(f'<a href="{self.listing_url(n, page_size)}">{n}</a>' if n != page_no else f'<b>{n}</b>'
+                         for n in window)
+        if page_no < pages:
+            pager += f' <a href="{self.listing_url(page_no + 1, page_size)}">Next &gt;</a>'
+        sizes = ''.join(f'<option value="{s}"{" selected" if s == page_size else ""}>{s}</option>' for s in PAGE_SIZES)
+        select_url = html.escape(f"{APP}?page=WebTenderStatusLists&service=direct&sp=results&pageNo=1&pageSize=")
+        self.send(200, f"""<html><body>
+<div>Records per page <select name="recordsPerPage" onchange="location.href='{select_url}' + this.value">{sizes}</select></div>
+<table class="list-table"><tr><th>S.No</th><th>Tender ID</th><th>Title and Ref.No.</th><th>Organisation Chain</th>
+<th>Tender Stage</th><th>Status</th></tr>{''.join(rows)}</table>
+<div class="pager">{pager}</div></body></html>""")
+
+    def tender(self, tender_id):
+        if 1 <= tender_id <= len(self.portal.tenders):
+            return self.portal.tenders[tender_id - 1]
+        return None
+
+    def detail(self, tender_id):
+        tender = self.tender(tender_id)
+        if not tender:
+            self.send(404, "<html><body>No such tender</body></html>")
+            return
+        self.portal.count('detail_pages')
+        n = tender['id']
+        self.send(200, f"""<html><body><h2>Tender Details</h2>
+<table class="tender"><tr><td>Tender ID</td><td>{tender['tender_id']}</td></tr>
+<tr><td>Title</td><td>{html.escape(tender['title'])}</td></tr></table>
+<h3>AOC Details</h3>
+<table class="aoc"><tr><td colspan="2">AOC Details</td></tr>
+<tr><td>Contract Value</td><td>{tender['contract_value']}</td></tr>
+<tr><td>AOC Document</td><td><a href="/nicgep/files/aoc_{n}.pdf">AOC_Letter_{n}.pdf</a></td></tr></table>
+<h3>Awarded Bids List</h3>
+<table class="bids"><tr><th>S.No</th><th>Bid Id</th><th>Bidder Name</th><th>Awarded Value</th></tr>
+<tr><td>1</td><td>BID{n:06d}</td><td>{html.escape(tender['contractor'])}</td><td>{tender['contract_value']}</td></tr></table>
+<table class="contact"><tr><td>Email</td><td>{tender['email']}</td></tr>
+<tr><td>Mobile</td><td>{tender['mobile']}</td></tr>
+<tr><td>GSTIN</td><td>{tender['gst']}</td></tr></table>
+<table class="stages"><tr><th>Stage</th><th>Date</th></tr>
+<tr><td>Bid Opening</td><td>0{1 + n % 9}-Mar-2024</td></tr>
+<tr><td>Technical Evaluation</td><td>1{n % 9}-Mar-2024</td></tr>
+<tr><td>AOC</td><td>2{n % 9}-Apr-2024</td></tr></table>
+<a href="{APP}?page=StageSummary&amp;service=direct&amp;id={n}">View Details</a>
+</body></html>""")
+
+    def stage_summary(self, tender_id):
+        tender = self.tender(tender_id)
+        if not tender:
+            self.send(404, "<html><body>No such tender</body></html>")
+            return
+        self.send(200, f"""<html><body><h2>Stage Summary</h2>
+<table><tr><td>Financial Bid Opening</td><td>1{tender['id'] % 9}-Apr-2024</td></tr>
+<tr><td>Awarded To</td><td>{html.escape(tender['contractor'])}</td></tr></table></body></html>""")
+
+    def pdf_file(self, session, cookie):
+        if not session['authenticated']:
+            self.send(403, "<html><body>Forbidden</body></html>", session_id=cookie)
+            return
+        self.portal.count('pdfs')
+        self.send(200, self.portal.pdf, content_type="application/pdf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock GePNIC tender portal')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--tenders', type=int, default=200)
+    parser.add_argument('--latency-ms', type=float, default=0, help='Delay added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Extra random delay, 0..N ms')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--expire-rate', type=float, default=0, help='Fraction of requests that expire the session')
+    parser.add_argument('--strict-captcha', action='store_true', help='Require the correct captcha text')
+    parser.add_argument('--pdf-kb', type=int, default=64)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    args = parser.parse_args()
+
+    portal = MockPortal(args.tenders, args.latency_ms, args.jitter_ms, args.error_rate, args.expire_rate,
+                        args.fixtures, args.strict_captcha, args.pdf_kb, host=args.host, port=args.port).start()
+    print(f"Mock portal serving {len(portal.tenders)} tenders")
+    print(f"  base_url:   {portal.base_url}")
+    print(f"  target_url: {portal.target_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        portal.stop()
+        print(f"Stopped. {portal.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Compare page load times with the default and the lean browser profile
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+
+
+def measure(config_file, urls, repeats, lean, headless):
+    """Load every URL ``repeats`` times; returns per-load wall times in seconds"""
+    scraper = OdishaTenderScraperEnhanced(config_file)
+    scraper.config['lean_browser'] = lean
+    scraper.config['headless_mode'] = headless
+    if not scraper.setup_driver():
+        raise SystemExit("Could not start a browser")
+    timings = []
+    try:
+        scraper.set_resource_blocking(True)
+        for url in urls:
+            # Warm up DNS/TLS so both profiles start from the same state
+            scraper.driver.get(url)
+            for _ in range(repeats):
+                started = time.perf_counter()
+                scraper.driver.get(url)
+                timings.append(time.perf_counter() - started)
+    finally:
+        scraper.driver.quit()
+    return timings
+
+
+def summarize(name, timings):
+    print(f"{name:8s} loads={len(timings):3d}  median={statistics.median(timings) * 1000:7.0f} ms  "
+          f"mean={statistics.mean(timings) * 1000:7.0f} ms  max={max(timings) * 1000:7.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('urls', nargs='*', help='Pages to load (default: target_url from the config)')
+    parser.add_argument('--config', default='scraper_config.json', help='Configuration file path')
+    parser.add_argument('--repeats', type=int, default=5, help='Loads per URL and profile')
+    parser.add_argument('--show-browser', action='store_true', help='Run with a visible browser')
+    args = parser.parse_args()
+
+    urls = args.urls or [OdishaTenderScraperEnhanced(args.config).target_url]
+    headless = not args.show_browser
+
+    default = measure(args.config, urls, args.repeats, lean=False, headless=headless)
+    lean = measure(args.config, urls, args.repeats, lean=True, headless=headless)
+
+    summarize('default', default)
+    summarize('lean', lean)
+    speedup = statistics.median(default) / statistics.median(lean)
+    print(f"Median speed-up with lean profile: {speedup:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
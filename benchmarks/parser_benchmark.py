@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Time the page parsers on saved HTML and fail on regressions against the previous commit
+
+Runs the real extractors through the replay fetch backend (no browser or
+network): listing parse, contract value, contractor/email/mobile/GST,
+AOC PDF links and format_details_column. Results are appended to a
+JSON-lines history keyed by git commit.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scraper.fetch_backends import ReplayBackend
+from scraper.tender_record import TenderRecord
+from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'pages')
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def load_fixtures(fixture_dir):
+    """[(kind, url, html)] from a directory of saved pages with manifest.csv"""
+    pages = []
+    with open(os.path.join(fixture_dir, 'manifest.csv'), newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            with open(os.path.join(fixture_dir, row['filename']), encoding='utf-8') as page:
+                pages.append((row['kind'], row['url'], page.read()))
+    return pages
+
+
+def load_archive(archive_dir):
+    """[(kind, url, html)] of the listing and detail pages in a page archive"""
+    from utils.page_archive import PageArchive
+    archive = PageArchive(archive_dir)
+    pages = [(page['kind'], page['url'], archive.read(page['id']))
+             for page in archive.pages() if page['kind'] in ('listing', 'detail')]
+    archive.close()
+    return pages
+
+
+def detail_record(url):
+    return TenderRecord(tender_id='BENCH', status_link=url)
+
+
+def make_cases(scraper, pages):
+    """name -> (pages, function run on each page)"""
+    backend = scraper.fetch_backend
+    listings = [(url, html) for kind, url, html in pages if kind == 'listing']
+    details = [(url, html) for kind, url, html in pages if kind == 'detail']
+
+    def on_page(extract):
+        def run(page):
+            backend.load(page[1], page[0])
+            return extract(detail_record(page[0]))
+        return run
+
+    # Completed records for format_details_column, extracted once up front
+    records = []
+    for url, html in details:
+        record = detail_record(url)
+        backend.load(html, url)
+        for extract in (scraper.extract_aoc_contract_details, scraper.extract_contractor_details,
+                        scraper.download_aoc_pdfs, scraper.extract_stage_summary):
+            extract(record)
+        records.append(record)
+
+    def listing(page):
+        backend.load(page[1], page[0])
+        return scraper.extract_current_page_data()
+
+    return {
+        'listing': (listings, listing),
+        'contract_value': (details, on_page(scraper.extract_aoc_contract_details)),
+        'contractor': (details, on_page(scraper.extract_contractor_details)),
+        'pdf_links': (details, on_page(scraper.download_aoc_pdfs)),
+        'format_details': (records, scraper.format_details_column),
+    }
+
+
+def sample(items, function, min_seconds):
+    """Milliseconds per item, looping over the items for at least min_seconds"""
+    loops = 0
+    started = time.perf_counter()
+    while True:
+        for item in items:
+            function(item)
+        loops += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return elapsed * 1000 / (loops * len(items))
+
+
+def measure(cases, repeats, min_seconds):
+    """Best-of-repeats milliseconds per item for every case
+
+    Repeats go round-robin over the cases, so a stall on a busy machine
+    costs each parser at most one sample, and the fastest sample is the
+    least disturbed by other load.
+    """
+    cases = {name: case for name, case in cases.items() if case[0]}
+    for items, function in cases.values():
+        for item in items:
+            function(item)
+    timings = {name: [] for name in cases}
+    for _ in range(repeats):
+        for name, (items, function) in cases.items():
+            timings[name].append(sample(items, function, min_seconds))
+    return {name: min(values) for name, values in timings.items()}
+
+
+def current_commit():
+    """(short commit hash, whether tracked files have uncommitted changes)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=REPO, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True,
+                               text=True, cwd=REPO).stdout.strip() != ''
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+
+
+def read_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_baseline(history, commit, corpus, baseline=None):
+    """(commit, best time per parser) of the requested commit, or else the latest other clean commit
+
+    Taking each parser's best time over every recorded run of the baseline
+    commit keeps one noisy run from hiding or faking a regression.
+    """
+    entries = [entry for entry in history if entry.get('corpus') == corpus and not entry.get('dirty')]
+    if baseline is not None:
+        matching = [e for e in entries if e['commit'].startswith(baseline) or baseline.startswith(e['commit'])]
+    else:
+        matching = [e for e in entries if e['commit'] != commit]
+    if not matching:
+        return None, {}
+    baseline_commit = matching[-1]['commit']
+    best = {}
+    for entry in matching:
+        if entry['commit'] == baseline_commit:
+            for name, ms in entry['results'].items():
+                best[name] = min(ms, best.get(name, ms))
+    return baseline_commit, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='Saved pages with manifest.csv')
+    parser.add_argument('--archive', help='Benchmark the pages of a page archive instead')
+    parser.add_argument('--repeats', type=int, default=7, help='Samples per parser; the fastest counts')
+    parser.add_argument('--min-seconds', type=float, default=0.1, help='Minimum duration of each sample')
+    parser.add_argument('--history', default='parser_benchmark_history.jsonl', help='JSON-lines results history')
+    parser.add_argument('--baseline', help='Commit to compare against (default: latest other clean commit in the history)')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Fail when a parser is slower than the baseline by more than this fraction')
+    parser.add_argument('--no-record', action='store_true', help='Do not append this run to the history')
+    args = parser.parse_args()
+
+    pages = load_archive(args.archive) if args.archive else load_fixtures(args.fixtures)
+    corpus = f"archive:{os.path.abspath(args.archive)}" if args.archive else "fixtures"
+    history_path = os.path.abspath(args.history)
+
+    commit, dirty = current_commit()
+    baseline, baseline_results = find_baseline(read_history(history_path), commit, corpus, args.baseline)
+    if args.baseline and baseline is None:
+        print(f"No results for commit {args.baseline} in {history_path}")
+
+    def regressed(results):
+        return [name for name, ms in results.items()
+                if name in baseline_results and ms / baseline_results[name] - 1 > args.threshold]
+
+    # Extractors log every lookup; keep that out of the timings and the report
+    logging.disable(logging.CRITICAL)
+    # Run in a scratch directory so the config and download folder stay out of the tree
+    with tempfile.TemporaryDirectory() as workdir:
+        config_file = os.path.join(workdir, 'config.json')
+        with open(config_file, 'w') as f:
+            json.dump({'download_folder': os.path.join(workdir, 'downloads'),
+                       'store_file': os.path.join(workdir, 'tenders.db')}, f)
+        scraper = OdishaTenderScraperEnhanced(config_file)
+        scraper.fetch_backend = ReplayBackend({})
+        cases = make_cases(scraper, pages)
+        results = measure(cases, args.repeats, args.min_seconds)
+        # Measure apparent regressions again before failing on them
+        suspects = regressed(results)
+        if suspects:
+            retry = measure({name: cases[name] for name in suspects}, args.repeats, args.min_seconds)
+            results.update({name: min(results[name], ms) for name, ms in retry.items()})
+    logging.disable(logging.NOTSET)
+
+    failed = regressed(results)
+    reference = f"vs {baseline}" if baseline else "(no baseline)"
+    print(f"{len(pages)} pages, commit {commit}{'+dirty' if dirty else ''} {reference}")
+    for name, ms in results.items():
+        line = f"{name:15s} {ms:9.3f} ms/page"
+        if name in baseline_results:
+            line += f"  {ms / baseline_results[name] - 1:+7.1%}"
+            if name in failed:
+                line += f"  FAIL: over +{args.threshold:.0%}"
+        print(line)
+
+    if not args.no_record:
+        entry = {'commit': commit, 'dirty': dirty, 'timestamp': datetime.now().isoformat(timespec='seconds'),
+                 'python': platform.python_version(), 'corpus': corpus, 'pages': len(pages), 'results': results}
+        with open(history_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
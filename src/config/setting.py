@@ -11,7 +11,9 @@ DEFAULT_CONFIG = {
     "timeout_seconds": 15,
     "delay_between_requests": 2,
     "max_retries": 3,
-    "headless_mode": False
+    "headless_mode": False,
+    "prewarm_browser": False,
+    "browser_max_reuse": 20
 }
 
 def get_config_path():
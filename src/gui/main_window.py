@@ -6,7 +6,7 @@ from datetime import datetime
 import json
 import logging
 
-from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+from scraper.driver_pool import DriverPool
 from utils.file_manager import FileManager
 
 class MainApplication:
@@ -19,8 +19,15 @@ class MainApplication:
         self.is_running = False
         self.file_manager = FileManager()
         self.captcha_event = None  # Event to signal captcha completion
+        # Browsers kept warm between runs, rebuilt when browser settings change
+        self.driver_pool = None
+        self.driver_pool_settings = None
         
         self.setup_gui()
+        
+        # Start a browser in the background so the first run does not wait for it
+        if self.config.get("prewarm_browser"):
+            self.get_driver_pool(self.current_settings()).prewarm()
     
     def setup_gui(self):
         """Setup the main GUI"""
@@ -204,17 +211,16 @@ class MainApplication:
     def run_scraper(self):
         """Run the scraper in a separate thread"""
         try:
+            # Imported here so the window opens without loading the scraper stack
+            from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+            
             # Create and run scraper with proper configuration
             self.scraper = OdishaTenderScraperEnhanced(max_records=self.config.get("max_records", 25))
             
             # Update scraper config with GUI settings
-            self.scraper.config.update({
-                'download_folder': self.output_dir_var.get(),
-                'headless_mode': self.headless_var.get(),
-                'delay_between_requests': float(self.delay_var.get()),
-                'timeout_seconds': self.config.get('timeout_seconds', 15),
-                'max_retries': self.config.get('max_retries', 3)
-            })
+            settings = self.current_settings()
+            self.scraper.config.update(settings)
+            self.scraper.driver_pool = self.get_driver_pool(settings)
             
             # Pass GUI callbacks to scraper
             self.scraper.gui_show_captcha_button = self.show_captcha_button
@@ -244,6 +250,41 @@ class MainApplication:
             self.root.after(0, self.reset_ui)
             self.root.after(0, self.hide_captcha_button)
     
+    def current_settings(self):
+        """Scraper config overrides from the GUI fields"""
+        return {
+            'download_folder': self.output_dir_var.get(),
+            'headless_mode': self.headless_var.get(),
+            'delay_between_requests': float(self.delay_var.get()),
+            'timeout_seconds': self.config.get('timeout_seconds', 15),
+            'max_retries': self.config.get('max_retries', 3)
+        }
+    
+    def get_driver_pool(self, settings):
+        """Driver pool for the current browser settings"""
+        browser_settings = (settings['download_folder'], settings['headless_mode'])
+        if self.driver_pool and self.driver_pool_settings != browser_settings:
+            # Download folder and headless mode are fixed when a browser starts
+            self.driver_pool.close()
+            self.driver_pool = None
+        if not self.driver_pool:
+            from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+            
+            # A scraper of its own starts the pool's browsers, independent of any run
+            factory = OdishaTenderScraperEnhanced(max_records=1)
+            factory.config.update(settings)
+            factory.download_folder = settings['download_folder']
+            self.driver_pool = DriverPool(factory.new_driver, size=1,
+                                          max_uses=self.config.get('browser_max_reuse', 20))
+            self.driver_pool_settings = browser_settings
+        return self.driver_pool
+    
+    def shutdown(self):
+        """Quit the warm browsers when the application closes"""
+        if self.driver_pool:
+            self.driver_pool.close()
+            self.driver_pool = None
+    
     def reset_ui(self):
         """Reset UI after scraping"""
         self.is_running = False
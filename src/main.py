@@ -17,7 +17,6 @@ import logging
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
-from scraper.tender_scrapper import OdishaTenderScraperEnhanced
 from utils.logger import setup_logging
 from config.setting import load_config, save_config
 from gui.main_window import MainApplication
@@ -63,6 +62,7 @@ class TenderScraperApp:
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
             # Save current configuration
             save_config(self.config)
+            self.app.shutdown()
             self.root.destroy()
     
     def run(self):
@@ -0,0 +1,159 @@
+import os
+import statistics
+import logging
+from collections import deque
+from typing import Dict, List, Optional
+
+
+def _children_from_proc() -> Dict[int, List[int]]:
+    """Parent pid -> child pids, read from /proc (Linux)"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; fields resume after the last ')'
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    return children
+
+
+def _rss_from_proc(pid: int) -> int:
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pid: int) -> Optional[int]:
+    """Total resident memory in bytes of a process and all its descendants
+
+    Uses psutil when installed, /proc otherwise; None when neither works.
+    """
+    try:
+        import psutil
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            total = 0
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total
+        except psutil.Error:
+            return None
+    except ImportError:
+        pass
+
+    if not os.path.isdir('/proc'):
+        return None
+    children = _children_from_proc()
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += _rss_from_proc(current)
+        pending.extend(children.get(current, []))
+    return total
+
+
+def kill_process_tree(pid: int):
+    """Kill a process and all its descendants (a hung driver and its browser)"""
+    try:
+        import psutil
+        try:
+            root = psutil.Process(pid)
+            processes = root.children(recursive=True) + [root]
+        except psutil.Error:
+            return
+        for process in processes:
+            try:
+                process.kill()
+            except psutil.Error:
+                continue
+        return
+    except ImportError:
+        pass
+
+    import signal
+    pids = [pid]
+    if os.path.isdir('/proc'):
+        children = _children_from_proc()
+        pending = [pid]
+        while pending:
+            current = pending.pop()
+            for child in children.get(current, []):
+                pids.append(child)
+                pending.append(child)
+    for target in reversed(pids):
+        try:
+            os.kill(target, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        except OSError:
+            continue
+
+
+def browser_rss(driver) -> Optional[int]:
+    """Memory of the browser started by a WebDriver (driver process and everything below it)"""
+    try:
+        return process_tree_rss(driver.service.process.pid)
+    except Exception:
+        return None
+
+
+class BrowserWatchdog:
+    """Decide when a long-running browser should be replaced
+
+    Triggers after ``max_pages`` page loads, when the browser's memory
+    exceeds ``max_rss_mb``, or when the recent median page load is
+    ``slowdown_factor`` times slower than at the start of the browser's
+    life. Memory is sampled every ``sample_every`` pages.
+    """
+
+    def __init__(self, max_pages: int = 300, max_rss_mb: Optional[float] = 1500,
+                 slowdown_factor: Optional[float] = 3.0, sample_every: int = 10, window: int = 10):
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.slowdown_factor = slowdown_factor
+        self.sample_every = max(1, sample_every)
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """Start counting for a fresh browser"""
+        self.pages = 0
+        self.baseline: List[float] = []
+        self.recent = deque(maxlen=self.window)
+        self.last_rss: Optional[int] = None
+
+    def record_page(self, load_seconds: float):
+        self.pages += 1
+        if len(self.baseline) < self.window:
+            self.baseline.append(load_seconds)
+        else:
+            self.recent.append(load_seconds)
+
+    def recycle_reason(self, driver) -> Optional[str]:
+        """Why the browser should be recycled now, or None"""
+        if self.max_pages and self.pages >= self.max_pages:
+            return f"{self.pages} pages loaded"
+
+        if self.slowdown_factor and len(self.recent) == self.window:
+            baseline = statistics.median(self.baseline)
+            current = statistics.median(self.recent)
+            if baseline > 0 and current > baseline * self.slowdown_factor:
+                return f"page loads slowed from {baseline:.1f}s to {current:.1f}s"
+
+        if self.max_rss_mb and self.pages % self.sample_every == 0:
+            self.last_rss = browser_rss(driver)
+            if self.last_rss and self.last_rss > self.max_rss_mb * 1024 * 1024:
+                return f"browser memory at {self.last_rss / 1024 / 1024:.0f} MB"
+        return None
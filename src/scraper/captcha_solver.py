@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import csv
+import io
+import os
+import time
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from utils.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+GLYPH_SIZE = (20, 20)
+LABELS_FILE = "labels.csv"
+
+
+class CaptchaSolution:
+    """Text read from a captcha image with the solver's confidence (0..1)"""
+
+    __slots__ = ('text', 'confidence', 'solver', 'elapsed')
+
+    def __init__(self, text: str, confidence: float, solver: str, elapsed: float = 0.0):
+        self.text = text
+        self.confidence = confidence
+        self.solver = solver
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return f"CaptchaSolution(text={self.text!r}, confidence={self.confidence:.2f}, solver={self.solver!r})"
+
+
+class CaptchaSolver(ABC):
+    """Base class for offline captcha solvers"""
+
+    name = "base"
+
+    @abstractmethod
+    def solve(self, image_bytes: bytes) -> Optional[CaptchaSolution]:
+        """Read the captcha text from PNG/JPEG bytes, or None if it cannot"""
+
+
+def load_labelled_fixtures(fixture_dir: str) -> List[Tuple[str, str]]:
+    """Return (image path, label) pairs listed in the fixture set's labels.csv"""
+    labels_path = os.path.join(fixture_dir, LABELS_FILE)
+    if not os.path.exists(labels_path):
+        return []
+    fixtures = []
+    with open(labels_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            image_path = os.path.join(fixture_dir, row['filename'])
+            if row.get('text') and os.path.exists(image_path):
+                fixtures.append((image_path, row['text']))
+    return fixtures
+
+
+def _to_binary(image_bytes: bytes) -> np.ndarray:
+    """Grayscale, denoise and threshold the image; True marks ink pixels"""
+    from PIL import Image, ImageFilter
+
+    image = Image.open(io.BytesIO(image_bytes)).convert('L').filter(ImageFilter.MedianFilter(3))
+    pixels = np.asarray(image, dtype=np.float32)
+    # Otsu threshold over the 256-bin histogram
+    histogram, _ = np.histogram(pixels, bins=256, range=(0, 256))
+    total = pixels.size
+    cumulative = np.cumsum(histogram)
+    cumulative_mean = np.cumsum(histogram * np.arange(256))
+    background = cumulative[:-1]
+    foreground = total - background
+    valid = (background > 0) & (foreground > 0)
+    mean_bg = np.where(valid, cumulative_mean[:-1] / np.maximum(background, 1), 0)
+    mean_fg = np.where(valid, (cumulative_mean[-1] - cumulative_mean[:-1]) / np.maximum(foreground, 1), 0)
+    between = np.where(valid, background * foreground * (mean_bg - mean_fg) ** 2, 0)
+    threshold = int(np.argmax(between))
+    return pixels <= threshold
+
+
+def segment_glyphs(binary: np.ndarray, min_width: int = 2) -> List[np.ndarray]:
+    """Split a binarized captcha into per-character glyphs using column projection"""
+    columns = binary.sum(axis=0) > 0
+    segments = []
+    start = None
+    for x, has_ink in enumerate(list(columns) + [False]):
+        if has_ink and start is None:
+            start = x
+        elif not has_ink and start is not None:
+            if x - start >= min_width:
+                segments.append((start, x))
+            start = None
+
+    if not segments:
+        return []
+
+    # Touching characters show up as one wide segment: split it evenly
+    widths = [end - begin for begin, end in segments]
+    typical = float(np.median(widths))
+    split_segments = []
+    for begin, end in segments:
+        pieces = max(1, int(round((end - begin) / typical))) if typical else 1
+        step = (end - begin) / pieces
+        for i in range(pieces):
+            split_segments.append((int(begin + i * step), int(begin + (i + 1) * step)))
+
+    glyphs = []
+    for begin, end in split_segments:
+        glyph = binary[:, begin:end]
+        rows = np.where(glyph.sum(axis=1) > 0)[0]
+        if rows.size == 0:
+            continue
+        glyphs.append(_normalize_glyph(glyph[rows[0]:rows[-1] + 1, :]))
+    return glyphs
+
+
+def _normalize_glyph(glyph: np.ndarray) -> np.ndarray:
+    from PIL import Image
+
+    image = Image.fromarray((glyph * 255).astype(np.uint8)).resize(GLYPH_SIZE, Image.BILINEAR)
+    vector = np.asarray(image, dtype=np.float32).ravel()
+    vector -= vector.mean()
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class TemplateCaptchaSolver(CaptchaSolver):
+    """Offline template-matching solver trained from a labelled fixture set
+
+    Each labelled image is segmented into glyphs; when the glyph count
+    matches the label length every glyph becomes a template for its
+    character. Unknown captchas are segmented the same way and each glyph
+    is matched by normalized cross-correlation. The overall confidence is
+    the weakest glyph's correlation, so one doubtful character is enough
+    to fall back to a human.
+    """
+
+    name = "template"
+
+    def __init__(self, fixture_dir: str = None, expected_length: Optional[int] = None):
+        self.templates: Dict[str, np.ndarray] = {}
+        self.expected_length = expected_length
+        if fixture_dir:
+            self.train(load_labelled_fixtures(fixture_dir))
+
+    def train(self, fixtures: List[Tuple[str, str]]) -> int:
+        """Build per-character templates; returns the number of usable samples"""
+        samples: Dict[str, List[np.ndarray]] = {}
+        used = 0
+        for image_path, label in fixtures:
+            with open(image_path, 'rb') as f:
+                glyphs = segment_glyphs(_to_binary(f.read()))
+            if len(glyphs) != len(label):
+                continue
+            used += 1
+            for char, glyph in zip(label, glyphs):
+                samples.setdefault(char, []).append(glyph)
+
+        self.templates = {}
+        for char, vectors in samples.items():
+            mean = np.mean(vectors, axis=0)
+            norm = np.linalg.norm(mean)
+            self.templates[char] = mean / norm if norm else mean
+        logging.info(f"Captcha templates built for {len(self.templates)} characters from {used} samples")
+        return used
+
+    def solve(self, image_bytes: bytes) -> Optional[CaptchaSolution]:
+        started = time.perf_counter()
+        if not self.templates:
+            return None
+        glyphs = segment_glyphs(_to_binary(image_bytes))
+        if not glyphs or (self.expected_length and len(glyphs) != self.expected_length):
+            return CaptchaSolution('', 0.0, self.name, time.perf_counter() - started)
+
+        chars = list(self.templates.keys())
+        matrix = np.stack([self.templates[c] for c in chars])
+        text = []
+        scores = []
+        for glyph in glyphs:
+            correlations = matrix @ glyph
+            best = int(np.argmax(correlations))
+            text.append(chars[best])
+            scores.append(float(correlations[best]))
+
+        confidence = max(0.0, min(scores))
+        return CaptchaSolution(''.join(text), confidence, self.name, time.perf_counter() - started)
+
+
+class TesseractCaptchaSolver(CaptchaSolver):
+    """Local OCR backend using Tesseract (requires pytesseract and the tesseract binary)"""
+
+    name = "tesseract"
+
+    def __init__(self, whitelist: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"):
+        import pytesseract
+        self.pytesseract = pytesseract
+        self.config = f"--psm 7 -c tessedit_char_whitelist={whitelist}"
+
+    def solve(self, image_bytes: bytes) -> Optional[CaptchaSolution]:
+        from PIL import Image
+
+        started = time.perf_counter()
+        binary = _to_binary(image_bytes)
+        image = Image.fromarray(((~binary) * 255).astype(np.uint8))
+        data = self.pytesseract.image_to_data(image, config=self.config,
+                                              output_type=self.pytesseract.Output.DICT)
+        words = [(w, float(c)) for w, c in zip(data['text'], data['conf']) if w.strip() and float(c) >= 0]
+        if not words:
+            return CaptchaSolution('', 0.0, self.name, time.perf_counter() - started)
+        text = ''.join(w for w, _ in words)
+        confidence = min(c for _, c in words) / 100.0
+        return CaptchaSolution(text, confidence, self.name, time.perf_counter() - started)
+
+
+def get_captcha_solver(config: Dict) -> Optional[CaptchaSolver]:
+    """Create the solver selected by the 'captcha_solver' config key, if any"""
+    backend = (config.get("captcha_solver") or "none").lower()
+    if backend == "none":
+        return None
+    try:
+        if backend == "template":
+            solver = TemplateCaptchaSolver(config.get("captcha_fixture_dir"),
+                                           config.get("captcha_length"))
+            return solver if solver.templates else None
+        if backend == "tesseract":
+            return TesseractCaptchaSolver()
+        logging.warning(f"Unknown captcha solver '{backend}', using manual captcha only")
+    except ImportError as e:
+        logging.warning(f"Captcha solver '{backend}' unavailable ({e}), using manual captcha only")
+    except Exception as e:
+        logging.warning(f"Could not initialise captcha solver '{backend}': {e}")
+    return None
@@ -0,0 +1,115 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import logging
+from typing import Dict, Optional
+
+# Where each browser records its installed version (Windows) and its usual executables elsewhere
+_VERSION_KEYS = {
+    'chrome': r"Software\Google\Chrome\BLBeacon",
+    'brave': r"Software\BraveSoftware\Brave-Browser\BLBeacon",
+    'edge': r"Software\Microsoft\Edge\BLBeacon",
+    'firefox': r"Software\Mozilla\Mozilla Firefox",
+}
+_EXECUTABLES = {
+    'chrome': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'],
+    'edge': ['microsoft-edge', 'microsoft-edge-stable'],
+    'firefox': ['firefox'],
+}
+_VERSION = re.compile(r'\d+(?:\.\d+)+')
+
+
+def installed_browser_version(browser: str, binary_location: Optional[str] = None) -> Optional[str]:
+    """Version of the installed browser, read without starting it; None if it cannot be told
+
+    ``binary_location`` is the custom Chromium executable (Brave) the
+    Chrome driver was pointed at, if any.
+    """
+    if sys.platform == 'win32':
+        # Windows browsers do not print a version; read the one they record in the registry
+        import winreg
+        key_path = _VERSION_KEYS.get('brave' if browser == 'chrome' and binary_location else browser)
+        name = 'CurrentVersion' if browser == 'firefox' else 'version'
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(hive, key_path) as key:
+                    match = _VERSION.search(str(winreg.QueryValueEx(key, name)[0]))
+                    if match:
+                        return match.group(0)
+            except (OSError, TypeError):
+                continue
+        return None
+    candidates = [binary_location] if binary_location else [shutil.which(name) for name in _EXECUTABLES.get(browser, [])]
+    for executable in filter(None, candidates):
+        try:
+            output = subprocess.run([executable, '--version'], capture_output=True, text=True, timeout=10).stdout
+        except Exception as e:
+            logging.debug(f"Could not read the version of {executable}: {e}")
+            continue
+        match = _VERSION.search(output or '')
+        if match:
+            return match.group(0)
+    return None
+
+
+def major_version(version: Optional[str]) -> Optional[str]:
+    """Leading component of a browser version - drivers are built per major version"""
+    return version.split('.')[0] if version else None
+
+
+class DriverCache:
+    """Remember which browser and driver binary worked, so later starts skip probing
+
+    The entry is dropped when the driver binary disappears, when the
+    installed browser has moved to another major version, or when the
+    driver no longer starts; the recorded browser version is refreshed
+    when a cached start reports a new minor version.
+    """
+
+    def __init__(self, path: str = "driver_cache.json"):
+        self.path = path
+
+    def load(self) -> Optional[Dict]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r') as f:
+                entry = json.load(f)
+        except Exception as e:
+            logging.warning(f"Could not read driver cache {self.path}: {e}")
+            return None
+        if not entry.get('driver_path') or not os.path.exists(entry['driver_path']):
+            logging.info("[DRIVER] Cached driver binary is missing, probing browsers again")
+            self.invalidate()
+            return None
+        return entry
+
+    def save(self, browser: str, driver_path: Optional[str], browser_version: Optional[str],
+             binary_location: Optional[str] = None):
+        if not driver_path:
+            return
+        entry = {
+            'browser': browser,
+            'driver_path': driver_path,
+            'browser_version': browser_version,
+            'binary_location': binary_location,
+            'saved_at': time.time()
+        }
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(entry, f, indent=2)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logging.warning(f"Could not save driver cache: {e}")
+
+    def invalidate(self):
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except Exception as e:
+            logging.debug(f"Could not remove driver cache: {e}")
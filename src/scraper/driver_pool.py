@@ -0,0 +1,168 @@
+import threading
+import time
+import logging
+from typing import Callable, Dict, List, Optional
+
+
+class DriverPool:
+    """Keep started browsers warm between runs
+
+    ``factory`` starts a new WebDriver (or returns None). Released drivers
+    are reset and kept for the next ``acquire``; a driver that fails its
+    health check, has served ``max_uses`` runs or is older than
+    ``max_age_seconds`` is quit and replaced in the background, and an
+    ``acquire`` arriving meanwhile waits for that replacement rather than
+    starting a second browser.
+    """
+
+    def __init__(self, factory: Callable[[], Optional[object]], size: int = 1,
+                 max_uses: int = 20, max_age_seconds: float = 3600):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age_seconds = max_age_seconds
+        self._idle: List[object] = []
+        self._info: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        # Notified when a prewarm start ends, with a browser in _idle or not
+        self._ready = threading.Condition(self._lock)
+        # Browsers prewarm has committed to starting but not yet put in _idle
+        self._starting = 0
+        # Browsers are started one at a time
+        self._create_lock = threading.Lock()
+        self._closed = False
+
+    def _create(self) -> Optional[object]:
+        with self._create_lock:
+            started = time.perf_counter()
+            driver = self.factory()
+            if driver is None:
+                return None
+            with self._lock:
+                self._info[id(driver)] = {'created_at': time.time(), 'uses': 0}
+            logging.info(f"[POOL] Browser started in {time.perf_counter() - started:.1f}s")
+            return driver
+
+    def prewarm(self, wait: bool = False):
+        """Start browsers up to the pool size in the background"""
+        with self._lock:
+            count = 0 if self._closed else max(self.size - len(self._idle) - self._starting, 0)
+            self._starting += count
+        if not count:
+            return
+
+        def fill():
+            remaining = count
+            try:
+                while remaining:
+                    driver = None if self._closed else self._create()
+                    with self._lock:
+                        remaining -= 1
+                        self._starting -= 1
+                        keep = driver is not None and not self._closed
+                        if keep:
+                            self._idle.append(driver)
+                        self._ready.notify_all()
+                    if not keep:
+                        if driver is not None:
+                            self._quit(driver)
+                        return
+            finally:
+                # A failed or interrupted start gives up the rest of its slots
+                with self._lock:
+                    self._starting -= remaining
+                    self._ready.notify_all()
+
+        thread = threading.Thread(target=fill, daemon=True)
+        thread.start()
+        if wait:
+            thread.join()
+
+    def acquire(self) -> Optional[object]:
+        """Hand out a healthy idle browser, or start one"""
+        while True:
+            with self._lock:
+                # Wait for a browser already being prewarmed instead of starting another
+                while not self._idle and self._starting:
+                    self._ready.wait()
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            if self.is_healthy(driver):
+                self._count_use(driver)
+                logging.info("[POOL] Reusing warm browser")
+                return driver
+            logging.info("[POOL] Discarding unresponsive browser")
+            self._quit(driver)
+
+        driver = self._create()
+        if driver is not None:
+            self._count_use(driver)
+        return driver
+
+    def _count_use(self, driver):
+        with self._lock:
+            self._info[id(driver)]['uses'] += 1
+
+    def release(self, driver, reusable: bool = True):
+        """Return a browser after a run; it is reset, or quit if due for recycling"""
+        with self._lock:
+            info = dict(self._info.get(id(driver), {'created_at': 0, 'uses': self.max_uses}))
+        expired = (info['uses'] >= self.max_uses or
+                   time.time() - info['created_at'] > self.max_age_seconds)
+        if self._closed or not reusable or expired or not self.reset(driver):
+            logging.info("[POOL] Recycling browser")
+            self._quit(driver)
+            if not self._closed:
+                self.prewarm()
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def discard(self, driver):
+        """Quit a broken browser and start a replacement in the background"""
+        self.release(driver, reusable=False)
+
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        try:
+            handles = driver.window_handles
+            if not handles:
+                return False
+            driver.switch_to.window(handles[0])
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def reset(driver) -> bool:
+        """Close extra windows, drop cookies and park the browser on a blank page"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logging.debug(f"Could not reset browser: {e}")
+            return False
+
+    def _quit(self, driver):
+        with self._lock:
+            self._info.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.debug(f"Error quitting browser: {e}")
+
+    def close(self):
+        """Quit every idle browser; drivers still in use are quit when released"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
@@ -0,0 +1,355 @@
+import re
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from utils.lazy_import import lazy_import, lazy_from
+from scraper.html_tables import TABLES_SCRIPT
+from scraper.session_cache import SessionCache
+
+requests = lazy_import('requests')
+HTTPAdapter = lazy_from('requests.adapters', 'HTTPAdapter')
+Retry = lazy_from('urllib3.util.retry', 'Retry')
+
+_WHITESPACE = re.compile(r'\s+')
+_INVISIBLE_TAGS = ('script', 'style', 'noscript', 'head', 'title')
+_BLOCK_TAGS = ('br', 'td', 'th', 'tr', 'table', 'div', 'p', 'li')
+
+
+class FetchTimeoutError(TimeoutError):
+    """Raised when a backend gives up waiting for a page"""
+    pass
+
+
+class PageNotArchivedError(LookupError):
+    """Raised by the replay backend for a URL that was never recorded"""
+    pass
+
+
+def _no_such_element(message: str) -> Exception:
+    from selenium.common.exceptions import NoSuchElementException
+    return NoSuchElementException(message)
+
+
+def _visible_text(element) -> str:
+    """Whitespace-collapsed text of an element, skipping scripts and styles like element.text"""
+    parts = []
+
+    def walk(node):
+        # Comments and processing instructions have a non-string tag
+        if not isinstance(node.tag, str) or node.tag in _INVISIBLE_TAGS:
+            return
+        if node.tag in _BLOCK_TAGS:
+            parts.append(' ')
+        parts.append(node.text or '')
+        for child in node:
+            walk(child)
+            parts.append(child.tail or '')
+        if node.tag in _BLOCK_TAGS:
+            parts.append(' ')
+
+    walk(element)
+    return _WHITESPACE.sub(' ', ''.join(parts)).strip()
+
+
+def _xpath_for(by: str, value: str, relative: bool) -> str:
+    """Translate a Selenium locator into XPath for the HTML backends"""
+    prefix = './/' if relative else '//'
+    if by == 'xpath':
+        return value
+    if by == 'tag name':
+        return f"{prefix}{value}"
+    if by == 'id':
+        return f"{prefix}*[@id='{value}']"
+    if by == 'name':
+        return f"{prefix}*[@name='{value}']"
+    if by == 'class name':
+        return f"{prefix}*[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+    if by == 'link text':
+        return f"{prefix}a[normalize-space(.)='{value}']"
+    if by == 'partial link text':
+        return f"{prefix}a[contains(normalize-space(.), '{value}')]"
+    raise ValueError(f"Locator '{by}' is not supported outside the browser")
+
+
+class HtmlElement:
+    """Read-only stand-in for a WebElement, backed by an lxml element"""
+
+    def __init__(self, element, base_url: str):
+        self._element = element
+        self._base_url = base_url
+
+    @property
+    def tag_name(self) -> str:
+        return self._element.tag
+
+    @property
+    def text(self) -> str:
+        return _visible_text(self._element)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        if name in ('textContent', 'innerText'):
+            return self.text
+        value = self._element.get(name)
+        # WebDriver returns the resolved URL for link properties
+        if value is not None and name in ('href', 'src', 'action') and not value.lower().startswith('javascript:'):
+            return urljoin(self._base_url, value)
+        return value
+
+    def is_displayed(self) -> bool:
+        node = self._element
+        while node is not None:
+            style = (node.get('style') or '').replace(' ', '').lower()
+            if 'display:none' in style or 'visibility:hidden' in style or node.get('hidden') is not None \
+                    or (node.tag == 'input' and (node.get('type') or '').lower() == 'hidden'):
+                return False
+            node = node.getparent()
+        return True
+
+    def find_elements(self, by: str, value: str) -> List['HtmlElement']:
+        return _select(self._element, _xpath_for(by, value, relative=True), self._base_url)
+
+    def find_element(self, by: str, value: str) -> 'HtmlElement':
+        found = self.find_elements(by, value)
+        if not found:
+            raise _no_such_element(f"No element for {by}={value}")
+        return found[0]
+
+
+def _select(root, xpath: str, base_url: str) -> List[HtmlElement]:
+    return [HtmlElement(node, base_url) for node in root.xpath(xpath) if isinstance(getattr(node, 'tag', None), str)]
+
+
+class FetchBackend(ABC):
+    """How the scraper reaches portal pages
+
+    Backends expose the subset of the WebDriver API the extraction code
+    uses (``find_element(s)``, ``page_source``, ``current_url``) plus
+    ``navigate``, ``fetch`` (HTML of a URL; only the browser has to leave
+    the current page for it), ``find_links`` and ``read_tables``, so the
+    same extractors run on a live browser, plain HTTP or a recorded
+    archive.
+    """
+
+    name = "base"
+    # Offline backends cannot download PDFs or reach the portal at all
+    offline = False
+
+    @abstractmethod
+    def navigate(self, url: str):
+        """Make url the current page"""
+
+    @abstractmethod
+    def fetch(self, url: str) -> str:
+        """HTML of url"""
+
+    @property
+    @abstractmethod
+    def page_source(self) -> str:
+        """HTML of the current page"""
+
+    @property
+    @abstractmethod
+    def current_url(self) -> str:
+        """URL of the current page"""
+
+    @abstractmethod
+    def find_elements(self, by: str, value: str) -> list:
+        """Elements of the current page matching a Selenium locator"""
+
+    @abstractmethod
+    def find_element(self, by: str, value: str):
+        """First matching element, raising NoSuchElementException when there is none"""
+
+    @abstractmethod
+    def read_tables(self, xpath: Optional[str] = None) -> List[List[List[str]]]:
+        """Cell texts of the tables matching xpath (all tables by default), row by row"""
+
+    def find_links(self, xpath: str = "//a[@href]") -> List[str]:
+        """Absolute targets of the links matching xpath, in page order, without duplicates"""
+        links = []
+        for element in self.find_elements('xpath', xpath):
+            href = element.get_attribute('href')
+            if href and not href.lower().startswith('javascript:') and href not in links:
+                links.append(href)
+        return links
+
+    def load_cookies(self, cookies: List[Dict]):
+        """Adopt the browser's session cookies (after a captcha or re-authentication)"""
+        pass
+
+    def close(self):
+        pass
+
+
+class SeleniumBackend(FetchBackend):
+    """Pages through the live browser"""
+
+    name = "selenium"
+
+    def __init__(self, driver, get=None):
+        self.driver = driver
+        # Lets the scraper route loads through its watchdog-timed get
+        self._get = get or driver.get
+
+    def navigate(self, url: str):
+        self._get(url)
+
+    def fetch(self, url: str) -> str:
+        self.navigate(url)
+        return self.driver.page_source
+
+    @property
+    def page_source(self) -> str:
+        return self.driver.page_source
+
+    @property
+    def current_url(self) -> str:
+        return self.driver.current_url
+
+    def find_elements(self, by: str, value: str) -> list:
+        return self.driver.find_elements(by, value)
+
+    def find_element(self, by: str, value: str):
+        return self.driver.find_element(by, value)
+
+    def read_tables(self, xpath: Optional[str] = None) -> List[List[List[str]]]:
+        # One script call instead of a WebDriver round-trip per cell
+        return self.driver.execute_script(TABLES_SCRIPT, xpath) or []
+
+
+class HtmlBackend(FetchBackend):
+    """Shared page handling for backends that parse HTML themselves (requires lxml)"""
+
+    def __init__(self):
+        import lxml.html
+        self._lxml_html = lxml.html
+        self._html = ''
+        self._url = ''
+        self._document = None
+
+    def load(self, html: str, url: str):
+        """Make html the current page"""
+        self._html = html or ''
+        self._url = url
+        self._document = self._lxml_html.document_fromstring(self._html or '<html></html>')
+
+    def navigate(self, url: str):
+        html, final_url = self.get_html(url)
+        self.load(html, final_url)
+
+    def fetch(self, url: str) -> str:
+        return self.get_html(url)[0]
+
+    @abstractmethod
+    def get_html(self, url: str):
+        """(HTML, final URL) of a page"""
+
+    @property
+    def page_source(self) -> str:
+        return self._html
+
+    @property
+    def current_url(self) -> str:
+        return self._url
+
+    def find_elements(self, by: str, value: str) -> List[HtmlElement]:
+        if self._document is None:
+            return []
+        return _select(self._document, _xpath_for(by, value, relative=False), self._url)
+
+    def find_element(self, by: str, value: str) -> HtmlElement:
+        found = self.find_elements(by, value)
+        if not found:
+            raise _no_such_element(f"No element for {by}={value}")
+        return found[0]
+
+    def read_tables(self, xpath: Optional[str] = None) -> List[List[List[str]]]:
+        tables = self.find_elements('xpath', xpath) if xpath else self.find_elements('tag name', 'table')
+        result = []
+        for table in tables:
+            # Same rows and cells as table.rows / row.cells in the browser
+            rows = table._element.xpath("./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr")
+            result.append([[HtmlElement(cell, self._url).text for cell in row.xpath("./td")] for row in rows])
+        return result
+
+
+class HttpBackend(HtmlBackend):
+    """Pages over a pooled keep-alive HTTP session carrying the browser's cookies"""
+
+    name = "http"
+
+    def __init__(self, cookies: Optional[List[Dict]] = None, user_agent: Optional[str] = None,
+                 pool_size: int = 8, timeout: float = 30, retries: int = 2):
+        super().__init__()
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              # Read timeouts are not retried here: the scraper re-queues the tender
+                              max_retries=Retry(total=retries, read=False, backoff_factor=0.5,
+                                                status_forcelist=(502, 503, 504),
+                                                allowed_methods=frozenset(['GET'])))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        if cookies:
+            self.load_cookies(cookies)
+
+    def load_cookies(self, cookies: List[Dict]):
+        self.session.cookies.clear()
+        SessionCache.apply_to_requests(self.session, cookies)
+
+    def get_html(self, url: str):
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.Timeout as e:
+            raise FetchTimeoutError(f"No response within {self.timeout}s: {url}") from e
+        response.raise_for_status()
+        return response.text, response.url
+
+    def close(self):
+        self.session.close()
+
+
+class ReplayBackend(HtmlBackend):
+    """Pages from a recorded archive; never touches the network
+
+    ``archive`` is anything with ``get(url) -> Optional[str]``, e.g. a
+    dict of URL to HTML.
+    """
+
+    name = "replay"
+    offline = True
+
+    def __init__(self, archive):
+        super().__init__()
+        self.archive = archive
+
+    def get_html(self, url: str):
+        html = self.archive.get(url)
+        if html is None:
+            raise PageNotArchivedError(f"Page not in archive: {url}")
+        return html, url
+
+
+def create_fetch_backend(name: str, driver=None, config: Optional[Dict] = None, archive=None) -> FetchBackend:
+    """Backend selected by name ('selenium', 'http' or 'replay')"""
+    config = config or {}
+    if name == "selenium":
+        return SeleniumBackend(driver)
+    if name == "http":
+        user_agent = None
+        cookies = []
+        if driver is not None:
+            cookies = driver.get_cookies()
+            try:
+                user_agent = driver.execute_script("return navigator.userAgent;")
+            except Exception as e:
+                logging.debug(f"Could not read the browser user agent: {e}")
+        return HttpBackend(cookies, user_agent, pool_size=config.get("http_pool_size", 8),
+                           timeout=config.get("page_load_timeout_seconds") or 30)
+    if name == "replay":
+        return ReplayBackend(archive if archive is not None else {})
+    raise ValueError(f"Unknown fetch backend '{name}'")
@@ -0,0 +1,88 @@
+import threading
+import logging
+from typing import Callable, Dict, List, Optional
+
+from utils.lazy_import import lazy_import
+from scraper.rate_limiter import RateLimiter
+from scraper.session_cache import SessionCache
+
+requests = lazy_import('requests')
+
+
+class SessionHeartbeat:
+    """Background keep-alive that stops the authenticated portal session from idling out
+
+    Pings are plain HTTP requests carrying a snapshot of the browser
+    cookies, so the WebDriver is never touched from the heartbeat thread.
+    A ping is only sent after ``interval`` seconds without portal
+    traffic (a long PDF download counts from its start). It normally
+    waits for a free rate limiter slot, but goes out anyway when one
+    stalled page request has held the slot for the whole interval.
+    """
+
+    def __init__(self, url: str, rate_limiter: RateLimiter, interval: float = 240,
+                 session_active: Optional[threading.Event] = None,
+                 on_ping: Optional[Callable[[bool], None]] = None):
+        self.url = url
+        self.rate_limiter = rate_limiter
+        self.interval = interval
+        self.session_active = session_active
+        self.on_ping = on_ping
+        self.pings_sent = 0
+        self._session = requests.Session()
+        self._cookies_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def update_cookies(self, cookies: List[Dict]):
+        """Replace the cookie snapshot, e.g. after a (re-)authentication"""
+        with self._cookies_lock:
+            self._session.cookies.clear()
+            SessionCache.apply_to_requests(self._session, cookies)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="session-heartbeat", daemon=True)
+        self._thread.start()
+        logging.info(f"[HEARTBEAT] Keep-alive started (every {self.interval:.0f}s of idle time)")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+            logging.info(f"[HEARTBEAT] Keep-alive stopped after {self.pings_sent} pings")
+
+    def _run(self):
+        check_period = max(1.0, min(self.interval / 4, 15.0))
+        while not self._stop.wait(check_period):
+            # Paused while the pipeline re-authenticates
+            if self.session_active is not None and not self.session_active.is_set():
+                continue
+            if self.rate_limiter.idle_for() < self.interval:
+                continue
+            acquired = self.rate_limiter.try_acquire()
+            try:
+                self.ping()
+            finally:
+                if acquired:
+                    self.rate_limiter.release()
+                else:
+                    self.rate_limiter.touch()
+
+    def ping(self) -> bool:
+        """Send one keep-alive request"""
+        try:
+            with self._cookies_lock:
+                response = self._session.get(self.url, timeout=15)
+            ok = response.status_code < 400
+            self.pings_sent += 1
+            logging.debug(f"[HEARTBEAT] Keep-alive ping -> HTTP {response.status_code}")
+        except Exception as e:
+            logging.warning(f"[HEARTBEAT] Keep-alive ping failed: {e}")
+            ok = False
+        if self.on_ping:
+            self.on_ping(ok)
+        return ok
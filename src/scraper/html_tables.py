@@ -0,0 +1,112 @@
+import re
+from html.parser import HTMLParser
+from typing import Iterable, List
+
+_WHITESPACE = re.compile(r'\s+')
+# Content of these elements is never visible text
+_SKIPPED_TAGS = {'script', 'style', 'noscript', 'head', 'title'}
+# Elements that start on a new line, so their text never runs into a neighbour's
+_BLOCK_TAGS = {'td', 'th', 'tr', 'table', 'div', 'p', 'li'}
+
+
+class _TableParser(HTMLParser):
+    """Collect the text of every table cell, table by table and row by row"""
+
+    def __init__(self, cell_tags):
+        super().__init__(convert_charrefs=True)
+        self.cell_tags = set(cell_tags)
+        self.tables = []
+        self._open_tables = []
+        self._open_cells = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self.handle_data(' ')
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == 'table':
+            table = []
+            self.tables.append(table)
+            self._open_tables.append(table)
+        elif tag == 'tr' and self._open_tables:
+            self._open_tables[-1].append([])
+        elif tag in ('td', 'th') and self._open_tables:
+            table = self._open_tables[-1]
+            if not table:
+                table.append([])
+            cell = []
+            self._open_cells.append(cell)
+            if tag in self.cell_tags:
+                table[-1].append(cell)
+        elif tag == 'br':
+            self.handle_data(' ')
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'table' and self._open_tables:
+            self._open_tables.pop()
+        elif tag in ('td', 'th') and self._open_cells:
+            self._open_cells.pop()
+        if tag in _BLOCK_TAGS:
+            self.handle_data(' ')
+
+    def handle_data(self, data):
+        # A nested table's text also belongs to the outer cell, as in element.text
+        if not self._skip_depth:
+            for cell in self._open_cells:
+                cell.append(data)
+
+
+def parse_tables(html: str, cell_tags: Iterable[str] = ('td',)) -> List[List[List[str]]]:
+    """Parse every <table> in a page into rows of cell text
+
+    Works on saved page source without a browser; cell text is
+    whitespace-collapsed like WebDriver's ``element.text``. Only
+    ``cell_tags`` cells are kept (data cells by default, matching
+    ``find_elements(By.TAG_NAME, "td")``).
+    """
+    parser = _TableParser(cell_tags)
+    parser.feed(html or '')
+    parser.close()
+    return [
+        [[_WHITESPACE.sub(' ', ''.join(cell)).strip() for cell in row] for row in table]
+        for table in parser.tables
+    ]
+
+
+# Same shape as parse_tables, read from the live page in one WebDriver call.
+# arguments[0]: optional XPath selecting the tables (default: every table)
+TABLES_SCRIPT = """
+var xpath = arguments[0];
+var tables = [];
+if (xpath) {
+    var found = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < found.snapshotLength; i++) { tables.push(found.snapshotItem(i)); }
+} else {
+    tables = Array.prototype.slice.call(document.getElementsByTagName('table'));
+}
+return tables.map(function (table) {
+    return Array.prototype.map.call(table.rows || [], function (row) {
+        return Array.prototype.filter.call(row.cells, function (cell) {
+            return cell.tagName === 'TD';
+        }).map(function (cell) {
+            return (cell.innerText || '').replace(/\\s+/g, ' ').trim();
+        });
+    });
+});
+"""
+
+
+def cell_pairs(tables: List[List[List[str]]], distinct: bool = False) -> List[str]:
+    """"col1: col2" for every row whose first two cells are filled in
+
+    With ``distinct`` rows repeating the same text in both cells are skipped.
+    """
+    pairs = []
+    for table in tables:
+        for cells in table:
+            if len(cells) >= 2 and cells[0] and cells[1] and not (distinct and cells[0] == cells[1]):
+                pairs.append(f"{cells[0]}: {cells[1]}")
+    return pairs
@@ -0,0 +1,115 @@
+import base64
+import json
+import logging
+from typing import Dict, Optional
+
+# Enables the DevTools performance log on Chromium drivers
+LOGGING_PREFS = {'performance': 'ALL'}
+
+# Fetches a URL from inside the page (browser cookies, no second session)
+FETCH_SCRIPT = """
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'include'}).then(function (response) {
+    if (!response.ok) { throw new Error('HTTP ' + response.status); }
+    return response.blob();
+}).then(function (blob) {
+    var reader = new FileReader();
+    reader.onload = function () { done({data: reader.result.split(',')[1] || ''}); };
+    reader.onerror = function () { done({error: 'read failed'}); };
+    reader.readAsDataURL(blob);
+}).catch(function (error) { done({error: String(error)}); });
+"""
+
+
+def is_pdf_response(response: Dict) -> bool:
+    """Whether a DevTools Network.Response describes a PDF"""
+    mime_type = (response.get('mimeType') or '').lower()
+    headers = {k.lower(): str(v).lower() for k, v in (response.get('headers') or {}).items()}
+    return mime_type == 'application/pdf' or \
+        '.pdf' in headers.get('content-disposition', '') or \
+        response.get('url', '').lower().split('?')[0].endswith('.pdf')
+
+
+class NetworkCapture:
+    """Save PDF responses straight from the browser instead of downloading them again
+
+    On Chromium browsers started with the performance log enabled,
+    PDF responses the browser has already received are read back with
+    DevTools ``Network.getResponseBody``. Other documents are fetched
+    from inside the page, so the browser's own cookies are used and
+    there is no second session to keep in sync.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        # Response URL -> DevTools request id of the latest PDF response
+        self.pdf_requests: Dict[str, str] = {}
+        self.devtools = hasattr(driver, 'execute_cdp_cmd') and hasattr(driver, 'get_log')
+        if self.devtools:
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+            except Exception as e:
+                logging.debug(f"[CAPTURE] DevTools network domain unavailable: {e}")
+                self.devtools = False
+
+    def poll(self) -> int:
+        """Drain the performance log, remembering PDF responses; returns how many were seen"""
+        if not self.devtools:
+            return 0
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logging.debug(f"[CAPTURE] Performance log unavailable: {e}")
+            self.devtools = False
+            return 0
+        seen = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            if message.get('method') != 'Network.responseReceived':
+                continue
+            params = message.get('params', {})
+            response = params.get('response', {})
+            if is_pdf_response(response):
+                self.pdf_requests[response.get('url', '')] = params.get('requestId')
+                seen += 1
+        return seen
+
+    def captured_body(self, url: str) -> Optional[bytes]:
+        """Body of a PDF response the browser already received for url, if still buffered"""
+        self.poll()
+        request_id = self.pdf_requests.get(url) or self.pdf_requests.get(url.split('#')[0])
+        if not request_id:
+            return None
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            # The browser drops bodies of old responses from its buffer
+            logging.debug(f"[CAPTURE] Response body of {url} no longer available: {e}")
+            self.pdf_requests.pop(url, None)
+            return None
+        body = result.get('body', '')
+        return base64.b64decode(body) if result.get('base64Encoded') else body.encode('latin-1')
+
+    def fetch_in_browser(self, url: str) -> Optional[bytes]:
+        """Fetch url from inside the current page with the browser's cookies"""
+        try:
+            result = self.driver.execute_async_script(FETCH_SCRIPT, url) or {}
+        except Exception as e:
+            logging.debug(f"[CAPTURE] In-browser fetch of {url} failed: {e}")
+            return None
+        if 'data' not in result:
+            logging.debug(f"[CAPTURE] In-browser fetch of {url} failed: {result.get('error')}")
+            return None
+        return base64.b64decode(result['data'])
+
+    def get_pdf(self, url: str) -> Optional[bytes]:
+        """PDF bytes from the browser, or None if it does not have (or cannot fetch) a PDF"""
+        for source, read in (('network log', self.captured_body), ('page fetch', self.fetch_in_browser)):
+            data = read(url)
+            if data and data.startswith(b'%PDF'):
+                logging.info(f"[CAPTURE] Took {len(data)} bytes of {url} from the browser ({source})")
+                return data
+        return None
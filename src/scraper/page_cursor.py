@@ -0,0 +1,60 @@
+import json
+import os
+import threading
+import time
+import logging
+from typing import Dict, Optional
+
+
+class PageCursor:
+    """Remember the listing page each search reached so a later run can resume there
+
+    Keyed like the session cache (portal, status and partition), so
+    parallel partitions each resume at their own page.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, path: str = "page_cursor.json"):
+        self.path = path
+
+    def _read(self) -> Dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning(f"Could not read page cursor {self.path}: {e}")
+            return {}
+
+    def _write(self, entries: Dict):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def load(self, key: str) -> Optional[int]:
+        """Return the page to resume at, if one was recorded"""
+        with self._lock:
+            entry = self._read().get(key)
+        return entry['page'] if entry else None
+
+    def save(self, key: str, page: int):
+        with self._lock:
+            entries = self._read()
+            entries[key] = {'page': page, 'updated_at': time.time()}
+            try:
+                self._write(entries)
+            except Exception as e:
+                logging.warning(f"Could not save page cursor: {e}")
+
+    def clear(self, key: str):
+        """Forget the cursor of a search that reached the end of its listing"""
+        with self._lock:
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                try:
+                    self._write(entries)
+                except Exception as e:
+                    logging.warning(f"Could not update page cursor: {e}")
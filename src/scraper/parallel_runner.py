@@ -0,0 +1,88 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from scraper.rate_limiter import RateLimiter, SessionRateLimiter
+from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+from utils.tender_store import TenderStore
+
+
+def scrape_portal(portal: Dict, config_file: str, max_records: int, captcha_method: str,
+                  store: TenderStore, status: str = "AOC", overrides: Optional[Dict] = None,
+                  on_record: Optional[Callable] = None, partition: Optional[Dict] = None,
+                  rate_limiter: Optional[RateLimiter] = None) -> int:
+    """Scrape one portal, status and partition with its own browser and session
+
+    Pass the portal's ``rate_limiter`` when other jobs scrape the same
+    portal, so their requests are paced together.
+
+    Returns the number of records written to the store; tenders the store
+    already holds at a later status are not counted.
+    """
+    scraper = OdishaTenderScraperEnhanced(config_file, max_records)
+    if overrides:
+        scraper.config.update(overrides)
+    scraper.use_portal(portal)
+    if rate_limiter:
+        scraper.rate_limiter = SessionRateLimiter(rate_limiter)
+    scraper.tender_status = status
+    scraper.search_filters = partition or {}
+
+    written = 0
+    handled = set()
+
+    def record_enriched(record):
+        nonlocal written
+        # Store as we go so a failure late in the run keeps earlier tenders
+        written += store.upsert([record])
+        handled.add(record['Tender ID'])
+        if on_record:
+            on_record(record)
+
+    scraper.on_record_enriched = record_enriched
+    records = scraper.scrape_records(captcha_method)
+    # Tenders left with listing data only never reach the callback
+    missed = [record for record in records if record['Tender ID'] not in handled]
+    written += store.upsert(missed, keep_existing=True)
+    return written
+
+
+def run_portals(portals: List[Dict], config_file: str = "scraper_config.json", max_records: int = 25,
+                captcha_method: str = 'manual', store: Optional[TenderStore] = None,
+                max_workers: int = 4, overrides: Optional[Dict] = None,
+                on_record: Optional[Callable] = None,
+                statuses: Optional[List[str]] = None,
+                partitions: Optional[List[Dict]] = None) -> Dict[str, int]:
+    """Scrape every (portal, status, partition) job concurrently into one store
+
+    Every job gets its own scraper (browser and session cache entry), so
+    a slow or failing portal never holds up the others. Jobs on the same
+    portal share one rate limiter, so adding statuses or partitions does
+    not multiply the request rate a portal sees. The store dedupes by portal and Tender ID and merges tenders
+    seen under several statuses. Returns the number of records stored
+    per job name, with -1 for jobs that raised.
+    """
+    store = store or TenderStore()
+    statuses = statuses or ["AOC"]
+    jobs = [(portal, status, partition) for portal in portals for status in statuses
+            for partition in (partitions or [None])]
+    # Per-portal pacing; the delay is set from the portal's config when the jobs start
+    limiters = {portal['base_url']: RateLimiter() for portal in portals}
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+        futures = {
+            executor.submit(scrape_portal, portal, config_file, max_records, captcha_method,
+                            store, status, overrides, on_record, partition, limiters[portal['base_url']]):
+                " / ".join([portal.get('name') or portal['base_url'], status] +
+                           ([partition.get('label', '')] if partition else []))
+            for portal, status, partition in jobs
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+                logging.info(f"[PORTAL] {name}: {results[name]} records stored")
+            except Exception as e:
+                results[name] = -1
+                logging.error(f"[PORTAL] {name} failed: {e}")
+    return results
@@ -0,0 +1,69 @@
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+# Date format used by the GePNIC search form date pickers
+PORTAL_DATE_FORMAT = "%d/%m/%Y"
+
+
+def parse_date(value: str) -> date:
+    """Accept ISO (2024-01-31) or portal style (31/01/2024) dates"""
+    for fmt in ("%Y-%m-%d", PORTAL_DATE_FORMAT):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised date '{value}', use YYYY-MM-DD or DD/MM/YYYY")
+
+
+def date_windows(start: date, end: date, window_days: int = 30) -> List[Dict]:
+    """Split [start, end] into consecutive non-overlapping date-filter partitions"""
+    if window_days < 1:
+        raise ValueError("window_days must be at least 1")
+    partitions = []
+    window_start = start
+    while window_start <= end:
+        window_end = min(window_start + timedelta(days=window_days - 1), end)
+        partitions.append({
+            "label": f"{window_start.isoformat()}..{window_end.isoformat()}",
+            "from_date": window_start.strftime(PORTAL_DATE_FORMAT),
+            "to_date": window_end.strftime(PORTAL_DATE_FORMAT)
+        })
+        window_start = window_end + timedelta(days=1)
+    return partitions
+
+
+def organisation_partitions(organisations: List[str], base: Optional[Dict] = None) -> List[Dict]:
+    """One partition per organisation, optionally combined with a date window"""
+    partitions = []
+    for organisation in organisations:
+        partition = dict(base or {})
+        partition["organisation"] = organisation
+        partition["label"] = f"{base['label']}|{organisation}" if base and base.get("label") else organisation
+        partitions.append(partition)
+    return partitions
+
+
+def discover_organisations(scraper) -> List[str]:
+    """Read the organisation list from the portal's search form"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import Select
+
+    field = scraper.config["search_filter_fields"]["organisation"]
+    try:
+        if not scraper.setup_driver():
+            return []
+        scraper.driver.get(scraper.target_url)
+        dropdown = scraper.wait_for_element(By.NAME, field)
+        if not dropdown:
+            return []
+        organisations = [option.text.strip() for option in Select(dropdown).options
+                         if option.get_attribute('value') and option.text.strip()
+                         and not option.text.strip().lower().startswith('--')]
+        logging.info(f"[PARTITION] Found {len(organisations)} organisations on {scraper.base_url}")
+        return organisations
+    except Exception as e:
+        logging.error(f"Could not read organisation list: {e}")
+        return []
+    finally:
+        scraper.close_driver()
@@ -0,0 +1,103 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class RateLimiter:
+    """Minimum pause between portal requests, shared by everything using one session
+
+    Every page request is wrapped in the blocking ``request()`` context
+    manager, held only while the request is in flight so parsing and
+    downloads overlap with other sessions' requests; background tasks
+    such as the keep-alive heartbeat use ``try_acquire()`` so they only
+    run in the gaps and never delay a real request.
+
+    Traffic that is not paced (PDF downloads) is recorded with
+    ``touch()``, so the idle time seen by the heartbeat covers it too.
+    """
+
+    def __init__(self, min_interval: float = 2.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last_finished = 0.0
+        self._last_activity = 0.0
+
+    @contextmanager
+    def request(self):
+        """Wait for a free slot, then hold it for the duration of the request"""
+        self._lock.acquire()
+        try:
+            delay = self._last_finished + self.min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.touch()
+            yield
+        finally:
+            self.release()
+
+    def try_acquire(self) -> bool:
+        """Take the slot only if no request is running and the pause has elapsed"""
+        if not self._lock.acquire(blocking=False):
+            return False
+        if time.monotonic() - self._last_finished < self.min_interval:
+            self._lock.release()
+            return False
+        return True
+
+    def release(self):
+        """Finish the current request and start the pause before the next one"""
+        self._last_finished = self._last_activity = time.monotonic()
+        self._lock.release()
+
+    def touch(self):
+        """Record a request sent to the portal"""
+        self._last_activity = time.monotonic()
+
+    def idle_for(self) -> float:
+        """Seconds since the portal last saw a request, whether or not the slot is held"""
+        return time.monotonic() - self._last_activity
+
+
+class SessionRateLimiter:
+    """One portal session's view of a shared RateLimiter
+
+    Several sessions on the same portal (one per status or partition)
+    share the portal's request slot and pause, but each tracks its own
+    traffic, so its heartbeat still notices when that session goes idle.
+    """
+
+    def __init__(self, portal: RateLimiter):
+        self.portal = portal
+        self._last_activity = 0.0
+
+    @property
+    def min_interval(self) -> float:
+        return self.portal.min_interval
+
+    @min_interval.setter
+    def min_interval(self, value: float):
+        self.portal.min_interval = value
+
+    @contextmanager
+    def request(self):
+        with self.portal.request():
+            self.touch()
+            try:
+                yield
+            finally:
+                self.touch()
+
+    def try_acquire(self) -> bool:
+        return self.portal.try_acquire()
+
+    def release(self):
+        self.touch()
+        self.portal.release()
+
+    def touch(self):
+        self._last_activity = time.monotonic()
+        self.portal.touch()
+
+    def idle_for(self) -> float:
+        """Seconds since this session last sent a request"""
+        return time.monotonic() - self._last_activity
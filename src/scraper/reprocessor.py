@@ -0,0 +1,84 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from scraper.fetch_backends import ReplayBackend
+from scraper.tender_record import TenderRecord
+from scraper.tender_scrapper import OdishaTenderScraperEnhanced
+from utils.page_archive import PageArchive
+from utils.tender_store import TenderStore
+
+# Files are not downloaded again offline, so the stored names are kept
+KEPT_COLUMNS = ('AOC_PDF_File', 'PDF_Details')
+
+
+def replay_scraper(config_file: str, archive: PageArchive) -> OdishaTenderScraperEnhanced:
+    """Scraper whose extractors read archived pages instead of the portal"""
+    scraper = OdishaTenderScraperEnhanced(config_file)
+    scraper.fetch_backend = ReplayBackend(archive)
+    return scraper
+
+
+def archived_records(archive: PageArchive, config_file: str,
+                     portal: Optional[str] = None) -> Dict[Tuple[str, str], TenderRecord]:
+    """Parse every archived listing page again; the latest row per (portal, Tender ID) wins"""
+    scraper = replay_scraper(config_file, archive)
+    records = {}
+    for page in archive.pages(kind='listing', portal=portal):
+        scraper.portal_name = page['portal']
+        scraper.tender_status = page['status']
+        scraper.fetch_backend.load(archive.read(page['id']), page['url'])
+        for record in scraper.extract_current_page_data():
+            records[(record['Portal'], record['Tender ID'])] = record
+    return records
+
+
+def reprocess_records(records: List[TenderRecord], archive: PageArchive, store: TenderStore,
+                      config_file: str) -> int:
+    """Rerun the detail extractors for some tenders and store the results"""
+    scraper = replay_scraper(config_file, archive)
+    stored_count = 0
+    for record in records:
+        if archive.get(record['Status_Link'] or '') is None:
+            # Same tender, detail page recorded under another session's link
+            detail_pages = archive.pages(kind='detail', portal=record['Portal'], tender_id=record['Tender ID'])
+            if not detail_pages:
+                continue
+            record['Status_Link'] = detail_pages[-1]['url']
+        scraper.portal_name = record['Portal']
+        scraper.tender_status = record['Search_Status']
+        scraper.extract_aoc_details_enhanced(record)
+
+        stored = store.fetch("portal = ? AND tender_id = ?", (record['Portal'], record['Tender ID']))
+        for column in KEPT_COLUMNS:
+            record[column] = stored[0][column] if stored else None
+        store.upsert([record])
+        stored_count += 1
+    return stored_count
+
+
+def reprocess_archive(archive: PageArchive, store: TenderStore, config_file: str = "scraper_config.json",
+                      max_workers: int = 4, portal: Optional[str] = None) -> int:
+    """Rebuild the store from the page archive with the current extractors, without network access
+
+    Listing pages are parsed first, then the tenders' detail pages are
+    re-extracted by ``max_workers`` replay scrapers in parallel. Returns
+    the number of tenders rewritten.
+    """
+    records = list(archived_records(archive, config_file, portal).values())
+    logging.info(f"[REPROCESS] {len(records)} tenders in {archive.count()} archived pages")
+    if not records:
+        return 0
+
+    workers = max(1, min(max_workers, len(records)))
+    chunks = [records[i::workers] for i in range(workers)]
+    total = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(reprocess_records, chunk, archive, store, config_file) for chunk in chunks]
+        for future in as_completed(futures):
+            try:
+                total += future.result()
+            except Exception as e:
+                logging.error(f"[REPROCESS] Worker failed: {e}")
+    logging.info(f"[REPROCESS] Rewrote {total} tenders from the archive")
+    return total
@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+import time
+import logging
+from typing import Dict, List, Optional
+
+# Cookie fields accepted by WebDriver's add_cookie
+DRIVER_COOKIE_FIELDS = ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry', 'sameSite')
+
+
+class SessionCache:
+    """Persist the post-captcha portal cookies so later runs can skip the captcha
+
+    Entries are keyed by ``base_url#status`` plus ``#label`` for a
+    partitioned search (the scraper's ``session_key``), so several portals,
+    statuses and partitions can share one cache file. An entry
+    expires at the earliest cookie expiry or after ``max_age_minutes``
+    without use, whichever comes first.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, path: str = "session_cache.json", max_age_minutes: float = 20):
+        self.path = path
+        self.max_age_seconds = max_age_minutes * 60
+
+    def _read(self) -> Dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning(f"Could not read session cache {self.path}: {e}")
+            return {}
+
+    def _write(self, entries: Dict):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def _expires_at(self, entry: Dict) -> float:
+        expires_at = entry.get('last_used', 0) + self.max_age_seconds
+        cookie_expiries = [c['expiry'] for c in entry.get('cookies', []) if c.get('expiry')]
+        if cookie_expiries:
+            expires_at = min(expires_at, min(cookie_expiries))
+        return expires_at
+
+    def save(self, base_url: str, cookies: List[Dict], results_url: Optional[str] = None):
+        """Store the cookies of a session that just passed the captcha"""
+        now = time.time()
+        with self._lock:
+            entries = self._read()
+            entries[base_url] = {
+                'cookies': cookies,
+                'results_url': results_url,
+                'saved_at': now,
+                'last_used': now
+            }
+            try:
+                self._write(entries)
+                logging.info(f"[SESSION] Saved {len(cookies)} session cookies for {base_url}")
+            except Exception as e:
+                logging.warning(f"Could not save session cache: {e}")
+
+    def load(self, base_url: str) -> Optional[Dict]:
+        """Return the cached entry for a portal if it has not expired"""
+        with self._lock:
+            entry = self._read().get(base_url)
+        if not entry or not entry.get('cookies'):
+            return None
+        remaining = self._expires_at(entry) - time.time()
+        if remaining <= 0:
+            logging.info(f"[SESSION] Saved session for {base_url} has expired")
+            self.invalidate(base_url)
+            return None
+        logging.info(f"[SESSION] Saved session for {base_url} valid for another {remaining / 60:.1f} minutes")
+        return entry
+
+    def touch(self, base_url: str):
+        """Record that the portal accepted the session, extending its idle expiry"""
+        with self._lock:
+            entries = self._read()
+            if base_url in entries:
+                entries[base_url]['last_used'] = time.time()
+                try:
+                    self._write(entries)
+                except Exception as e:
+                    logging.debug(f"Could not update session cache: {e}")
+
+    def invalidate(self, base_url: str):
+        """Drop a session the portal no longer accepts"""
+        with self._lock:
+            entries = self._read()
+            if entries.pop(base_url, None) is not None:
+                try:
+                    self._write(entries)
+                    logging.info(f"[SESSION] Invalidated saved session for {base_url}")
+                except Exception as e:
+                    logging.debug(f"Could not update session cache: {e}")
+
+    @staticmethod
+    def apply_to_driver(driver, cookies: List[Dict]) -> int:
+        """Load cookies into a driver that is already on the portal domain"""
+        loaded = 0
+        for cookie in cookies:
+            try:
+                driver.add_cookie({k: v for k, v in cookie.items() if k in DRIVER_COOKIE_FIELDS})
+                loaded += 1
+            except Exception as e:
+                logging.debug(f"Could not load cookie {cookie.get('name')}: {e}")
+        return loaded
+
+    @staticmethod
+    def apply_to_requests(session, cookies: List[Dict]):
+        """Load cookies into a requests session"""
+        for cookie in cookies:
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
@@ -0,0 +1,88 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+EMPTY = '<empty>'
+
+# Legacy column name -> record attribute, in export order
+COLUMNS = {
+    'Portal': 'portal',
+    'S.No': 's_no',
+    'Tender ID': 'tender_id',
+    'Title and Ref.No.': 'title',
+    'Organisation Chain': 'organisation',
+    'Tender Stage': 'tender_stage',
+    'Search_Status': 'search_status',
+    'Status': 'status',
+    'Status_Link': 'status_link',
+    'AOC_PDF_Link': 'aoc_pdf_link',
+    'AOC_PDF_File': 'aoc_pdf_file',
+    'Stage_Summary_Data': 'stage_summary',
+    'Contract_Value': 'contract_value',
+    'Contractor_Name': 'contractor_name',
+    'Email': 'email',
+    'Mobile': 'mobile',
+    'GST_Number': 'gst_number',
+    'PDF_Details': 'pdf_details',
+    'Contract_Value_INR': 'contract_value_inr',
+    'Contract_Value_Confidence': 'contract_value_confidence',
+}
+
+# Columns added after the '<empty>' convention; they stay None when missing
+UNFILLED_COLUMNS = ('Contract_Value_INR', 'Contract_Value_Confidence')
+
+
+class TenderRecord:
+    """Compact tender row - missing values are None instead of '<empty>'
+
+    Supports the legacy column-name access (``record['Tender ID']``,
+    ``record.get('Email', '')``) so extractors written against the old
+    dict rows keep working.
+    """
+
+    __slots__ = tuple(COLUMNS.values())
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def __getitem__(self, column: str) -> Any:
+        return getattr(self, COLUMNS[column])
+
+    def __setitem__(self, column: str, value: Any):
+        setattr(self, COLUMNS[column], value)
+
+    def __contains__(self, column: str) -> bool:
+        return column in COLUMNS
+
+    def __repr__(self) -> str:
+        return f"TenderRecord(tender_id={self.tender_id!r}, status={self.status!r})"
+
+    def get(self, column: str, default: Any = None) -> Any:
+        """Column lookup that treats missing values like absent keys"""
+        attribute = COLUMNS.get(column)
+        value = getattr(self, attribute) if attribute else None
+        return default if value is None else value
+
+    def to_dict(self, empty: Optional[str] = EMPTY) -> Dict[str, Any]:
+        """Convert to the legacy column dict, filling missing values with ``empty``"""
+        result = {}
+        for column, attribute in COLUMNS.items():
+            value = getattr(self, attribute)
+            if value is None and column not in UNFILLED_COLUMNS:
+                value = empty
+            result[column] = value
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TenderRecord':
+        """Build a record from a legacy column dict, mapping '<empty>' to None"""
+        fields = {}
+        for column, attribute in COLUMNS.items():
+            value = data.get(column)
+            fields[attribute] = None if value == EMPTY else value
+        return cls(**fields)
+
+
+def records_to_dicts(records: Iterable[Any], empty: Optional[str] = EMPTY) -> List[Dict[str, Any]]:
+    """Convert records (or already-legacy dicts) for the dict based exporters"""
+    return [record.to_dict(empty) if isinstance(record, TenderRecord) else record
+            for record in records]
@@ -1,30 +1,56 @@
-import requests
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
 import time
 import os
-from urllib.parse import urljoin
-import tkinter as tk
-from tkinter import messagebox, simpledialog
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
+import re
 from datetime import datetime
 import logging
 import json
-from typing import List, Dict, Optional
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from typing import Iterable, List, Dict, Optional, Tuple
 import sys
 
+# Make the sibling packages under src/ importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.lazy_import import lazy_import, lazy_from
+
+# Heavy dependencies load on first use, so --help and GUI startup stay fast
+requests = lazy_import('requests')
+pd = lazy_import('pandas')
+webdriver = lazy_import('selenium.webdriver')
+By = lazy_from('selenium.webdriver.common.by', 'By')
+WebDriverWait = lazy_from('selenium.webdriver.support.ui', 'WebDriverWait')
+EC = lazy_import('selenium.webdriver.support.expected_conditions')
+Select = lazy_from('selenium.webdriver.support.ui', 'Select')
+ChromeOptions = lazy_from('selenium.webdriver.chrome.options', 'Options')
+FirefoxOptions = lazy_from('selenium.webdriver.firefox.options', 'Options')
+EdgeOptions = lazy_from('selenium.webdriver.edge.options', 'Options')
+ChromeDriverManager = lazy_from('webdriver_manager.chrome', 'ChromeDriverManager')
+GeckoDriverManager = lazy_from('webdriver_manager.firefox', 'GeckoDriverManager')
+EdgeChromiumDriverManager = lazy_from('webdriver_manager.microsoft', 'EdgeChromiumDriverManager')
+ChromeService = lazy_from('selenium.webdriver.chrome.service', 'Service')
+FirefoxService = lazy_from('selenium.webdriver.firefox.service', 'Service')
+EdgeService = lazy_from('selenium.webdriver.edge.service', 'Service')
+tk = lazy_import('tkinter')
+messagebox = lazy_import('tkinter.messagebox')
+simpledialog = lazy_import('tkinter.simpledialog')
+
+from utils.contract_value import apply_contract_value_normalization, VALUE_COLUMN, CONFIDENCE_COLUMN
+from scraper.tender_record import TenderRecord, records_to_dicts
+from scraper.session_cache import SessionCache
+from scraper.captcha_solver import get_captcha_solver
+from scraper.rate_limiter import RateLimiter
+from scraper.heartbeat import SessionHeartbeat
+from scraper.page_cursor import PageCursor
+from scraper.driver_cache import DriverCache, installed_browser_version, major_version
+from scraper.browser_watchdog import BrowserWatchdog, kill_process_tree
+from scraper.html_tables import cell_pairs, parse_tables
+from scraper.network_capture import NetworkCapture, LOGGING_PREFS
+from scraper.fetch_backends import FetchBackend, FetchTimeoutError, HttpBackend, SeleniumBackend, create_fetch_backend
+from utils.page_archive import open_archive
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +61,17 @@ logging.basicConfig(
     ]
 )
 
+# Serializes human captcha prompts when several portals run side by side
+CAPTCHA_PROMPT_LOCK = threading.Lock()
+
+class SessionExpiredError(Exception):
+    """Raised when the portal answers with its session-expired page"""
+    pass
+
+class PageLoadTimeoutError(Exception):
+    """Raised when a page load or a tender's detail extraction runs past its deadline"""
+    pass
+
 class CaptchaHandler:
     """Bulletproof captcha handler - guaranteed to work"""
     
@@ -150,6 +187,8 @@ class OdishaTenderScraperEnhanced:
     def __init__(self, config_file: str = "scraper_config.json", max_records: int = 100):
         """Initialize with max records parameter"""
         self.driver = None
+        # Custom browser executable (Brave) used by the Chrome driver, if any
+        self.browser_binary = None
         self.max_records = max_records
         self.current_record_count = 0
         self.load_config(config_file)
@@ -157,10 +196,40 @@ class OdishaTenderScraperEnhanced:
         # GUI integration callbacks
         self.gui_show_captcha_button = None
         self.gui_captcha_event = None
+        # Called with each tender as soon as its details are extracted
+        self.on_record_enriched = None
+        # Offline captcha solver, created on first use
+        self.captcha_solver = None
+        self._captcha_solver_loaded = False
+        self._pending_captcha_fixture = None
+        # Search method used for this run, reused to re-authenticate after session expiry
+        self.active_search = None
+        # Cleared while the pipeline is paused for re-authentication
+        self.session_active = threading.Event()
+        self.session_active.set()
+        self.failed_tenders = []
+        # Spaces portal requests; the keep-alive heartbeat only uses the gaps
+        self.rate_limiter = RateLimiter(self.config["delay_between_requests"])
+        self.heartbeat = None
+        # Optional DriverPool shared across runs (the GUI keeps browsers warm)
+        self.driver_pool = None
+        # Latest cookies of the captcha-solved session, to move it into a replacement browser
+        self.session_cookies = []
+        # requests session for pages fetched outside the browser (stage summary details)
+        self.http_session = None
+        # Reads PDFs out of the browser when capture_pdfs_from_network is on
+        self.network_capture = None
+        # Non-browser backend for detail pages (HTTP, or replay from an archive), if any
+        self.fetch_backend = None
+        self.browser_page = None
+        self.watchdog = BrowserWatchdog(self.config["recycle_after_pages"], self.config["browser_max_rss_mb"],
+                                        self.config["page_load_slowdown_factor"],
+                                        self.config["watchdog_sample_every"])
         
     def load_config(self, config_file: str):
         """Load configuration from JSON file or use defaults"""
         default_config = {
+            "portal_name": "Odisha",
             "base_url": "https://tendersodisha.gov.in",
             "target_url": "https://tendersodisha.gov.in/nicgep/app?page=WebTenderStatusLists&service=page",
             "download_folder": "tender_downloads",
@@ -168,7 +237,63 @@ class OdishaTenderScraperEnhanced:
             "timeout_seconds": 15,
             "delay_between_requests": 2,
             "max_retries": 3,
-            "headless_mode": False
+            "headless_mode": False,
+            "reuse_session": True,
+            "session_cache_file": "session_cache.json",
+            "session_max_age_minutes": 20,
+            "captcha_solver": "none",
+            "captcha_solver_threshold": 0.8,
+            "captcha_fixture_dir": "fixtures/captcha",
+            "captcha_length": None,
+            "captcha_fixture_capture": False,
+            "stage_summary_fetch": "http",
+            "capture_pdfs_from_network": False,
+            "fetch_backend": "selenium",
+            "http_pool_size": 8,
+            "archive_pages": False,
+            "archive_dir": "page_archive",
+            "session_expired_markers": [
+                "session has expired", "session has timed out", "session timed out",
+                "session timeout", "session expired", "stale session", "invalid session"
+            ],
+            "keepalive_enabled": True,
+            "keepalive_interval_seconds": 240,
+            "keepalive_url": None,
+            "tender_statuses": ["AOC"],
+            "search_filter_fields": {
+                "date_criteria": "dateCriteria",
+                "from_date": "fromDate",
+                "to_date": "toDate",
+                "organisation": "organisationName"
+            },
+            "backfill_date_criteria": "Published Date",
+            "backfill_window_days": 30,
+            "backfill_max_records_per_window": 10000,
+            "cache_driver": True,
+            "driver_cache_file": "driver_cache.json",
+            "page_load_timeout_seconds": 60,
+            "script_timeout_seconds": 30,
+            "tender_deadline_seconds": 300,
+            "pdf_timeout_seconds": 60,
+            "page_load_retries": 1,
+            "recycle_after_pages": 300,
+            "browser_max_rss_mb": 1500,
+            "page_load_slowdown_factor": 3.0,
+            "watchdog_sample_every": 10,
+            "lean_browser": False,
+            "lean_blocked_url_patterns": [
+                "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+                "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico"
+            ],
+            "maximize_page_size": True,
+            "page_size_param": None,
+            "page_size": None,
+            "start_page": None,
+            "resume_pagination": False,
+            "page_cursor_file": "page_cursor.json",
+            "portals": [],
+            "max_parallel_sessions": 4,
+            "store_file": "tenders.db"
         }
         
         if os.path.exists(config_file):
@@ -186,10 +311,25 @@ class OdishaTenderScraperEnhanced:
             logging.info(f"Created default config file: {config_file}")
         
         self.config = default_config
+        self.portal_name = self.config["portal_name"]
+        # Status searched by this session; a multi-status run gives each session its own
+        self.tender_status = self.config["tender_statuses"][0]
+        # Search form filters for partitioned crawls (date window / organisation)
+        self.search_filters = {}
+        # Listing page currently shown, and whether the listing ran out of pages
+        self.current_page = 1
+        self.listing_exhausted = False
+        # Listing page each collected tender came from, by Tender ID
+        self.listing_pages = {}
+        # Browser time left for the current tender's navigation and script calls
+        self.browser_budget = None
         self.base_url = self.config["base_url"]
         self.target_url = self.config["target_url"]
         self.download_folder = self.config["download_folder"]
         self.excel_file = f"{self.config['excel_file_prefix']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        self.session_cache = SessionCache(self.config["session_cache_file"], self.config["session_max_age_minutes"])
+        self.page_cursor = PageCursor(self.config["page_cursor_file"])
+        self.driver_cache = DriverCache(self.config["driver_cache_file"])
         
     def setup_directories(self):
         """Create necessary directories"""
@@ -227,13 +367,14 @@ class OdishaTenderScraperEnhanced:
                 return path
         return None
 
-    def setup_chrome_driver(self):
+    def setup_chrome_driver(self, cached: Optional[Dict] = None):
         """Setup Chrome/Brave driver"""
         try:
             chrome_options = ChromeOptions()
             
             # Try to find and use Brave if available
-            brave_path = self.find_brave_executable()
+            brave_path = cached.get('binary_location') if cached else self.find_brave_executable()
+            self.browser_binary = brave_path
             if brave_path:
                 chrome_options.binary_location = brave_path
                 logging.info(f"Using Brave browser at: {brave_path}")
@@ -259,6 +400,18 @@ class OdishaTenderScraperEnhanced:
             if self.config["headless_mode"]:
                 chrome_options.add_argument("--headless")
             
+            if self.config.get("lean_browser"):
+                self.apply_lean_options(chrome_options)
+            
+            if self.config.get("capture_pdfs_from_network"):
+                chrome_options.set_capability("goog:loggingPrefs", LOGGING_PREFS)
+            
+            # A cached driver binary starts without any lookup
+            if cached:
+                service = ChromeService(cached['driver_path'])
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                return True
+            
             # Try to use system Chrome/Brave executable directly first
             try:
                 self.driver = webdriver.Chrome(options=chrome_options)
@@ -275,7 +428,7 @@ class OdishaTenderScraperEnhanced:
             logging.error(f"Failed to setup Chrome driver: {e}")
             return False
     
-    def setup_firefox_driver(self):
+    def setup_firefox_driver(self, cached: Optional[Dict] = None):
         """Setup Firefox driver"""
         try:
             firefox_options = FirefoxOptions()
@@ -288,8 +441,13 @@ class OdishaTenderScraperEnhanced:
             
             if self.config["headless_mode"]:
                 firefox_options.add_argument("--headless")
+            
+            if self.config.get("lean_browser"):
+                # No DevTools URL blocking in Firefox; skip web fonts and render before subresources
+                firefox_options.page_load_strategy = 'eager'
+                firefox_options.set_preference("browser.display.use_document_fonts", 0)
                 
-            service = FirefoxService(GeckoDriverManager().install())
+            service = FirefoxService(cached['driver_path'] if cached else GeckoDriverManager().install())
             self.driver = webdriver.Firefox(service=service, options=firefox_options)
             return True
             
@@ -297,7 +455,7 @@ class OdishaTenderScraperEnhanced:
             logging.error(f"Failed to setup Firefox driver: {e}")
             return False
     
-    def setup_edge_driver(self):
+    def setup_edge_driver(self, cached: Optional[Dict] = None):
         """Setup Edge driver"""
         try:
             edge_options = EdgeOptions()
@@ -320,7 +478,13 @@ class OdishaTenderScraperEnhanced:
             if self.config["headless_mode"]:
                 edge_options.add_argument("--headless")
             
-            service = EdgeService(EdgeChromiumDriverManager().install())
+            if self.config.get("lean_browser"):
+                self.apply_lean_options(edge_options)
+            
+            if self.config.get("capture_pdfs_from_network"):
+                edge_options.set_capability("ms:loggingPrefs", LOGGING_PREFS)
+            
+            service = EdgeService(cached['driver_path'] if cached else EdgeChromiumDriverManager().install())
             self.driver = webdriver.Edge(service=service, options=edge_options)
             return True
             
@@ -328,9 +492,169 @@ class OdishaTenderScraperEnhanced:
             logging.error(f"Failed to setup Edge driver: {e}")
             return False
 
+    def apply_lean_options(self, options):
+        """Lean Chromium profile: return from driver.get at DOMContentLoaded, no extensions"""
+        options.page_load_strategy = 'eager'
+        options.add_argument("--disable-extensions")
+    
+    def set_resource_blocking(self, enabled: bool) -> bool:
+        """Block stylesheets, fonts and images via DevTools (Chromium browsers only)
+
+        Left off while a captcha is shown, since the captcha is an image.
+        """
+        if not self.config.get("lean_browser") or not hasattr(self.driver, "execute_cdp_cmd"):
+            return False
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            patterns = self.config["lean_blocked_url_patterns"] if enabled else []
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            logging.info(f"[LEAN] Resource blocking {'enabled' if enabled else 'disabled'}")
+            return True
+        except Exception as e:
+            logging.warning(f"Could not change resource blocking: {e}")
+            return False
+    
     def setup_driver(self):
+        """Take a warm browser from the driver pool, or start one"""
+        if self.driver_pool:
+            self.driver = self.driver_pool.acquire()
+        elif not self.launch_driver():
+            return False
+        if self.driver is None:
+            return False
+        self.apply_timeouts()
+        return True
+    
+    def apply_timeouts(self):
+        """Bound page loads and async scripts so a stuck page raises instead of hanging"""
+        try:
+            self.driver.set_page_load_timeout(self.config["page_load_timeout_seconds"])
+            self.driver.set_script_timeout(self.config["script_timeout_seconds"])
+        except Exception as e:
+            logging.warning(f"Could not set browser timeouts: {e}")
+    
+    @contextmanager
+    def hard_deadline(self, seconds: float, what: str):
+        """Kill the browser if the block runs past ``seconds``; raises PageLoadTimeoutError
+
+        Selenium timeouts rely on a responsive driver; this also unblocks a
+        driver that stopped answering altogether.
+        """
+        driver = self.driver
+        expired = threading.Event()
+        
+        def expire():
+            expired.set()
+            logging.error(f"[DEADLINE] {what} exceeded {seconds}s, killing the browser")
+            try:
+                kill_process_tree(driver.service.process.pid)
+            except Exception as e:
+                logging.warning(f"[DEADLINE] Could not kill the browser: {e}")
+        
+        timer = threading.Timer(seconds, expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        except Exception as e:
+            if expired.is_set():
+                raise PageLoadTimeoutError(f"{what} exceeded {seconds}s") from e
+            raise
+        finally:
+            timer.cancel()
+        if expired.is_set():
+            raise PageLoadTimeoutError(f"{what} exceeded {seconds}s")
+    
+    @contextmanager
+    def browser_call(self, what: str):
+        """Hard deadline for one browser navigation or script call, drawn from the tender's browser_budget"""
+        if self.browser_budget is None:
+            yield
+            return
+        if self.browser_budget <= 0:
+            raise PageLoadTimeoutError(f"{what}: tender deadline already used up")
+        started = time.monotonic()
+        try:
+            with self.hard_deadline(self.browser_budget, what):
+                yield
+        finally:
+            self.browser_budget -= time.monotonic() - started
+    
+    def new_driver(self):
+        """Start a browser with this scraper's settings and return it (driver pool factory)"""
+        previous = self.driver
+        try:
+            return self.driver if self.launch_driver() else None
+        finally:
+            self.driver = previous
+    
+    def close_driver(self):
+        """Hand the browser back to the driver pool, or quit it"""
+        if not self.driver:
+            return
+        if self.driver_pool:
+            # The next run starts at a captcha, which is an image
+            self.set_resource_blocking(False)
+            self.driver_pool.release(self.driver)
+        else:
+            self.driver.quit()
+        self.driver = None
+    
+    def launch_cached_driver(self) -> bool:
+        """Start the browser/driver that worked last time, without probing or downloads"""
+        if not self.config.get("cache_driver", True):
+            return False
+        cached = self.driver_cache.load()
+        if not cached:
+            return False
+        # A browser update needs a driver of the new major version; check before starting the old one
+        installed = installed_browser_version(cached.get('browser'), cached.get('binary_location'))
+        if installed and major_version(installed) != major_version(cached.get('browser_version')):
+            logging.info(f"[DRIVER] Browser updated ({cached.get('browser_version')} -> {installed}), probing for a new driver")
+            self.driver_cache.invalidate()
+            return False
+        setup = {
+            "chrome": self.setup_chrome_driver,
+            "firefox": self.setup_firefox_driver,
+            "edge": self.setup_edge_driver
+        }.get(cached.get('browser'))
+        if setup and setup(cached=cached):
+            version = self.driver.capabilities.get('browserVersion')
+            if major_version(version) != major_version(cached.get('browser_version')):
+                # The installed version could not be read beforehand
+                logging.info(f"[DRIVER] Browser updated ({cached.get('browser_version')} -> {version}), probing for a new driver")
+                self.driver.quit()
+                self.driver = None
+                self.driver_cache.invalidate()
+                return False
+            if version != cached.get('browser_version'):
+                self.remember_driver(cached['browser'])
+            logging.info(f"[DRIVER] Started cached {cached['browser']} driver")
+            if not self.config["headless_mode"]:
+                self.driver.maximize_window()
+            return True
+        # Usually a browser update the cached driver does not support
+        logging.info("[DRIVER] Cached driver did not start, probing browsers again")
+        self.driver_cache.invalidate()
+        return False
+    
+    def remember_driver(self, browser: str):
+        """Cache the browser and driver binary that just started"""
+        if not self.config.get("cache_driver", True):
+            return
+        try:
+            driver_path = self.driver.service.path
+            self.driver_cache.save(browser, driver_path, self.driver.capabilities.get('browserVersion'),
+                                   self.browser_binary if browser == "chrome" else None)
+        except Exception as e:
+            logging.debug(f"Could not cache driver: {e}")
+    
+    def launch_driver(self):
         """Setup web driver with automatic browser detection"""
         try:
+            if self.launch_cached_driver():
+                return True
+            
             # Detect default browser
             default_browser = self.detect_default_browser()
             logging.info(f"Detected default browser: {default_browser}")
@@ -339,6 +663,7 @@ class OdishaTenderScraperEnhanced:
             if default_browser == "chrome":
                 if self.setup_chrome_driver():
                     logging.info("Chrome/Brave driver setup successfully")
+                    self.remember_driver("chrome")
                     if not self.config["headless_mode"]:
                         self.driver.maximize_window()
                     return True
@@ -346,6 +671,7 @@ class OdishaTenderScraperEnhanced:
             elif default_browser == "firefox":
                 if self.setup_firefox_driver():
                     logging.info("Firefox driver setup successfully")
+                    self.remember_driver("firefox")
                     if not self.config["headless_mode"]:
                         self.driver.maximize_window()
                     return True
@@ -353,6 +679,7 @@ class OdishaTenderScraperEnhanced:
             elif default_browser == "edge":
                 if self.setup_edge_driver():
                     logging.info("Edge driver setup successfully")
+                    self.remember_driver("edge")
                     if not self.config["headless_mode"]:
                         self.driver.maximize_window()
                     return True
@@ -363,6 +690,7 @@ class OdishaTenderScraperEnhanced:
             # Try Chrome first
             if self.setup_chrome_driver():
                 logging.info("Chrome driver setup successfully (fallback)")
+                self.remember_driver("chrome")
                 if not self.config["headless_mode"]:
                     self.driver.maximize_window()
                 return True
@@ -370,6 +698,7 @@ class OdishaTenderScraperEnhanced:
             # Try Edge second
             if self.setup_edge_driver():
                 logging.info("Edge driver setup successfully (fallback)")
+                self.remember_driver("edge")
                 if not self.config["headless_mode"]:
                     self.driver.maximize_window()
                 return True
@@ -377,6 +706,7 @@ class OdishaTenderScraperEnhanced:
             # Try Firefox last
             if self.setup_firefox_driver():
                 logging.info("Firefox driver setup successfully (fallback)")
+                self.remember_driver("firefox")
                 if not self.config["headless_mode"]:
                     self.driver.maximize_window()
                 return True
@@ -402,6 +732,238 @@ class OdishaTenderScraperEnhanced:
             logging.error(f"Element not found: {by}={value}, Error: {e}")
             return None
     
+    def has_results_table(self, timeout: int = 5) -> bool:
+        """Check for the tender listing table itself, not just any table on the form"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH,
+                    "//table[contains(@class, 'list-table')] | //table[.//th[contains(text(), 'Tender ID')]]"))
+            )
+            return True
+        except:
+            return False
+    
+    def click_search_button(self) -> bool:
+        """Find and click the search form's submit button"""
+        search_selectors = [
+            (By.XPATH, "//input[@value='Search']"),
+            (By.XPATH, "//button[contains(text(), 'Search')]"),
+            (By.XPATH, "//input[@type='submit'][contains(@value, 'Search')]"),
+            (By.ID, "searchButton"),
+            (By.NAME, "search")
+        ]
+        
+        for by, value in search_selectors:
+            try:
+                search_button = self.driver.find_element(by, value)
+                if search_button and search_button.is_displayed():
+                    self.driver.execute_script("arguments[0].click();", search_button)
+                    return True
+            except:
+                continue
+        return False
+    
+    @property
+    def session_key(self) -> str:
+        """Session cache key - concurrent searches on one portal need separate sessions"""
+        key = f"{self.base_url}#{self.tender_status}"
+        if self.search_filters:
+            key += f"#{self.search_filters.get('label', '')}"
+        return key
+    
+    def save_session(self):
+        """Persist the cookies of the current captcha-solved session for later runs"""
+        try:
+            self.session_cookies = self.driver.get_cookies()
+        except Exception as e:
+            logging.debug(f"Could not read session cookies: {e}")
+        if not self.config.get("reuse_session", True):
+            return
+        try:
+            self.session_cache.save(self.session_key, self.session_cookies, self.driver.current_url)
+        except Exception as e:
+            logging.warning(f"Could not save session: {e}")
+    
+    def search_with_saved_session(self) -> bool:
+        """Reach the results listing with saved session cookies instead of a captcha"""
+        if not self.config.get("reuse_session", True):
+            return False
+        
+        entry = self.session_cache.load(self.session_key)
+        if not entry:
+            return False
+        
+        try:
+            logging.info("[SESSION] Trying saved session to skip the captcha...")
+            SessionCache.apply_to_driver(self.driver, entry['cookies'])
+            
+            # The portal keeps the last search results in the server-side session
+            results_url = entry.get('results_url')
+            if results_url and results_url != self.target_url:
+                self.driver.get(results_url)
+                if self.has_results_table():
+                    return self.accept_saved_session()
+            
+            # Otherwise submit the search form within the restored session
+            self.driver.get(self.target_url)
+            if self.wait_for_element(By.NAME, "tenderStatus") and self.fill_search_form():
+                if self.click_search_button() and self.has_results_table(timeout=10):
+                    return self.accept_saved_session()
+        except Exception as e:
+            logging.warning(f"[SESSION] Could not reuse saved session: {e}")
+        
+        # The portal no longer accepts it: drop it and go back to a clean search form
+        self.session_cache.invalidate(self.session_key)
+        try:
+            self.driver.delete_all_cookies()
+            self.driver.get(self.target_url)
+            if self.wait_for_element(By.NAME, "tenderStatus"):
+                self.fill_search_form()
+        except Exception as e:
+            logging.warning(f"[SESSION] Could not reset search form: {e}")
+        return False
+    
+    def accept_saved_session(self) -> bool:
+        """Adopt the verified saved session as the current one"""
+        # Replacement browsers and the heartbeat carry these cookies over
+        self.session_cookies = self.driver.get_cookies()
+        self.session_cache.touch(self.session_key)
+        logging.info("[SESSION] Saved session accepted, captcha skipped")
+        return True
+    
+    def find_captcha_image(self):
+        """Locate the captcha image element on the search form"""
+        image_selectors = [
+            "//img[contains(translate(@id, 'CAPTCHA', 'captcha'), 'captcha')]",
+            "//img[contains(translate(@src, 'CAPTCHA', 'captcha'), 'captcha')]",
+            "//img[contains(translate(@alt, 'CAPTCHA', 'captcha'), 'captcha')]"
+        ]
+        for selector in image_selectors:
+            try:
+                image = self.driver.find_element(By.XPATH, selector)
+                if image.is_displayed():
+                    return image
+            except:
+                continue
+        return None
+    
+    def solve_captcha_offline(self) -> bool:
+        """Fill the captcha with the offline solver when it is confident enough"""
+        if not self._captcha_solver_loaded:
+            self.captcha_solver = get_captcha_solver(self.config)
+            self._captcha_solver_loaded = True
+        if self.captcha_solver is None:
+            return False
+        
+        try:
+            captcha_element = self.driver.find_element(By.NAME, "captcha")
+            captcha_image = self.find_captcha_image()
+            if not captcha_image:
+                logging.info("[CAPTCHA] Captcha image not found, falling back to manual entry")
+                return False
+            
+            solution = self.captcha_solver.solve(captcha_image.screenshot_as_png)
+            threshold = self.config.get("captcha_solver_threshold", 0.8)
+            if not solution or not solution.text or solution.confidence < threshold:
+                confidence = solution.confidence if solution else 0.0
+                logging.info(f"[CAPTCHA] Offline solver confidence {confidence:.2f} below {threshold:.2f}, "
+                             "falling back to manual entry")
+                return False
+            
+            captcha_element.clear()
+            captcha_element.send_keys(solution.text)
+            logging.info(f"[CAPTCHA] Solved offline by {solution.solver}: '{solution.text}' "
+                         f"(confidence {solution.confidence:.2f}, {solution.elapsed * 1000:.0f} ms)")
+            return True
+        except Exception as e:
+            logging.warning(f"[CAPTCHA] Offline solver failed: {e}")
+            return False
+    
+    def submit_captcha_search(self, human_captcha=None) -> bool:
+        """Fill the captcha, submit the search and confirm that the results listing appeared
+        
+        The offline solver goes first. If its answer is rejected (no listing
+        after the search), the form is reloaded with a fresh captcha for
+        ``human_captcha``; unattended runs pass None and stop there.
+        """
+        solvers = [self.solve_captcha_offline] + ([human_captcha] if human_captcha else [])
+        rejected = False
+        for solve in solvers:
+            if rejected and not self.reload_search_form():
+                return False
+            with CAPTCHA_PROMPT_LOCK:
+                if not solve():
+                    continue
+            self.remember_captcha_for_fixture()
+            
+            # Small delay before clicking search
+            time.sleep(2)
+            if not self.click_search_button():
+                logging.error("Search button not found")
+                return False
+            
+            # Every portal page has a table; only the listing proves the captcha was accepted
+            if self.has_results_table(timeout=self.config["timeout_seconds"]):
+                return True
+            self._pending_captcha_fixture = None
+            try:
+                error_elements = self.driver.find_elements(By.XPATH,
+                    "//div[contains(@class, 'error')] | //span[contains(@class, 'error')] | "
+                    "//div[contains(text(), 'error')] | //div[contains(text(), 'No records found')]")
+                if error_elements:
+                    logging.error(f"Website error/message: {error_elements[0].text}")
+            except:
+                pass
+            logging.warning("[CAPTCHA] Search did not reach the results listing - captcha rejected?")
+            rejected = True
+        return False
+    
+    def reload_search_form(self) -> bool:
+        """Load the search form again (new captcha) with the run's filters"""
+        try:
+            self.driver.get(self.target_url)
+            return bool(self.wait_for_element(By.NAME, "tenderStatus")) and self.fill_search_form()
+        except Exception as e:
+            logging.error(f"Could not reload the search form: {e}")
+            return False
+    
+    def remember_captcha_for_fixture(self):
+        """Keep the captcha image and entered text until the search proves it correct"""
+        self._pending_captcha_fixture = None
+        if not self.config.get("captcha_fixture_capture", False):
+            return
+        try:
+            captcha_image = self.find_captcha_image()
+            text = self.driver.find_element(By.NAME, "captcha").get_attribute('value')
+            if captcha_image and text and text.strip():
+                self._pending_captcha_fixture = (captcha_image.screenshot_as_png, text.strip())
+        except Exception as e:
+            logging.debug(f"Could not capture captcha fixture: {e}")
+    
+    def store_captcha_fixture(self):
+        """Add a verified captcha to the labelled fixture set used by the offline solver"""
+        if not self._pending_captcha_fixture:
+            return
+        image_bytes, text = self._pending_captcha_fixture
+        self._pending_captcha_fixture = None
+        try:
+            import csv
+            fixture_dir = self.config.get("captcha_fixture_dir", "fixtures/captcha")
+            os.makedirs(fixture_dir, exist_ok=True)
+            filename = f"portal_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+            with open(os.path.join(fixture_dir, filename), 'wb') as f:
+                f.write(image_bytes)
+            labels_path = os.path.join(fixture_dir, "labels.csv")
+            write_header = not os.path.exists(labels_path)
+            with open(labels_path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if write_header:
+                    writer.writerow(['filename', 'text', 'source'])
+                writer.writerow([filename, text, 'portal'])
+            logging.info(f"[CAPTCHA] Added solved captcha to fixture set: {filename}")
+        except Exception as e:
+            logging.warning(f"Could not store captcha fixture: {e}")
+    
     def handle_captcha_enhanced(self) -> bool:
         """Simplified captcha handling - focus on making it work"""
         max_attempts = 3
@@ -574,97 +1136,22 @@ class OdishaTenderScraperEnhanced:
     
     def search_tenders_manual(self) -> bool:
         """Submit search after manual captcha verification"""
+        self.active_search = self.search_tenders_manual
         try:
+            # Skip the captcha when a saved session is still accepted by the portal
+            if self.search_with_saved_session():
+                return True
+            
             # Handle manual captcha
             print("[SEARCH] Starting manual captcha process...")
-            if not self.handle_manual_captcha():
-                print("[ERROR] Manual captcha verification failed")
-                return False
-            
-            print("[SUCCESS] Manual captcha completed, proceeding with search...")
-            
-            # Small delay before clicking search
-            time.sleep(2)
-            
-            # Find and click search button
-            search_selectors = [
-                (By.XPATH, "//input[@value='Search']"),
-                (By.XPATH, "//button[contains(text(), 'Search')]"),
-                (By.XPATH, "//input[@type='submit'][contains(@value, 'Search')]"),
-                (By.ID, "searchButton"),
-                (By.NAME, "search")
-            ]
-            
-            search_button = None
-            for by, value in search_selectors:
-                try:
-                    search_button = self.driver.find_element(by, value)
-                    if search_button and search_button.is_displayed():
-                        print(f"[OK] Found search button using: {by}='{value}'")
-                        break
-                except:
-                    continue
-            
-            if not search_button:
-                print("[ERROR] Search button not found")
-                logging.error("Search button not found")
-                return False
-            
-            # Scroll to search button if needed
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-            time.sleep(0.5)
-            
-            # Click search button
-            try:
-                print("[SEARCH] Clicking search button...")
-                search_button.click()
-                logging.info("Search button clicked")
-            except:
-                # If normal click fails, try JavaScript click
-                print("[SEARCH] Trying JavaScript click...")
-                self.driver.execute_script("arguments[0].click();", search_button)
-                logging.info("Search button clicked via JavaScript")
-            
-            # Wait for results with enhanced detection
-            print("[WAIT] Waiting for search results...")
-            results_found = False
-            for attempt in range(5):
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.any_of(
-                            EC.presence_of_element_located((By.CLASS_NAME, "list-table")),
-                            EC.presence_of_element_located((By.XPATH, "//table")),
-                            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'tender')]")),
-                            EC.presence_of_element_located((By.XPATH, "//td[contains(text(), 'Tender ID')]")),
-                            EC.presence_of_element_located((By.XPATH, "//th[contains(text(), 'S.No')]"))
-                        )
-                    )
-                    results_found = True
-                    print("[SUCCESS] Search results loaded successfully!")
-                    break
-                except:
-                    print(f"[WAIT] Results loading attempt {attempt + 1} failed, retrying...")
-                    time.sleep(3)
-            
-            if not results_found:
-                # Check for error messages
-                try:
-                    error_elements = self.driver.find_elements(By.XPATH, 
-                        "//div[contains(@class, 'error')] | //span[contains(@class, 'error')] | "
-                        "//div[contains(text(), 'error')] | //div[contains(text(), 'No records found')]")
-                    if error_elements:
-                        error_text = error_elements[0].text
-                        print(f"[ERROR] Website error: {error_text}")
-                        logging.error(f"Website error: {error_text}")
-                        return False
-                except:
-                    pass
-                
+            if not self.submit_captcha_search(self.handle_manual_captcha):
                 print("[ERROR] No results found after search")
-                logging.error("No results found after search")
                 return False
             
+            print("[SUCCESS] Search results loaded successfully!")
             logging.info("Search completed successfully with manual captcha")
+            self.save_session()
+            self.store_captcha_fixture()
             return True
             
         except Exception as e:
@@ -691,10 +1178,10 @@ class OdishaTenderScraperEnhanced:
                 logging.error("[ERROR] Failed to load initial page")
                 return False
             
-            # Set tender status to AOC
-            logging.info("[CONFIG] Setting tender status to AOC...")
-            if not self.set_tender_status_aoc():
-                logging.error("[ERROR] Failed to set tender status to AOC")
+            # Set tender status (AOC by default)
+            logging.info(f"[CONFIG] Setting tender status to {self.tender_status}...")
+            if not self.fill_search_form():
+                logging.error(f"[ERROR] Failed to set tender status to {self.tender_status}")
                 return False
             
             # Search for tenders with manual captcha
@@ -737,7 +1224,7 @@ class OdishaTenderScraperEnhanced:
             return False
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logging.info("[CLOSED] Browser closed")
     
     def handle_gui_captcha(self) -> bool:
@@ -811,97 +1298,22 @@ class OdishaTenderScraperEnhanced:
     
     def search_tenders_gui(self) -> bool:
         """Submit search after GUI captcha verification"""
+        self.active_search = self.search_tenders_gui
         try:
+            # Skip the captcha when a saved session is still accepted by the portal
+            if self.search_with_saved_session():
+                return True
+            
             # Handle GUI captcha
             print("[SEARCH] Starting GUI captcha process...")
-            if not self.handle_gui_captcha():
-                print("[ERROR] GUI captcha verification failed")
-                return False
-            
-            print("[SUCCESS] GUI captcha completed, proceeding with search...")
-            
-            # Small delay before clicking search
-            time.sleep(2)
-            
-            # Find and click search button
-            search_selectors = [
-                (By.XPATH, "//input[@value='Search']"),
-                (By.XPATH, "//button[contains(text(), 'Search')]"),
-                (By.XPATH, "//input[@type='submit'][contains(@value, 'Search')]"),
-                (By.ID, "searchButton"),
-                (By.NAME, "search")
-            ]
-            
-            search_button = None
-            for by, value in search_selectors:
-                try:
-                    search_button = self.driver.find_element(by, value)
-                    if search_button and search_button.is_displayed():
-                        print(f"[OK] Found search button using: {by}='{value}'")
-                        break
-                except:
-                    continue
-            
-            if not search_button:
-                print("[ERROR] Search button not found")
-                logging.error("Search button not found")
-                return False
-            
-            # Scroll to search button if needed
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-            time.sleep(0.5)
-            
-            # Click search button
-            try:
-                print("[SEARCH] Clicking search button...")
-                search_button.click()
-                logging.info("Search button clicked")
-            except:
-                # If normal click fails, try JavaScript click
-                print("[SEARCH] Trying JavaScript click...")
-                self.driver.execute_script("arguments[0].click();", search_button)
-                logging.info("Search button clicked via JavaScript")
-            
-            # Wait for results with enhanced detection
-            print("[WAIT] Waiting for search results...")
-            results_found = False
-            for attempt in range(5):
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.any_of(
-                            EC.presence_of_element_located((By.CLASS_NAME, "list-table")),
-                            EC.presence_of_element_located((By.XPATH, "//table")),
-                            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'tender')]")),
-                            EC.presence_of_element_located((By.XPATH, "//td[contains(text(), 'Tender ID')]")),
-                            EC.presence_of_element_located((By.XPATH, "//th[contains(text(), 'S.No')]"))
-                        )
-                    )
-                    results_found = True
-                    print("[SUCCESS] Search results loaded successfully!")
-                    break
-                except:
-                    print(f"[WAIT] Results loading attempt {attempt + 1} failed, retrying...")
-                    time.sleep(3)
-            
-            if not results_found:
-                # Check for error messages
-                try:
-                    error_elements = self.driver.find_elements(By.XPATH, 
-                        "//div[contains(@class, 'error')] | //span[contains(@class, 'error')] | "
-                        "//div[contains(text(), 'error')] | //div[contains(text(), 'No records found')]")
-                    if error_elements:
-                        error_text = error_elements[0].text
-                        print(f"[ERROR] Website error: {error_text}")
-                        logging.error(f"Website error: {error_text}")
-                        return False
-                except:
-                    pass
-                
+            if not self.submit_captcha_search(self.handle_gui_captcha):
                 print("[ERROR] No results found after search")
-                logging.error("No results found after search")
                 return False
             
+            print("[SUCCESS] Search results loaded successfully!")
             logging.info("Search completed successfully with GUI captcha")
+            self.save_session()
+            self.store_captcha_fixture()
             return True
             
         except Exception as e:
@@ -928,10 +1340,10 @@ class OdishaTenderScraperEnhanced:
                 logging.error("[ERROR] Failed to load initial page")
                 return False
             
-            # Set tender status to AOC
-            logging.info("[CONFIG] Setting tender status to AOC...")
-            if not self.set_tender_status_aoc():
-                logging.error("[ERROR] Failed to set tender status to AOC")
+            # Set tender status (AOC by default)
+            logging.info(f"[CONFIG] Setting tender status to {self.tender_status}...")
+            if not self.fill_search_form():
+                logging.error(f"[ERROR] Failed to set tender status to {self.tender_status}")
                 return False
             
             # Search for tenders with GUI captcha
@@ -974,21 +1386,92 @@ class OdishaTenderScraperEnhanced:
             return False
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logging.info("[CLOSED] Browser closed")
     
     def set_max_records(self, max_records: int):
         """Set maximum number of records to scrape"""
         self.max_records = max_records
         logging.info(f"Max records set to: {max_records}")
+    
+    def use_portal(self, portal: Dict):
+        """Point this scraper at another GePNIC portal from a 'portals' config entry"""
+        self.config.update(portal)
+        self.portal_name = portal.get("name") or portal["base_url"]
+        self.config["portal_name"] = self.portal_name
+        self.base_url = portal["base_url"].rstrip('/')
+        self.target_url = portal.get("target_url") or \
+            f"{self.base_url}/nicgep/app?page=WebTenderStatusLists&service=page"
+        # Keep each portal's downloads apart
+        self.download_folder = portal.get("download_folder") or \
+            os.path.join(self.config["download_folder"], self.portal_name.lower().replace(' ', '_'))
+        self.setup_directories()
+    
+    def scrape_records(self, captcha_method: str = 'manual') -> List[TenderRecord]:
+        """Search, paginate and extract details, returning the records without exporting them"""
+        search = {
+            'auto': self.search_tenders,
+            'manual': self.search_tenders_manual,
+            'gui': self.search_tenders_gui,
+            'offline': self.search_tenders_offline
+        }[captcha_method]
+        try:
+            logging.info(f"[START] [{self.portal_name}] Scraping up to {self.max_records} records from {self.base_url}")
+            if not self.setup_driver():
+                logging.error(f"[ERROR] [{self.portal_name}] Failed to setup browser driver")
+                return []
+            
+            self.driver.get(self.target_url)
+            if not self.wait_for_element(By.NAME, "tenderStatus"):
+                logging.error(f"[ERROR] [{self.portal_name}] Failed to load initial page")
+                return []
+            
+            if not self.fill_search_form():
+                logging.error(f"[ERROR] [{self.portal_name}] Failed to set tender status to {self.tender_status}")
+                return []
+            
+            if not search():
+                logging.error(f"[ERROR] [{self.portal_name}] Failed to search for tenders")
+                return []
+            
+            tender_data = self.extract_tender_list_paginated()
+            if not tender_data:
+                logging.warning(f"[{self.portal_name}] No tender data found")
+                return []
+            
+            return self.process_tender_details(tender_data)
+            
+        except Exception as e:
+            logging.error(f"[ERROR] [{self.portal_name}] Scraper error: {e}")
+            return []
+        finally:
+            if self.driver:
+                self.close_driver()
+                logging.info(f"[{self.portal_name}] Browser closed")
 
-    def extract_tender_list_paginated(self) -> List[Dict]:
+    def extract_tender_list_paginated(self) -> List[TenderRecord]:
         """Extract tender data with pagination support"""
         all_tender_data = []
         page_number = 1
+        self.current_page = 1
+        self.listing_exhausted = False
+        self.listing_pages = {}
+        # The captcha is solved by now, so assets can be blocked for the rest of the run
+        self.set_resource_blocking(True)
+        
+        if self.config.get("maximize_page_size", True):
+            self.set_max_page_size()
+        
+        start_page = self.get_start_page()
+        if start_page > 1:
+            if self.go_to_page(start_page):
+                page_number = start_page
+            else:
+                logging.warning(f"[PAGE] Could not jump to page {start_page}, starting from page 1")
         
         while len(all_tender_data) < self.max_records:
             try:
+                self.current_page = page_number
                 logging.info(f"[PAGE] Processing page {page_number} (Records so far: {len(all_tender_data)}/{self.max_records})")
                 
                 # Extract data from current page
@@ -1003,6 +1486,7 @@ class OdishaTenderScraperEnhanced:
                     if len(all_tender_data) >= self.max_records:
                         break
                     all_tender_data.append(tender)
+                    self.listing_pages[tender['Tender ID']] = page_number
                 
                 logging.info(f"Extracted {len(page_data)} records from page {page_number}")
                 
@@ -1014,6 +1498,7 @@ class OdishaTenderScraperEnhanced:
                 # Try to go to next page
                 if not self.go_to_next_page():
                     logging.info("No more pages available")
+                    self.listing_exhausted = True
                     break
                     
                 page_number += 1
@@ -1028,20 +1513,22 @@ class OdishaTenderScraperEnhanced:
         logging.info(f"Total records collected: {len(final_data)}")
         return final_data
 
-    def extract_current_page_data(self) -> List[Dict]:
+    def extract_current_page_data(self) -> List[TenderRecord]:
         """Extract tender data from current page"""
         tender_data = []
         
         try:
             # Wait for results to load
-            time.sleep(3)
+            if self.fetch_backend is None:
+                time.sleep(3)
+            self.archive_page('listing')
             
             # Debug: Check what's on the page
-            page_source_snippet = self.driver.page_source[:1000]
+            page_source_snippet = self.page.page_source[:1000]
             logging.info(f"Page source snippet: {page_source_snippet}")
             
             # Try to find any table on the page first
-            all_tables = self.driver.find_elements(By.TAG_NAME, "table")
+            all_tables = self.page.find_elements(By.TAG_NAME, "table")
             logging.info(f"Found {len(all_tables)} table(s) on the page")
             
             # More comprehensive table selectors
@@ -1062,7 +1549,7 @@ class OdishaTenderScraperEnhanced:
             
             for selector in table_selectors:
                 try:
-                    tables = self.driver.find_elements(By.XPATH, selector)
+                    tables = self.page.find_elements(By.XPATH, selector)
                     for t in tables:
                         if t.is_displayed():
                             # Check if this table has data rows
@@ -1084,7 +1571,7 @@ class OdishaTenderScraperEnhanced:
                 # Debug: Save page source to file for inspection
                 try:
                     with open("debug_page_source.html", "w", encoding="utf-8") as f:
-                        f.write(self.driver.page_source)
+                        f.write(self.page.page_source)
                     logging.info("Saved page source to debug_page_source.html")
                 except:
                     pass
@@ -1100,24 +1587,16 @@ class OdishaTenderScraperEnhanced:
                     if len(cells) < 5:
                         continue
                     
-                    tender_info = {
-                        'S.No': self.safe_get_text(cells, 0),
-                        'Tender ID': self.safe_get_text(cells, 1),
-                        'Title and Ref.No.': self.safe_get_text(cells, 2),
-                        'Organisation Chain': self.safe_get_text(cells, 3),
-                        'Tender Stage': self.safe_get_text(cells, 4),
-                        'Status': self.safe_get_text(cells, 5) if len(cells) > 5 else '<empty>',
-                        'Status_Link': '<empty>',
-                        'AOC_PDF_Link': '<empty>',
-                        'AOC_PDF_File': '<empty>',
-                        'Stage_Summary_Data': '<empty>',
-                        'Contract_Value': '<empty>',
-                        'Contractor_Name': '<empty>',
-                        'Email': '<empty>',
-                        'Mobile': '<empty>',
-                        'GST_Number': '<empty>',
-                        'PDF_Details': '<empty>'
-                    }
+                    tender_info = TenderRecord(
+                        portal=self.portal_name,
+                        search_status=self.tender_status,
+                        s_no=self.safe_get_text(cells, 0, empty=None),
+                        tender_id=self.safe_get_text(cells, 1, empty=None),
+                        title=self.safe_get_text(cells, 2, empty=None),
+                        organisation=self.safe_get_text(cells, 3, empty=None),
+                        tender_stage=self.safe_get_text(cells, 4, empty=None),
+                        status=self.safe_get_text(cells, 5, empty=None)
+                    )
                     
                     # Extract status link
                     try:
@@ -1127,7 +1606,7 @@ class OdishaTenderScraperEnhanced:
                             if links:
                                 href = links[0].get_attribute('href')
                                 if href:
-                                    tender_info['Status_Link'] = href
+                                    tender_info.status_link = href
                     except:
                         pass
                     
@@ -1143,89 +1622,571 @@ class OdishaTenderScraperEnhanced:
             logging.error(f"Error extracting current page data: {e}")
             return []
 
-    def go_to_next_page(self) -> bool:
-        """Navigate to next page of results"""
+    def set_max_page_size(self) -> bool:
+        """Switch the results listing to its largest records-per-page setting
+
+        Uses the listing's records-per-page dropdown when there is one, or
+        the configured ``page_size_param`` request parameter. Returns False
+        (and leaves the listing as it is) when neither is available.
+        """
+        try:
+            for dropdown in self.driver.find_elements(By.TAG_NAME, "select"):
+                select = Select(dropdown)
+                sizes = {}
+                for option in select.options:
+                    text = option.text.strip()
+                    if text.isdigit():
+                        sizes[int(text)] = option
+                # A page size selector offers only small numbers, e.g. 10/20/50/100 (not years)
+                if len(sizes) < 2 or len(sizes) != len(select.options) or max(sizes) > 1000:
+                    continue
+                wanted = self.config.get("page_size") or max(sizes)
+                if wanted not in sizes or sizes[wanted].is_selected():
+                    return wanted in sizes
+                select.select_by_visible_text(sizes[wanted].text)
+                if self.has_results_table(timeout=10):
+                    logging.info(f"[PAGE] Listing page size set to {wanted}")
+                    return True
+            
+            param = self.config.get("page_size_param")
+            if param and self.config.get("page_size"):
+                parsed = urlparse(self.driver.current_url)
+                params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k != param]
+                params.append((param, str(self.config["page_size"])))
+                self.driver.get(parsed._replace(query=urlencode(params)).geturl())
+                if self.has_results_table(timeout=10):
+                    logging.info(f"[PAGE] Listing page size set to {self.config['page_size']} via {param}")
+                    return True
+                self.driver.back()
+            
+            logging.info("[PAGE] No page size option on the listing, using the portal default")
+            return False
+        except Exception as e:
+            logging.warning(f"Could not change listing page size: {e}")
+            return False
+    
+    def get_start_page(self) -> int:
+        """Page to start the listing at: partition, explicit config, then saved cursor"""
+        start_page = self.search_filters.get("start_page") or self.config.get("start_page")
+        if not start_page and self.config.get("resume_pagination"):
+            start_page = self.page_cursor.load(self.session_key)
+            if start_page:
+                logging.info(f"[PAGE] Resuming listing at saved page {start_page}")
+        return int(start_page or 1)
+    
+    def save_page_cursor(self):
+        """Record where the listing walk got to; a finished listing starts over next time"""
+        if self.listing_exhausted:
+            self.page_cursor.clear(self.session_key)
+        else:
+            # The last page may be partly processed, so resume on it rather than after it
+            self.page_cursor.save(self.session_key, self.current_page)
+    
+    def advance_page_cursor(self, tender: TenderRecord, left_on_page: Counter):
+        """Count a finished tender against its listing page and, once that page is
+        used up, move the cursor to the first page that still has tenders to process"""
+        page = self.listing_pages.get(tender['Tender ID'])
+        if page is None:
+            return
+        left_on_page[page] -= 1
+        unfinished = [p for p, left in left_on_page.items() if left > 0]
+        if not left_on_page[page] and unfinished and page < min(unfinished):
+            # An interrupted run resumes after the pages already consumed
+            self.page_cursor.save(self.session_key, min(unfinished))
+    
+    def page_links(self) -> Dict[int, object]:
+        """Numbered pagination links on the current listing page"""
+        links = {}
+        for link in self.driver.find_elements(By.XPATH, "//a[contains(@href, 'page=')]"):
+            try:
+                text = link.text.strip()
+                if text.isdigit():
+                    links[int(text)] = link
+            except Exception:
+                continue
+        return links
+    
+    def page_url(self, links: Dict[int, object], page: int) -> Optional[str]:
+        """Build the URL of any page by rewriting the page number in a numbered link"""
+        for number, link in links.items():
+            href = link.get_attribute('href') or ''
+            parsed = urlparse(href)
+            params = parse_qsl(parsed.query, keep_blank_values=True)
+            # The page number is the query value that equals the link text
+            positions = [i for i, (_, value) in enumerate(params) if value == str(number)]
+            if len(positions) != 1:
+                continue
+            name, _ = params[positions[0]]
+            params[positions[0]] = (name, str(page))
+            return parsed._replace(query=urlencode(params)).geturl()
+        return None
+    
+    def go_to_page(self, page: int) -> bool:
+        """Jump straight to listing page K instead of clicking Next K-1 times"""
+        try:
+            for _ in range(self.config["max_retries"] * 5):
+                links = self.page_links()
+                if page in links:
+                    self.driver.execute_script("arguments[0].click();", links[page])
+                    if self.has_results_table(timeout=10):
+                        self.current_page = page
+                        logging.info(f"[PAGE] Jumped to page {page}")
+                        return True
+                    return False
+                
+                # Not in the visible window: request it directly by URL
+                url = self.page_url(links, page)
+                if url:
+                    self.driver.get(url)
+                    if self.has_results_table(timeout=10) and self.is_on_page(page):
+                        self.current_page = page
+                        logging.info(f"[PAGE] Jumped to page {page} by URL")
+                        return True
+                    self.driver.back()
+                
+                # Otherwise hop to the furthest visible page below the target and look again
+                below = [number for number in links if number < page]
+                if not below or max(below) <= self.current_page:
+                    return False
+                self.driver.execute_script("arguments[0].click();", links[max(below)])
+                if not self.has_results_table(timeout=10):
+                    return False
+                self.current_page = max(below)
+            return False
+        except Exception as e:
+            logging.error(f"Error jumping to page {page}: {e}")
+            return False
+    
+    def is_on_page(self, page: int) -> bool:
+        """Sanity check that the pager around the listing includes the page we asked for"""
+        try:
+            pager_text = self.driver.find_element(By.XPATH, "//a[contains(@href, 'page=')]/..").text
+            numbers = set(int(n) for n in re.findall(r'\b\d+\b', pager_text))
+            return not numbers or page in numbers
+        except Exception:
+            return True
+    
+    def go_to_next_page(self) -> bool:
+        """Navigate to next page of results"""
+        try:
+            # Look for "Next" button or pagination links
+            next_selectors = [
+                "//a[contains(text(), 'Next')]",
+                "//a[contains(text(), 'next')]",
+                "//a[contains(text(), '>>')]",
+                "//a[contains(text(), '->')]",
+                "//input[@value='Next']",
+                "//button[contains(text(), 'Next')]"
+            ]
+            
+            next_button = None
+            for selector in next_selectors:
+                try:
+                    next_button = self.driver.find_element(By.XPATH, selector)
+                    if next_button.is_displayed() and next_button.is_enabled():
+                        break
+                except:
+                    continue
+            
+            if not next_button:
+                # Try to find pagination with page numbers
+                try:
+                    # Look for the last visible page number and try next one
+                    page_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'page=') or contains(@onclick, 'page')]")
+                    if page_links:
+                        # Find current page and get next
+                        for link in page_links:
+                            if 'current' in link.get_attribute('class') or 'active' in link.get_attribute('class'):
+                                # Found current page, try to find next
+                                continue
+                        # If no specific next found, try the last pagination link
+                        if page_links:
+                            next_button = page_links[-1]
+                except:
+                    pass
+            
+            if next_button:
+                # Scroll to next button
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
+                time.sleep(1)
+                
+                # Click next button
+                try:
+                    next_button.click()
+                except:
+                    self.driver.execute_script("arguments[0].click();", next_button)
+                
+                # Wait for page to load
+                time.sleep(3)
+                
+                # Verify page changed (look for loading or new content)
+                try:
+                    WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_element_located((By.XPATH, "//table"))
+                    )
+                    logging.info("[SUCCESS] Successfully navigated to next page")
+                    return True
+                except:
+                    logging.warning("Page may not have changed after clicking next")
+                    return False
+            else:
+                logging.info("No next page button found")
+                return False
+                
+        except Exception as e:
+            logging.error(f"Error navigating to next page: {e}")
+            return False
+
+    def process_tender_details(self, tender_data: List[TenderRecord]) -> List[TenderRecord]:
+        """Extract AOC details for each tender and hand it to the record callback"""
+        self.failed_tenders = []
+        # GUI settings may have changed the delay after construction
+        self.rate_limiter.min_interval = self.config["delay_between_requests"]
+        self.start_heartbeat()
+        backend = self.start_fetch_backend()
+        pending = deque(tender_data)
+        left_on_page = Counter(self.listing_pages.get(t['Tender ID']) for t in tender_data)
+        timeouts = {}
+        try:
+            while pending:
+                tender = pending.popleft()
+                logging.info(f"Processing tender {len(tender_data) - len(pending)}/{len(tender_data)}: {tender['Tender ID']}")
+                try:
+                    extracted = self.extract_with_reauth(tender, pending)
+                except PageLoadTimeoutError as e:
+                    logging.warning(f"[DEADLINE] {e}")
+                    if self.fetch_backend is None and not self.replace_hung_driver():
+                        self.failed_tenders += [t['Tender ID'] for t in [tender] + list(pending)]
+                        logging.error(f"[DEADLINE] No browser available; {len(self.failed_tenders)} tenders left without details")
+                        break
+                    timeouts[tender['Tender ID']] = timeouts.get(tender['Tender ID'], 0) + 1
+                    if timeouts[tender['Tender ID']] <= self.config["page_load_retries"]:
+                        # Retry at the end of the queue so one slow tender does not hold up the rest
+                        pending.append(tender)
+                    else:
+                        logging.error(f"[DEADLINE] Giving up on tender {tender['Tender ID']} after repeated timeouts")
+                        self.failed_tenders.append(tender['Tender ID'])
+                        self.advance_page_cursor(tender, left_on_page)
+                    continue
+                if not extracted:
+                    # Keep the rows (listing data only) but report exactly which tenders lack details
+                    self.failed_tenders += [t['Tender ID'] for t in [tender] + list(pending)]
+                    logging.error(f"[SESSION] Could not restore the portal session; {len(self.failed_tenders)} "
+                                  f"tenders left without details: {', '.join(map(str, self.failed_tenders))}")
+                    break
+                self.emit_record(tender)
+                self.advance_page_cursor(tender, left_on_page)
+                if not self.check_browser_health():
+                    self.failed_tenders += [t['Tender ID'] for t in pending]
+                    logging.error(f"[WATCHDOG] No browser available; {len(self.failed_tenders)} tenders left without details")
+                    break
+            else:
+                self.save_page_cursor()
+        finally:
+            self.stop_heartbeat()
+            self.stop_fetch_backend(backend)
+        return tender_data
+
+    def start_heartbeat(self):
+        """Keep the authenticated session alive in the background during long loops"""
+        if not self.config.get("keepalive_enabled", True) or self.heartbeat:
+            return
+        if not self.session_cookies:
+            # Nothing to keep alive until a search has produced a session
+            logging.debug("[HEARTBEAT] No portal session yet, keep-alive not started")
+            return
+        try:
+            self.heartbeat = SessionHeartbeat(
+                self.config.get("keepalive_url") or self.target_url,
+                self.rate_limiter,
+                interval=self.config.get("keepalive_interval_seconds", 240),
+                session_active=self.session_active,
+                on_ping=lambda ok: ok and self.session_cache.touch(self.session_key)
+            )
+            self.heartbeat.update_cookies(self.session_cookies)
+            self.heartbeat.start()
+        except Exception as e:
+            logging.warning(f"[HEARTBEAT] Could not start keep-alive: {e}")
+            self.heartbeat = None
+
+    def stop_heartbeat(self):
+        """Stop the keep-alive thread, if running"""
+        if self.heartbeat:
+            self.heartbeat.stop()
+            self.heartbeat = None
+
+    def timed_get(self, url: str):
+        """driver.get that feeds page load latency to the browser watchdog"""
+        from selenium.common.exceptions import TimeoutException
+        
+        started = time.perf_counter()
+        try:
+            with self.browser_call(f"Loading {url}"):
+                self.driver.get(url)
+        except TimeoutException as e:
+            raise PageLoadTimeoutError(f"Page load exceeded {self.config['page_load_timeout_seconds']}s: {url}") from e
+        self.watchdog.record_page(time.perf_counter() - started)
+    
+    def check_browser_health(self) -> bool:
+        """Recycle the browser when the watchdog says it has grown too slow or too big
+
+        Returns False only when no usable browser is left.
+        """
+        reason = self.watchdog.recycle_reason(self.driver)
+        if reason:
+            logging.info(f"[WATCHDOG] Recycling browser: {reason}")
+            if not self.recycle_driver():
+                logging.warning("[WATCHDOG] Browser recycle failed")
+        return self.driver is not None
+    
+    def recycle_driver(self, cookies: Optional[List[Dict]] = None) -> bool:
+        """Replace the browser with a fresh one carrying over the session cookies (no new captcha)"""
+        if cookies is None:
+            try:
+                cookies = self.driver.get_cookies()
+            except Exception as e:
+                logging.warning(f"[WATCHDOG] Could not read cookies before recycling: {e}")
+                return False
+        
+        old_driver, self.driver = self.driver, None
+        try:
+            if self.driver_pool:
+                self.driver_pool.discard(old_driver)
+            else:
+                old_driver.quit()
+        except Exception as e:
+            logging.debug(f"Error closing old browser: {e}")
+        
+        if not self.setup_driver():
+            logging.error("[WATCHDOG] Could not start a replacement browser")
+            return False
+        try:
+            # Cookies can only be set on the portal's domain
+            self.driver.get(self.base_url)
+            SessionCache.apply_to_driver(self.driver, cookies)
+            self.set_resource_blocking(True)
+            if self.heartbeat:
+                self.heartbeat.update_cookies(cookies)
+            self.watchdog.reset()
+            self.session_cookies = cookies
+            logging.info(f"[WATCHDOG] Browser replaced, {len(cookies)} session cookies restored")
+            return True
+        except Exception as e:
+            logging.error(f"[WATCHDOG] Could not restore the session in the new browser: {e}")
+            return False
+    
+    def extract_with_deadline(self, tender_info: TenderRecord):
+        """Extract one tender's details, its browser calls sharing tender_deadline_seconds
+
+        Only page loads and script calls count against the deadline; PDF
+        downloads go over HTTP with their own pdf_timeout_seconds.
+        """
+        if self.fetch_backend is not None:
+            # HTTP and replay backends time out on their own and never hang the browser
+            self.extract_aoc_details_enhanced(tender_info)
+            return
+        self.browser_budget = self.config["tender_deadline_seconds"]
+        try:
+            self.extract_aoc_details_enhanced(tender_info)
+        finally:
+            self.browser_budget = None
+    
+    def replace_hung_driver(self) -> bool:
+        """Swap a timed-out browser for a fresh one carrying the session cookies"""
+        try:
+            kill_process_tree(self.driver.service.process.pid)
+        except Exception as e:
+            logging.debug(f"Could not kill hung browser: {e}")
+        return self.recycle_driver(self.session_cookies)
+    
+    def extract_with_reauth(self, tender_info: TenderRecord, pending: Iterable[TenderRecord] = ()) -> bool:
+        """Extract one tender's details, re-authenticating once if the session has expired
+
+        Detail links belong to the session that listed them, so after
+        re-authenticating the links of this tender and the ``pending`` ones
+        are read again from the new session's listing.
+        """
+        try:
+            self.extract_with_deadline(tender_info)
+            return True
+        except SessionExpiredError:
+            logging.warning(f"[SESSION] Portal session expired at tender {tender_info['Tender ID']}, "
+                            "pausing to re-authenticate")
+        
+        if not self.reauthenticate():
+            return False
+        if self.fetch_backend is not None:
+            self.fetch_backend.load_cookies(self.driver.get_cookies())
+        self.refresh_status_links([tender_info] + list(pending))
+        
+        try:
+            self.extract_with_deadline(tender_info)
+            return True
+        except SessionExpiredError:
+            logging.error(f"[SESSION] Session expired again right after re-authentication "
+                          f"(tender {tender_info['Tender ID']})")
+            return False
+
+    def refresh_status_links(self, tenders: List[TenderRecord]) -> int:
+        """Replace the tenders' detail links with the ones on the current session's results listing"""
+        wanted = {tender['Tender ID']: tender for tender in tenders}
+        pages = sorted({self.listing_pages.get(tender_id, 1) for tender_id in wanted})
+        refreshed = set()
+        # The listing is in the browser, whichever backend fetches the detail pages
+        backend, self.fetch_backend = self.fetch_backend, None
+        try:
+            # Page numbers only match with the page size the tenders were listed at
+            if self.config.get("maximize_page_size", True):
+                self.set_max_page_size()
+            self.current_page = 1
+            for page in pages:
+                if page != self.current_page and not self.go_to_page(page):
+                    logging.warning(f"[SESSION] Could not reopen listing page {page} to refresh tender links")
+                    continue
+                for row in self.extract_current_page_data():
+                    tender = wanted.get(row['Tender ID'])
+                    if tender is not None and row['Status_Link']:
+                        tender['Status_Link'] = row['Status_Link']
+                        refreshed.add(row['Tender ID'])
+        except Exception as e:
+            logging.warning(f"[SESSION] Could not refresh tender links: {e}")
+        finally:
+            self.fetch_backend = backend
+        logging.info(f"[SESSION] Refreshed {len(refreshed)}/{len(wanted)} tender links for the new session")
+        return len(refreshed)
+
+    def is_session_expired_page(self) -> bool:
+        """Detect the portal's session-expired/stale-session page"""
+        try:
+            current_url = self.page.current_url or ''
+            if 'StaleSession' in current_url or 'StaleLink' in current_url:
+                return True
+            # Visible text only, so scripts mentioning session timeouts don't trigger it
+            page_text = self.page.find_element(By.TAG_NAME, "body").text.lower()
+            return any(marker in page_text for marker in self.config.get("session_expired_markers", []))
+        except Exception as e:
+            logging.debug(f"Could not check for session expiry: {e}")
+            return False
+
+    def reauthenticate(self) -> bool:
+        """Pause the pipeline and solve the captcha once more through the run's search method"""
+        self.session_active.clear()
+        self.set_resource_blocking(False)
         try:
-            # Look for "Next" button or pagination links
-            next_selectors = [
-                "//a[contains(text(), 'Next')]",
-                "//a[contains(text(), 'next')]",
-                "//a[contains(text(), '>>')]",
-                "//a[contains(text(), '->')]",
-                "//input[@value='Next']",
-                "//button[contains(text(), 'Next')]"
-            ]
-            
-            next_button = None
-            for selector in next_selectors:
-                try:
-                    next_button = self.driver.find_element(By.XPATH, selector)
-                    if next_button.is_displayed() and next_button.is_enabled():
-                        break
-                except:
-                    continue
-            
-            if not next_button:
-                # Try to find pagination with page numbers
-                try:
-                    # Look for the last visible page number and try next one
-                    page_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'page=') or contains(@onclick, 'page')]")
-                    if page_links:
-                        # Find current page and get next
-                        for link in page_links:
-                            if 'current' in link.get_attribute('class') or 'active' in link.get_attribute('class'):
-                                # Found current page, try to find next
-                                continue
-                        # If no specific next found, try the last pagination link
-                        if page_links:
-                            next_button = page_links[-1]
-                except:
-                    pass
+            self.session_cache.invalidate(self.session_key)
+            self.driver.delete_all_cookies()
+            self.driver.get(self.target_url)
+            if not self.wait_for_element(By.NAME, "tenderStatus"):
+                logging.error("[SESSION] Search form did not load during re-authentication")
+                return False
+            if not self.fill_search_form():
+                logging.error("[SESSION] Could not set tender status during re-authentication")
+                return False
             
-            if next_button:
-                # Scroll to next button
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                time.sleep(1)
-                
-                # Click next button
-                try:
-                    next_button.click()
-                except:
-                    self.driver.execute_script("arguments[0].click();", next_button)
-                
-                # Wait for page to load
-                time.sleep(3)
-                
-                # Verify page changed (look for loading or new content)
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, "//table"))
-                    )
-                    logging.info("[SUCCESS] Successfully navigated to next page")
-                    return True
-                except:
-                    logging.warning("Page may not have changed after clicking next")
-                    return False
-            else:
-                logging.info("No next page button found")
+            search = self.active_search or self.search_tenders_manual
+            if not search():
+                logging.error("[SESSION] Captcha re-solve failed")
                 return False
-                
+            
+            logging.info("[SESSION] Re-authenticated, resuming detail extraction")
+            self.set_resource_blocking(True)
+            if self.heartbeat:
+                self.heartbeat.update_cookies(self.driver.get_cookies())
+            return True
         except Exception as e:
-            logging.error(f"Error navigating to next page: {e}")
+            logging.error(f"[SESSION] Re-authentication failed: {e}")
             return False
+        finally:
+            self.session_active.set()
 
-    def extract_aoc_details_enhanced(self, tender_info: Dict) -> Dict:
+    def emit_record(self, tender_info: TenderRecord):
+        """Pass an enriched tender to the streaming callback, if any"""
+        if not self.on_record_enriched:
+            return
+        try:
+            self.on_record_enriched(tender_info)
+        except Exception as e:
+            logging.error(f"Record callback failed for tender {tender_info['Tender ID']}: {e}")
+
+    @property
+    def page(self) -> FetchBackend:
+        """Backend the extractors read pages through: the active fetch backend, else the browser"""
+        if self.fetch_backend is not None:
+            return self.fetch_backend
+        if self.browser_page is None or self.browser_page.driver is not self.driver:
+            self.browser_page = SeleniumBackend(self.driver, self.timed_get)
+        return self.browser_page
+    
+    def paced(self):
+        """Rate limiter slot for one portal request; replayed pages are not paced"""
+        if self.fetch_backend is not None and self.fetch_backend.offline:
+            return nullcontext()
+        return self.rate_limiter.request()
+    
+    def open_page(self, url: str):
+        """Load a detail page through the active backend"""
+        # The rate limiter slot covers the request only, not the render wait or the parsing after it
+        if self.fetch_backend is None:
+            with self.paced():
+                self.timed_get(url)
+            time.sleep(3)
+            return
+        try:
+            with self.paced():
+                self.fetch_backend.navigate(url)
+        except FetchTimeoutError as e:
+            raise PageLoadTimeoutError(str(e)) from e
+    
+    def archive_page(self, kind: str, url: Optional[str] = None, html: Optional[str] = None,
+                     tender_id: Optional[str] = None):
+        """Record a fetched page in the page archive when 'archive_pages' is on"""
+        if not self.config["archive_pages"] or (self.fetch_backend is not None and self.fetch_backend.offline):
+            return
+        try:
+            open_archive(self.config["archive_dir"]).record(
+                url or self.page.current_url, self.page.page_source if html is None else html,
+                kind=kind, portal=self.portal_name, status=self.tender_status, tender_id=tender_id)
+        except Exception as e:
+            logging.warning(f"[ARCHIVE] Could not archive {kind} page: {e}")
+    
+    def start_fetch_backend(self) -> Optional[FetchBackend]:
+        """Switch detail pages to the configured non-browser backend; returns it if one was started"""
+        name = self.config["fetch_backend"]
+        if self.fetch_backend is not None or name == "selenium":
+            return None
+        try:
+            self.fetch_backend = create_fetch_backend(name, self.driver, self.config)
+            logging.info(f"[FETCH] Detail pages via the {name} backend")
+            return self.fetch_backend
+        except ImportError as e:
+            logging.warning(f"[FETCH] {name} backend unavailable ({e}), using the browser")
+        except Exception as e:
+            logging.warning(f"[FETCH] Could not start the {name} backend: {e}")
+        return None
+    
+    def stop_fetch_backend(self, backend: Optional[FetchBackend]):
+        """Return to the browser after start_fetch_backend"""
+        if backend is not None:
+            backend.close()
+            if self.fetch_backend is backend:
+                self.fetch_backend = None
+    
+    def extract_aoc_details_enhanced(self, tender_info: TenderRecord) -> TenderRecord:
         """Enhanced extraction focusing on AOC-specific data and PDFs"""
-        if tender_info['Status_Link'] == '<empty>' or not tender_info['Status_Link']:
+        if not tender_info['Status_Link']:
             logging.info(f"No status link for tender {tender_info['Tender ID']}")
             return tender_info
         
-        original_window = self.driver.current_window_handle
+        original_window = self.driver.current_window_handle if self.fetch_backend is None else None
         
         try:
             # Navigate to details page
-            self.driver.get(tender_info['Status_Link'])
-            time.sleep(3)
+            self.open_page(tender_info['Status_Link'])
+            
+            # Don't scrape the portal's error page into the record
+            if self.is_session_expired_page():
+                raise SessionExpiredError(f"Session expired while opening tender {tender_info['Tender ID']}")
+            self.archive_page('detail', tender_info['Status_Link'], tender_id=tender_info['Tender ID'])
             
             # Extract AOC-specific information
             self.extract_aoc_contract_details(tender_info)
@@ -1244,15 +2205,18 @@ class OdishaTenderScraperEnhanced:
             
             logging.info(f"Successfully extracted AOC details for tender {tender_info['Tender ID']}")
             
+        except (SessionExpiredError, PageLoadTimeoutError):
+            raise
         except Exception as e:
             logging.error(f"Error extracting AOC details for {tender_info['Tender ID']}: {e}")
         
         finally:
             # Ensure we're back to the original window
-            try:
-                self.driver.switch_to.window(original_window)
-            except:
-                pass
+            if original_window:
+                try:
+                    self.driver.switch_to.window(original_window)
+                except:
+                    pass
         
         return tender_info
 
@@ -1263,7 +2227,7 @@ class OdishaTenderScraperEnhanced:
             
             # Debug: Check if page contains relevant keywords
             try:
-                page_text = self.driver.page_source.lower()
+                page_text = self.page.page_source.lower()
                 if 'contract' in page_text:
                     logging.info("[DEBUG] Found 'contract' text in page")
                 if 'value' in page_text:
@@ -1292,7 +2256,7 @@ class OdishaTenderScraperEnhanced:
             for i, selector in enumerate(aoc_amount_selectors):
                 try:
                     logging.info(f"[DEBUG] Trying AOC amount selector {i+1}: {selector[:60]}...")
-                    elements = self.driver.find_elements(By.XPATH, selector)
+                    elements = self.page.find_elements(By.XPATH, selector)
                     logging.info(f"[DEBUG] Found {len(elements)} elements with AOC selector {i+1}")
                     
                     for j, element in enumerate(elements[:5]):  # Check first 5 elements
@@ -1301,14 +2265,8 @@ class OdishaTenderScraperEnhanced:
                             logging.info(f"[DEBUG] AOC amount element {j+1} text: '{text}'")
                             
                             if text and any(char.isdigit() for char in text):
-                                # Clean up the amount but preserve INR prefix
-                                import re
-                                if 'INR' in text.upper():
-                                    tender_info['Contract_Value'] = text
-                                else:
-                                    amount = re.sub(r'[^\d.,]', '', text)
-                                    if amount:
-                                        tender_info['Contract_Value'] = f"INR {amount}"
+                                # Raw cell text: units and currency markers are parsed by the normalizer
+                                tender_info['Contract_Value'] = text
                                 contract_found = True
                                 logging.info(f"[SUCCESS] Found contract value from AOC table: '{tender_info['Contract_Value']}'")
                                 break
@@ -1337,7 +2295,7 @@ class OdishaTenderScraperEnhanced:
                 for i, selector in enumerate(amount_selectors):
                     try:
                         logging.info(f"[DEBUG] Trying fallback amount selector {i+1}: {selector[:50]}...")
-                        elements = self.driver.find_elements(By.XPATH, selector)
+                        elements = self.page.find_elements(By.XPATH, selector)
                         logging.info(f"[DEBUG] Found {len(elements)} elements with fallback selector {i+1}")
                         
                         for j, element in enumerate(elements[:10]):  # Check first 10
@@ -1346,14 +2304,8 @@ class OdishaTenderScraperEnhanced:
                                 logging.info(f"[DEBUG] Fallback amount element {j+1} text: '{text}'")
                                 
                                 if text and any(char.isdigit() for char in text):
-                                    # Clean up the amount but preserve formatting
-                                    import re
-                                    if 'INR' in text.upper():
-                                        tender_info['Contract_Value'] = text
-                                    else:
-                                        amount = re.sub(r'[^\d.,]', '', text)
-                                        if amount:
-                                            tender_info['Contract_Value'] = f"INR {amount}"
+                                    # Raw cell text: units and currency markers are parsed by the normalizer
+                                    tender_info['Contract_Value'] = text
                                     contract_found = True
                                     logging.info(f"[SUCCESS] Found contract value via fallback: '{tender_info['Contract_Value']}'")
                                     break
@@ -1387,7 +2339,7 @@ class OdishaTenderScraperEnhanced:
             
             # Add debug: Print page source snippet to understand structure
             try:
-                page_text = self.driver.page_source.lower()
+                page_text = self.page.page_source.lower()
                 if 'awarded' in page_text:
                     logging.info("[DEBUG] Found 'awarded' text in page")
                 if 'bidder' in page_text:
@@ -1413,7 +2365,7 @@ class OdishaTenderScraperEnhanced:
             for i, selector in enumerate(awarded_bids_selectors):
                 try:
                     logging.info(f"[DEBUG] Trying awarded bids selector {i+1}: {selector[:50]}...")
-                    elements = self.driver.find_elements(By.XPATH, selector)
+                    elements = self.page.find_elements(By.XPATH, selector)
                     logging.info(f"[DEBUG] Found {len(elements)} elements with selector {i+1}")
                     
                     for j, element in enumerate(elements[:5]):  # Check first 5 elements
@@ -1459,7 +2411,7 @@ class OdishaTenderScraperEnhanced:
                 for i, selector in enumerate(contractor_selectors):
                     try:
                         logging.info(f"[DEBUG] Trying fallback selector {i+1}: {selector[:50]}...")
-                        element = self.driver.find_element(By.XPATH, selector)
+                        element = self.page.find_element(By.XPATH, selector)
                         if element and element.text.strip():
                             text = element.text.strip()
                             if len(text) > 3 and ' ' in text:  # Basic name validation
@@ -1476,7 +2428,7 @@ class OdishaTenderScraperEnhanced:
                 logging.info("[DEBUG] Trying generic name pattern extraction...")
                 try:
                     # Look for cells containing names (multiple words, proper case)
-                    name_candidates = self.driver.find_elements(By.XPATH, "//td[string-length(text()) > 10 and contains(text(), ' ')]")
+                    name_candidates = self.page.find_elements(By.XPATH, "//td[string-length(text()) > 10 and contains(text(), ' ')]")
                     logging.info(f"[DEBUG] Found {len(name_candidates)} potential name candidates")
                     
                     for candidate in name_candidates[:20]:  # Check first 20
@@ -1512,7 +2464,7 @@ class OdishaTenderScraperEnhanced:
             
             for selector in email_selectors:
                 try:
-                    element = self.driver.find_element(By.XPATH, selector)
+                    element = self.page.find_element(By.XPATH, selector)
                     if element:
                         email = element.text.strip() if 'mailto:' not in selector else element.get_attribute('href').replace('mailto:', '')
                         if '@' in email:
@@ -1530,7 +2482,7 @@ class OdishaTenderScraperEnhanced:
             
             for selector in mobile_selectors:
                 try:
-                    element = self.driver.find_element(By.XPATH, selector)
+                    element = self.page.find_element(By.XPATH, selector)
                     if element:
                         mobile = element.text.strip()
                         if any(char.isdigit() for char in mobile):
@@ -1548,7 +2500,7 @@ class OdishaTenderScraperEnhanced:
             
             for selector in gst_selectors:
                 try:
-                    element = self.driver.find_element(By.XPATH, selector)
+                    element = self.page.find_element(By.XPATH, selector)
                     if element:
                         gst = element.text.strip()
                         if len(gst) >= 10:  # GST numbers are typically 15 characters
@@ -1571,7 +2523,7 @@ class OdishaTenderScraperEnhanced:
             
             # Debug: Check if page contains PDF-related keywords
             try:
-                page_text = self.driver.page_source.lower()
+                page_text = self.page.page_source.lower()
                 if '.pdf' in page_text:
                     logging.info("[DEBUG] Found '.pdf' text in page")
                 if 'document' in page_text:
@@ -1595,7 +2547,7 @@ class OdishaTenderScraperEnhanced:
             # First priority: Find AOC-specific PDFs
             for selector in aoc_pdf_selectors:
                 try:
-                    aoc_links = self.driver.find_elements(By.XPATH, selector)
+                    aoc_links = self.page.find_elements(By.XPATH, selector)
                     for link in aoc_links:
                         try:
                             if link.is_displayed():
@@ -1640,7 +2592,7 @@ class OdishaTenderScraperEnhanced:
                 pdf_links = []
                 for selector in general_pdf_selectors:
                     try:
-                        links = self.driver.find_elements(By.XPATH, selector)
+                        links = self.page.find_elements(By.XPATH, selector)
                         pdf_links.extend(links)
                     except:
                         continue
@@ -1669,7 +2621,7 @@ class OdishaTenderScraperEnhanced:
                     else:
                         tender_info['PDF_Details'] = '<download_failed>'
             
-            if not aoc_pdf_found and tender_info['AOC_PDF_File'] == '<empty>':
+            if not aoc_pdf_found and not tender_info['AOC_PDF_File']:
                 logging.warning(f"No AOC PDF found for tender {tender_info['Tender ID']}")
             
         except Exception as e:
@@ -1677,13 +2629,17 @@ class OdishaTenderScraperEnhanced:
             import traceback
             logging.debug(f"[TRACEBACK] {traceback.format_exc()}")
 
-    def save_to_excel_format_compliant(self, tender_data: List[Dict]) -> bool:
+    def save_to_excel_format_compliant(self, tender_data: List[TenderRecord]) -> bool:
         """Save data to Excel following the exact format from FORMAT AUGUST 2025.xlsx"""
         try:
             if not tender_data:
                 logging.error("No data to save")
                 return False
             
+            # Normalize contract values for the whole batch at once
+            apply_contract_value_normalization(tender_data)
+            tender_data = records_to_dicts(tender_data)
+            
             # Prepare data in the exact format required
             formatted_data = []
             
@@ -1708,7 +2664,10 @@ class OdishaTenderScraperEnhanced:
                     'TENDER ID': tender.get('Tender ID', ''),
                     'LAST ENTRY DATE': datetime.now().strftime('%Y-%m-%d'),
                     'EXISTING CUSTOMER': '',  # For tracking
-                    'Details ': self.format_details_column(tender)  # Combined details with trailing space to match CSV
+                    'Details ': self.format_details_column(tender),  # Combined details with trailing space to match CSV
+                    # Numeric amount appended after the FORMAT AUGUST 2025 columns for sorting/filtering
+                    'AMOUNT (INR)': tender.get(VALUE_COLUMN),
+                    'AMOUNT CONFIDENCE': tender.get(CONFIDENCE_COLUMN)
                 }
                 
                 formatted_data.append(formatted_record)
@@ -1755,6 +2714,10 @@ class OdishaTenderScraperEnhanced:
                 'records_with_contractor_info': len([t for t in tender_data if t.get('Contractor_Name', '<empty>') != '<empty>']),
                 'records_with_contract_value': len([t for t in tender_data if t.get('Contract_Value', '<empty>') != '<empty>']),
                 'records_with_email': len([t for t in tender_data if t.get('Email', '<empty>') != '<empty>']),
+                'records_without_details': len(self.failed_tenders),
+                'tenders_without_details': self.failed_tenders,
+                'total_contract_value_inr': float(df['AMOUNT (INR)'].sum()),
+                'contract_value_confidence': df['AMOUNT CONFIDENCE'].value_counts().to_dict(),
                 'max_records_requested': self.max_records
             }
             
@@ -1821,8 +2784,9 @@ class OdishaTenderScraperEnhanced:
         # Join all parts with separator
         return ' | '.join(details_parts) if details_parts else ''
 
-    def run_scraper_paginated(self) -> bool:
-        """Main method with pagination support and format compliance"""
+    def run_scraper_paginated(self, search=None) -> bool:
+        """Main method with pagination support and format compliance (manual captcha unless search is given)"""
+        search = search or self.search_tenders_manual
         try:
             logging.info(f"[ROCKET] [START] Starting Enhanced Odisha Tender Scraper (Target: {self.max_records} records)...")
             
@@ -1840,15 +2804,15 @@ class OdishaTenderScraperEnhanced:
                 logging.error("[ERROR] Failed to load initial page")
                 return False
             
-            # Set tender status to AOC
-            logging.info("[CONFIG] Setting tender status to AOC...")
-            if not self.set_tender_status_aoc():
-                logging.error("[ERROR] Failed to set tender status to AOC")
+            # Set tender status (AOC by default)
+            logging.info(f"[CONFIG] Setting tender status to {self.tender_status}...")
+            if not self.fill_search_form():
+                logging.error(f"[ERROR] Failed to set tender status to {self.tender_status}")
                 return False
             
-            # Search for tenders with manual captcha
-            logging.info("[SEARCH] Starting search with manual captcha...")
-            if not self.search_tenders_manual():
+            # Search for tenders (manual captcha by default)
+            logging.info(f"[SEARCH] Starting search with {search.__name__}...")
+            if not search():
                 logging.error("[ERROR] Failed to search for tenders")
                 return False
             
@@ -1861,10 +2825,7 @@ class OdishaTenderScraperEnhanced:
             
             # Extract detailed AOC information
             logging.info(f"[SEARCH] [DETAILS] Extracting detailed AOC information for {len(tender_data)} tenders...")
-            for i, tender in enumerate(tender_data):
-                logging.info(f"Processing tender {i+1}/{len(tender_data)}: {tender['Tender ID']}")
-                tender_data[i] = self.extract_aoc_details_enhanced(tender)
-                time.sleep(self.config["delay_between_requests"])
+            tender_data = self.process_tender_details(tender_data)
             
             # Save to Excel in format-compliant structure
             logging.info("[SAVE] Saving data to Excel in FORMAT AUGUST 2025 compliance...")
@@ -1886,7 +2847,7 @@ class OdishaTenderScraperEnhanced:
             return False
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logging.info("[CLOSED] Browser closed")
     
     def run_scraper_paginated_with_gui_captcha(self) -> bool:
@@ -1908,10 +2869,10 @@ class OdishaTenderScraperEnhanced:
                 logging.error("❌ Failed to load initial page")
                 return False
             
-            # Set tender status to AOC
-            logging.info("⚙️ [CONFIG] Setting tender status to AOC...")
-            if not self.set_tender_status_aoc():
-                logging.error("❌ Failed to set tender status to AOC")
+            # Set tender status (AOC by default)
+            logging.info(f"⚙️ [CONFIG] Setting tender status to {self.tender_status}...")
+            if not self.fill_search_form():
+                logging.error(f"❌ Failed to set tender status to {self.tender_status}")
                 return False
             
             # Search for tenders with GUI captcha
@@ -1929,10 +2890,7 @@ class OdishaTenderScraperEnhanced:
             
             # Extract detailed AOC information
             logging.info(f"🔍 [DETAILS] Extracting detailed AOC information for {len(tender_data)} tenders...")
-            for i, tender in enumerate(tender_data):
-                logging.info(f"Processing tender {i+1}/{len(tender_data)}: {tender['Tender ID']}")
-                tender_data[i] = self.extract_aoc_details_enhanced(tender)
-                time.sleep(self.config["delay_between_requests"])
+            tender_data = self.process_tender_details(tender_data)
             
             # Save to Excel in format-compliant structure
             logging.info("💾 [SAVE] Saving data to Excel in FORMAT AUGUST 2025 compliance...")
@@ -1954,11 +2912,18 @@ class OdishaTenderScraperEnhanced:
             return False
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logging.info("🔒 Browser closed")
     
-    def set_tender_status_aoc(self) -> bool:
-        """Set tender status to AOC with retry logic"""
+    def set_tender_status(self, status: Optional[str] = None) -> bool:
+        """Select a tender status (default: this run's status) with retry logic"""
+        status = status or self.tender_status
+        # Try different possible values for the status
+        if status.upper() == "AOC":
+            status_values = ["AOC", "aoc", "AOC_STATUS", "ACCEPTED"]
+        else:
+            status_values = [status, status.upper(), status.lower()]
+        
         for attempt in range(self.config["max_retries"]):
             try:
                 dropdown = self.wait_for_element(By.NAME, "tenderStatus")
@@ -1967,31 +2932,28 @@ class OdishaTenderScraperEnhanced:
                 
                 select = Select(dropdown)
                 
-                # Try different possible values for AOC
-                aoc_values = ["AOC", "aoc", "AOC_STATUS", "ACCEPTED"]
-                
-                for value in aoc_values:
+                for value in status_values:
                     try:
                         select.select_by_value(value)
-                        logging.info(f"Tender status set to AOC (value: {value})")
+                        logging.info(f"Tender status set to {status} (value: {value})")
                         return True
                     except:
                         try:
                             select.select_by_visible_text(value)
-                            logging.info(f"Tender status set to AOC (text: {value})")
+                            logging.info(f"Tender status set to {status} (text: {value})")
                             return True
                         except:
                             continue
                 
-                # If direct selection fails, try selecting by index or visible text
+                # If direct selection fails, try a partial match on the visible text
                 options = select.options
                 for option in options:
-                    if "AOC" in option.text.upper():
+                    if status.upper() in option.text.upper():
                         select.select_by_visible_text(option.text)
                         logging.info(f"Tender status set to: {option.text}")
                         return True
                 
-                logging.warning(f"AOC selection attempt {attempt + 1} failed")
+                logging.warning(f"{status} selection attempt {attempt + 1} failed")
                 time.sleep(2)
                 
             except Exception as e:
@@ -1999,87 +2961,96 @@ class OdishaTenderScraperEnhanced:
         
         return False
     
-    def search_tenders(self) -> bool:
-        """Submit search with enhanced error handling"""
+    def apply_search_filters(self) -> bool:
+        """Fill the date window / organisation filters of a partitioned crawl"""
+        if not self.search_filters:
+            return True
+        fields = self.config["search_filter_fields"]
         try:
-            # Handle captcha
-            if not self.handle_captcha_enhanced():
-                return False
-            
-            # Small delay before clicking search
-            time.sleep(2)
+            if self.search_filters.get("organisation"):
+                dropdown = self.wait_for_element(By.NAME, fields["organisation"])
+                if not dropdown or not self.select_option(dropdown, self.search_filters["organisation"]):
+                    logging.error(f"[PARTITION] Organisation not found: {self.search_filters['organisation']}")
+                    return False
             
-            # Find and click search button with multiple selectors
-            search_selectors = [
-                (By.XPATH, "//input[@value='Search']"),
-                (By.XPATH, "//button[contains(text(), 'Search')]"),
-                (By.XPATH, "//input[@type='submit'][contains(@value, 'Search')]"),
-                (By.ID, "searchButton"),
-                (By.NAME, "search")
-            ]
+            if self.search_filters.get("from_date") or self.search_filters.get("to_date"):
+                criteria = self.wait_for_element(By.NAME, fields["date_criteria"], timeout=5)
+                if criteria:
+                    self.select_option(criteria, self.config["backfill_date_criteria"])
+                for key in ("from_date", "to_date"):
+                    if not self.search_filters.get(key):
+                        continue
+                    date_input = self.wait_for_element(By.NAME, fields[key])
+                    if not date_input:
+                        return False
+                    # Date pickers are usually read-only, so set the value directly
+                    self.driver.execute_script("arguments[0].value = arguments[1];",
+                                               date_input, self.search_filters[key])
             
-            search_button = None
-            for by, value in search_selectors:
-                try:
-                    search_button = self.driver.find_element(by, value)
-                    if search_button and search_button.is_displayed():
-                        break
-                except:
-                    continue
+            logging.info(f"[PARTITION] Search filters applied: {self.search_filters.get('label', self.search_filters)}")
+            return True
+        except Exception as e:
+            logging.error(f"Error applying search filters: {e}")
+            return False
+    
+    def select_option(self, dropdown, text: str) -> bool:
+        """Select a dropdown option by exact, then partial, visible text"""
+        select = Select(dropdown)
+        try:
+            select.select_by_visible_text(text)
+            return True
+        except Exception:
+            pass
+        for option in select.options:
+            if text.lower() in option.text.lower():
+                select.select_by_visible_text(option.text)
+                return True
+        return False
+    
+    def fill_search_form(self) -> bool:
+        """Select the run's tender status and any partition filters"""
+        return self.set_tender_status() and self.apply_search_filters()
+    
+    def set_tender_status_aoc(self) -> bool:
+        """Set tender status to AOC with retry logic"""
+        return self.set_tender_status("AOC")
+    
+    def search_tenders(self) -> bool:
+        """Submit search with enhanced error handling"""
+        self.active_search = self.search_tenders
+        try:
+            # Skip the captcha when a saved session is still accepted by the portal
+            if self.search_with_saved_session():
+                return True
             
-            if not search_button:
-                logging.error("Search button not found")
+            # Handle captcha
+            if not self.submit_captcha_search(self.handle_captcha_enhanced):
                 return False
             
-            # Scroll to search button if needed
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-            time.sleep(0.5)
-            
-            # Click search button
-            try:
-                search_button.click()
-                logging.info("Search button clicked")
-            except:
-                # If normal click fails, try JavaScript click
-                self.driver.execute_script("arguments[0].click();", search_button)
-                logging.info("Search button clicked via JavaScript")
+            logging.info("Search completed successfully")
+            self.save_session()
+            self.store_captcha_fixture()
+            return True
             
-            # Wait for results with enhanced detection
-            results_found = False
-            for attempt in range(5):  # Increased attempts
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.any_of(
-                            EC.presence_of_element_located((By.CLASS_NAME, "list-table")),
-                            EC.presence_of_element_located((By.XPATH, "//table")),
-                            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'tender')]")),
-                            EC.presence_of_element_located((By.XPATH, "//td[contains(text(), 'Tender ID')]")),
-                            EC.presence_of_element_located((By.XPATH, "//th[contains(text(), 'S.No')]"))
-                        )
-                    )
-                    results_found = True
-                    break
-                except:
-                    logging.warning(f"Results loading attempt {attempt + 1} failed, retrying...")
-                    time.sleep(3)
+        except Exception as e:
+            logging.error(f"Error during search: {e}")
+            return False
+    
+    def search_tenders_offline(self) -> bool:
+        """Submit search with the offline captcha solver only, for unattended runs"""
+        self.active_search = self.search_tenders_offline
+        try:
+            # Skip the captcha when a saved session is still accepted by the portal
+            if self.search_with_saved_session():
+                return True
             
-            if not results_found:
-                # Check if there's an error message or no results
-                try:
-                    error_elements = self.driver.find_elements(By.XPATH, 
-                        "//div[contains(@class, 'error')] | //span[contains(@class, 'error')] | "
-                        "//div[contains(text(), 'error')] | //div[contains(text(), 'No records found')]")
-                    if error_elements:
-                        error_text = error_elements[0].text
-                        logging.error(f"Website error/message: {error_text}")
-                        return False
-                except:
-                    pass
-                
-                logging.error("No results found after search - possibly incorrect captcha or no data available")
+            if not self.submit_captcha_search(None):
+                logging.error("Offline captcha solver could not get past the captcha")
                 return False
             
-            logging.info("Search completed successfully")
+            logging.info("Search completed successfully with the offline captcha solver")
+            self.save_session()
+            self.store_captcha_fixture()
             return True
             
         except Exception as e:
@@ -2166,15 +3137,15 @@ class OdishaTenderScraperEnhanced:
             logging.error(f"Error extracting tender list: {e}")
             return []
     
-    def safe_get_text(self, cells: list, index: int) -> str:
+    def safe_get_text(self, cells: list, index: int, empty: Optional[str] = '<empty>') -> Optional[str]:
         """Safely extract text from table cell"""
         try:
             if index < len(cells):
                 text = cells[index].text.strip()
-                return text if text else '<empty>'
-            return '<empty>'
+                return text if text else empty
+            return empty
         except:
-            return '<empty>'
+            return empty
     
     def extract_tender_details(self, tender_info: Dict) -> Dict:
         """Extract detailed information with enhanced error handling"""
@@ -2186,7 +3157,7 @@ class OdishaTenderScraperEnhanced:
         
         try:
             # Navigate to details page
-            self.driver.get(tender_info['Status_Link'])
+            self.timed_get(tender_info['Status_Link'])
             time.sleep(3)
             
             # Extract basic tender information
@@ -2248,16 +3219,7 @@ class OdishaTenderScraperEnhanced:
             
             for selector in stage_selectors:
                 try:
-                    tables = self.driver.find_elements(By.XPATH, selector)
-                    for table in tables:
-                        rows = table.find_elements(By.TAG_NAME, "tr")
-                        for row in rows:
-                            cells = row.find_elements(By.TAG_NAME, "td")
-                            if len(cells) >= 2:
-                                col1 = cells[0].text.strip()
-                                col2 = cells[1].text.strip()
-                                if col1 and col2 and col1 != col2:
-                                    stage_data.append(f"{col1}: {col2}")
+                    stage_data = cell_pairs(self.read_tables(selector), distinct=True)
                     break
                 except:
                     continue
@@ -2269,7 +3231,7 @@ class OdishaTenderScraperEnhanced:
             logging.debug(f"Could not extract stage summary: {e}")
     
     def extract_detailed_stage_summary(self, tender_info: Dict):
-        """Extract detailed stage summary by clicking the details link"""
+        """Extract detailed stage summary by fetching the details link's target directly"""
         try:
             # Look for stage summary details link
             details_selectors = [
@@ -2282,59 +3244,132 @@ class OdishaTenderScraperEnhanced:
             details_link = None
             for selector in details_selectors:
                 try:
-                    details_link = self.driver.find_element(By.XPATH, selector)
+                    details_link = self.page.find_element(By.XPATH, selector)
                     if details_link.is_displayed():
                         break
                 except:
                     continue
             
-            if details_link:
-                # Store current window handles
-                original_windows = self.driver.window_handles
-                
-                # Click the link
-                self.driver.execute_script("arguments[0].click();", details_link)
-                time.sleep(3)
-                
-                # Check if new window/tab opened
-                new_windows = self.driver.window_handles
-                if len(new_windows) > len(original_windows):
-                    # Switch to new window
-                    new_window = [w for w in new_windows if w not in original_windows][0]
-                    self.driver.switch_to.window(new_window)
-                
-                # Extract additional details
-                additional_data = []
-                try:
-                    tables = self.driver.find_elements(By.TAG_NAME, "table")
-                    for table in tables:
-                        rows = table.find_elements(By.TAG_NAME, "tr")
-                        for row in rows:
-                            cells = row.find_elements(By.TAG_NAME, "td")
-                            if len(cells) >= 2:
-                                col1 = cells[0].text.strip()
-                                col2 = cells[1].text.strip()
-                                if col1 and col2:
-                                    additional_data.append(f"{col1}: {col2}")
-                
-                    if additional_data:
-                        current_data = tender_info['Stage_Summary_Data']
-                        if current_data != '<empty>':
-                            tender_info['Stage_Summary_Data'] = current_data + " | " + " | ".join(additional_data[:5])
-                        else:
-                            tender_info['Stage_Summary_Data'] = " | ".join(additional_data[:5])
-                
-                except Exception as e:
-                    logging.debug(f"Error extracting detailed stage data: {e}")
-                
-                # Close new window if opened
-                if len(new_windows) > len(original_windows):
-                    self.driver.close()
-                    self.driver.switch_to.window(original_windows[0])
+            if not details_link:
+                return
+            
+            details_url = self.resolve_link_target(details_link)
+            if details_url:
+                html = self.fetch_page_source(details_url)
+            elif self.fetch_backend is None:
+                # Script-only links still open their page when clicked
+                logging.info(f"Stage summary link of tender {tender_info['Tender ID']} has no resolvable target, clicking it")
+                details_url, html = self.click_for_page_source(details_link)
+            else:
+                logging.warning(f"Stage summary link of tender {tender_info['Tender ID']} has no resolvable target "
+                                f"and needs the browser; stage summary details skipped")
+                return
+            if not html:
+                return
+            self.archive_page('stage', details_url, html, tender_id=tender_info['Tender ID'])
+            
+            # Parse the details page offline instead of walking it through the driver
+            additional_data = cell_pairs(parse_tables(html))
+            
+            if additional_data:
+                current_data = tender_info['Stage_Summary_Data']
+                if current_data and current_data != '<empty>':
+                    tender_info['Stage_Summary_Data'] = current_data + " | " + " | ".join(additional_data[:5])
+                else:
+                    tender_info['Stage_Summary_Data'] = " | ".join(additional_data[:5])
         
+        except (SessionExpiredError, PageLoadTimeoutError):
+            raise
         except Exception as e:
             logging.debug(f"Could not extract detailed stage summary: {e}")
     
+    def click_for_page_source(self, link) -> Tuple[str, str]:
+        """URL and HTML of the page a link opens, by clicking it in the browser
+
+        A new window is read and closed again; a link that navigates in
+        place leaves the browser on its target.
+        """
+        original_window = self.driver.current_window_handle
+        original_windows = self.driver.window_handles
+        with self.paced(), self.browser_call("Opening a link by clicking it"):
+            self.driver.execute_script("arguments[0].click();", link)
+        time.sleep(3)
+        new_windows = [w for w in self.driver.window_handles if w not in original_windows]
+        if new_windows:
+            self.driver.switch_to.window(new_windows[0])
+        try:
+            if self.is_session_expired_page():
+                raise SessionExpiredError(f"Session expired while opening {self.driver.current_url}")
+            return self.driver.current_url, self.driver.page_source
+        finally:
+            if new_windows:
+                self.driver.close()
+                self.driver.switch_to.window(original_window)
+    
+    def read_tables(self, xpath: Optional[str] = None) -> List[List[List[str]]]:
+        """Cell text of the page's tables (or those matching xpath) in a single script call"""
+        with self.browser_call("Reading page tables"):
+            return self.page.read_tables(xpath)
+    
+    def resolve_link_target(self, link) -> Optional[str]:
+        """Absolute URL a link would open, from its href or its onclick/javascript: handler"""
+        href = (link.get_attribute('href') or '').strip()
+        if href and not href.lower().startswith('javascript:') and not href.endswith('#'):
+            return urljoin(self.page.current_url, href)
+        
+        # window.open('...') / location.href='...' style handlers
+        script = ' '.join(filter(None, [link.get_attribute('onclick'), href]))
+        for candidate in re.findall(r"""['"]([^'"\s]+)['"]""", script):
+            if candidate.startswith(('http', '/', '?')) or '?' in candidate or candidate.endswith(('.jsp', '.htm', '.html')):
+                return urljoin(self.page.current_url, candidate)
+        return None
+    
+    def get_http_session(self):
+        """requests session carrying the browser's current cookies and user agent"""
+        if isinstance(self.fetch_backend, HttpBackend):
+            return self.fetch_backend.session
+        if self.http_session is None:
+            self.http_session = requests.Session()
+            try:
+                user_agent = self.driver.execute_script("return navigator.userAgent;")
+                if user_agent:
+                    self.http_session.headers['User-Agent'] = user_agent
+            except Exception as e:
+                logging.debug(f"Could not read the browser user agent: {e}")
+        # Cookies change on re-authentication and browser recycling
+        self.http_session.cookies.clear()
+        SessionCache.apply_to_requests(self.http_session, self.driver.get_cookies())
+        return self.http_session
+    
+    def fetch_page_source(self, url: str) -> Optional[str]:
+        """HTML of a portal page without opening a window
+
+        Fetched over HTTP with the browser's session cookies when
+        'stage_summary_fetch' is "http", falling back to an in-place
+        driver.get if the portal refuses the request.
+        """
+        if self.fetch_backend is not None:
+            with self.paced():
+                return self.fetch_backend.fetch(url)
+        if self.config["stage_summary_fetch"] == "http":
+            try:
+                with self.paced():
+                    response = self.get_http_session().get(url, timeout=self.config["timeout_seconds"])
+                markers = self.config.get("session_expired_markers", [])
+                stale = 'StaleSession' in response.url or 'StaleLink' in response.url or \
+                    any(marker in response.text.lower() for marker in markers)
+                if response.status_code < 400 and not stale:
+                    return response.text
+                logging.debug(f"HTTP fetch of {url} refused (HTTP {response.status_code}), using the browser")
+            except Exception as e:
+                logging.debug(f"HTTP fetch of {url} failed ({e}), using the browser")
+        
+        with self.paced():
+            self.timed_get(url)
+        if self.is_session_expired_page():
+            raise SessionExpiredError(f"Session expired while opening {url}")
+        return self.driver.page_source
+    
     def download_tender_pdfs(self, tender_info: Dict):
         """Download PDF files associated with the tender"""
         try:
@@ -2385,15 +3420,22 @@ class OdishaTenderScraperEnhanced:
             if not pdf_url.startswith('http'):
                 pdf_url = urljoin(self.base_url, pdf_url)
             
-            # Get session cookies from selenium
-            cookies = self.driver.get_cookies()
-            session = requests.Session()
-            for cookie in cookies:
-                session.cookies.set(cookie['name'], cookie['value'])
-            
-            # Download with timeout
-            response = session.get(pdf_url, timeout=30)
-            response.raise_for_status()
+            if self.fetch_backend is not None and self.fetch_backend.offline:
+                logging.debug(f"Not downloading {pdf_url} while replaying")
+                return None
+            
+            content = None
+            self.rate_limiter.touch()
+            if self.config["capture_pdfs_from_network"] and self.fetch_backend is None:
+                content = self.capture_pdf(pdf_url)
+            if content is None:
+                # Session cookies from selenium (or the HTTP backend's session)
+                session = self.get_http_session()
+                
+                # Download with its own timeout, outside the tender's browser deadline
+                response = session.get(pdf_url, timeout=self.config["pdf_timeout_seconds"])
+                response.raise_for_status()
+                content = response.content
             
             # Generate filename
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -2402,7 +3444,7 @@ class OdishaTenderScraperEnhanced:
             
             # Save file
             with open(filepath, 'wb') as f:
-                f.write(response.content)
+                f.write(content)
             
             logging.info(f"Downloaded PDF: {filename}")
             return filename
@@ -2411,6 +3453,17 @@ class OdishaTenderScraperEnhanced:
             logging.warning(f"Failed to download PDF {pdf_url}: {e}")
             return None
     
+    def capture_pdf(self, pdf_url: str) -> Optional[bytes]:
+        """PDF bytes taken from the browser itself, or None to download them separately"""
+        try:
+            # A recycled browser needs its own capture
+            if self.network_capture is None or self.network_capture.driver is not self.driver:
+                self.network_capture = NetworkCapture(self.driver)
+            return self.network_capture.get_pdf(pdf_url)
+        except Exception as e:
+            logging.debug(f"[CAPTURE] Could not take {pdf_url} from the browser: {e}")
+            return None
+    
     def save_to_excel_enhanced(self, tender_data: List[Dict]) -> bool:
         """Save data to Excel with enhanced formatting"""
         try:
@@ -2496,10 +3549,10 @@ class OdishaTenderScraperEnhanced:
                 logging.error("Failed to load initial page")
                 return False
             
-            # Set tender status to AOC
-            logging.info("[CONFIG] Setting tender status to AOC...")
-            if not self.set_tender_status_aoc():
-                logging.error("Failed to set tender status to AOC")
+            # Set tender status (AOC by default)
+            logging.info(f"[CONFIG] Setting tender status to {self.tender_status}...")
+            if not self.fill_search_form():
+                logging.error(f"Failed to set tender status to {self.tender_status}")
                 return False
             
             # Search for tenders
@@ -2542,7 +3595,7 @@ class OdishaTenderScraperEnhanced:
             return False
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logging.info("Browser closed")
 
     def run_scraper_paginated_with_auto_captcha(self) -> bool:
@@ -2564,10 +3617,10 @@ class OdishaTenderScraperEnhanced:
                 logging.error("[ERROR] Failed to load initial page")
                 return False
             
-            # Set tender status to AOC
-            logging.info("[CONFIG] Setting tender status to AOC...")
-            if not self.set_tender_status_aoc():
-                logging.error("[ERROR] Failed to set tender status to AOC")
+            # Set tender status (AOC by default)
+            logging.info(f"[CONFIG] Setting tender status to {self.tender_status}...")
+            if not self.fill_search_form():
+                logging.error(f"[ERROR] Failed to set tender status to {self.tender_status}")
                 return False
             
             # Search for tenders with automatic captcha
@@ -2585,10 +3638,7 @@ class OdishaTenderScraperEnhanced:
             
             # Extract detailed AOC information
             logging.info(f"[SEARCH] [DETAILS] Extracting detailed AOC information for {len(tender_data)} tenders...")
-            for i, tender in enumerate(tender_data):
-                logging.info(f"Processing tender {i+1}/{len(tender_data)}: {tender['Tender ID']}")
-                tender_data[i] = self.extract_aoc_details_enhanced(tender)
-                time.sleep(self.config["delay_between_requests"])
+            tender_data = self.process_tender_details(tender_data)
             
             # Save to Excel in format-compliant structure
             logging.info("[SAVE] Saving data to Excel in FORMAT AUGUST 2025 compliance...")
@@ -2607,7 +3657,7 @@ class OdishaTenderScraperEnhanced:
             return False
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logging.info("Browser closed")
 
     def run_scraper_paginated_with_gui_captcha(self) -> bool:
@@ -2629,10 +3679,10 @@ class OdishaTenderScraperEnhanced:
                 logging.error("[ERROR] Failed to load initial page")
                 return False
             
-            # Set tender status to AOC
-            logging.info("[CONFIG] Setting tender status to AOC...")
-            if not self.set_tender_status_aoc():
-                logging.error("[ERROR] Failed to set tender status to AOC")
+            # Set tender status (AOC by default)
+            logging.info(f"[CONFIG] Setting tender status to {self.tender_status}...")
+            if not self.fill_search_form():
+                logging.error(f"[ERROR] Failed to set tender status to {self.tender_status}")
                 return False
             
             # Search for tenders with GUI captcha
@@ -2650,10 +3700,7 @@ class OdishaTenderScraperEnhanced:
             
             # Extract detailed AOC information
             logging.info(f"[SEARCH] [DETAILS] Extracting detailed AOC information for {len(tender_data)} tenders...")
-            for i, tender in enumerate(tender_data):
-                logging.info(f"Processing tender {i+1}/{len(tender_data)}: {tender['Tender ID']}")
-                tender_data[i] = self.extract_aoc_details_enhanced(tender)
-                time.sleep(self.config["delay_between_requests"])
+            tender_data = self.process_tender_details(tender_data)
             
             # Save to Excel in format-compliant structure
             logging.info("[SAVE] Saving data to Excel in FORMAT AUGUST 2025 compliance...")
@@ -2672,9 +3719,105 @@ class OdishaTenderScraperEnhanced:
             return False
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logging.info("Browser closed")
 
+def run_with_captcha_method(scraper: OdishaTenderScraperEnhanced, captcha_method: str) -> bool:
+    """Run the paginated scraper with the given captcha method"""
+    if captcha_method == 'auto':
+        print("Using automatic captcha method...")
+        return scraper.run_scraper_paginated_with_auto_captcha()
+    elif captcha_method == 'manual':
+        print("Using manual captcha method (RECOMMENDED)...")
+        return scraper.run_scraper_paginated()
+    elif captcha_method == 'offline':
+        print("Using the offline captcha solver only...")
+        return scraper.run_scraper_paginated(scraper.search_tenders_offline)
+    else:
+        print("Using GUI captcha method...")
+        return scraper.run_scraper_paginated_with_gui_captcha()
+
+def run_batch(scraper: OdishaTenderScraperEnhanced, captcha_method: str, ndjson_path: Optional[str]) -> bool:
+    """Run without prompts, streaming enriched tenders as NDJSON"""
+    import contextlib
+    from utils.ndjson_writer import NDJSONWriter
+    
+    if not ndjson_path:
+        return run_with_captcha_method(scraper, captcha_method)
+    
+    # Keep stdout clean for the JSON lines; progress prints go to stderr instead
+    writer = NDJSONWriter(ndjson_path, stream=sys.stdout if ndjson_path == '-' else None)
+    scraper.on_record_enriched = writer.write
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            return run_with_captcha_method(scraper, captcha_method)
+    finally:
+        writer.close()
+
+def run_multi_portal(scraper: OdishaTenderScraperEnhanced, config_file: str, captcha_method: str,
+                     ndjson_path: Optional[str], store_path: Optional[str],
+                     all_portals: bool = True, statuses: Optional[List[str]] = None,
+                     partitions: Optional[List[Dict]] = None) -> bool:
+    """Scrape portals, tender statuses and backfill partitions in parallel sessions into one store"""
+    import contextlib
+    from scraper.parallel_runner import run_portals
+    from utils.tender_store import TenderStore
+    
+    if all_portals:
+        portals = scraper.config.get("portals") or []
+        if not portals:
+            logging.error("[ERROR] No portals configured - add a 'portals' list to the config file")
+            return False
+    else:
+        portals = [{"name": scraper.portal_name, "base_url": scraper.base_url, "target_url": scraper.target_url}]
+    
+    store = TenderStore(store_path or scraper.config["store_file"])
+    writer = None
+    if ndjson_path:
+        from utils.ndjson_writer import NDJSONWriter
+        writer = NDJSONWriter(ndjson_path, stream=sys.stdout if ndjson_path == '-' else None)
+    try:
+        # Keep stdout clean for the JSON lines when streaming to it
+        output = contextlib.redirect_stdout(sys.stderr) if ndjson_path == '-' else contextlib.nullcontext()
+        with output:
+            results = run_portals(portals, config_file, scraper.max_records, captcha_method, store,
+                                  max_workers=scraper.config["max_parallel_sessions"],
+                                  overrides={key: scraper.config[key] for key in
+                                             ("headless_mode", "archive_pages", "archive_dir")},
+                                  on_record=writer.write if writer else None,
+                                  statuses=statuses or scraper.config["tender_statuses"],
+                                  partitions=partitions)
+        scraper.excel_file = scraper.excel_file.replace('.xlsx', '_merged.xlsx')
+        store.export_excel(scraper.excel_file)
+        return any(count > 0 for count in results.values())
+    finally:
+        if writer:
+            writer.close()
+        store.close()
+
+def run_reprocess(scraper: OdishaTenderScraperEnhanced, config_file: str,
+                  archive_dir: Optional[str], store_path: Optional[str]) -> bool:
+    """Rerun the extractors over the page archive and rewrite the store, without network access"""
+    from scraper.reprocessor import reprocess_archive
+    from utils.page_archive import INDEX_FILE
+    from utils.tender_store import TenderStore
+    
+    archive_dir = archive_dir or scraper.config["archive_dir"]
+    if not os.path.exists(os.path.join(archive_dir, INDEX_FILE)):
+        logging.error(f"[ERROR] No page archive in {archive_dir} - record one with archive_pages or --archive")
+        return False
+    
+    archive = open_archive(archive_dir)
+    store = TenderStore(store_path or scraper.config["store_file"])
+    try:
+        count = reprocess_archive(archive, store, config_file, scraper.config["max_parallel_sessions"])
+        scraper.excel_file = scraper.excel_file.replace('.xlsx', '_reprocessed.xlsx')
+        store.export_excel(scraper.excel_file)
+        return count > 0
+    finally:
+        store.close()
+        archive.close()
+
 def main():
     """Main function with command line interface"""
     import argparse
@@ -2686,66 +3829,130 @@ def main():
                        help='Run in headless mode')
     parser.add_argument('--records', type=int, 
                        help='Number of records to scrape')
+    parser.add_argument('--captcha', choices=['auto', 'manual', 'gui', 'offline'],
+                       help="Captcha handling method (skips the interactive prompt); "
+                            "'offline' uses only the configured captcha_solver and never asks a person")
+    parser.add_argument('--batch', action='store_true',
+                       help='Non-interactive mode: never prompt (requires --captcha offline)')
+    parser.add_argument('--ndjson', metavar='PATH',
+                       help="Stream one JSON line per enriched tender to PATH ('-' for stdout)")
+    parser.add_argument('--portals', action='store_true',
+                       help="Scrape all portals listed under 'portals' in the config concurrently")
+    parser.add_argument('--statuses', nargs='+', metavar='STATUS',
+                       help="Tender statuses to scrape in parallel sessions (default: tender_statuses from config)")
+    parser.add_argument('--backfill', nargs=2, metavar=('FROM', 'TO'),
+                       help='Backfill a date range (YYYY-MM-DD) split into windows crawled in parallel')
+    parser.add_argument('--window-days', type=int,
+                       help='Backfill window size in days (default: backfill_window_days from config)')
+    parser.add_argument('--by-organisation', action='store_true',
+                       help='Partition the crawl by organisation (combined with --backfill windows if given)')
+    parser.add_argument('--store', metavar='PATH',
+                       help='SQLite store for multi-portal/multi-status results (default: store_file from config)')
+    parser.add_argument('--archive', metavar='DIR',
+                       help='Record every fetched page in this archive (with --reprocess: read it)')
+    parser.add_argument('--reprocess', action='store_true',
+                       help='Rerun the extractors over the page archive and rewrite the store, offline')
     
     args = parser.parse_args()
     
-    # Update config for headless mode if specified
-    if args.headless:
-        if os.path.exists(args.config):
-            with open(args.config, 'r') as f:
-                config = json.load(f)
-            config['headless_mode'] = True
-            with open(args.config, 'w') as f:
-                json.dump(config, f, indent=4)
+    # In batch mode stdout may carry the NDJSON stream, so informational output goes to stderr
+    batch_mode = args.batch or args.ndjson is not None
+    info_stream = sys.stderr if batch_mode else sys.stdout
     
     scraper = OdishaTenderScraperEnhanced(args.config)
     
+    # Headless mode applies to this run only; the config file is left untouched
+    if args.headless:
+        scraper.config['headless_mode'] = True
+    
+    if args.reprocess:
+        success = run_reprocess(scraper, args.config, args.archive, args.store)
+        print("\nReprocessing completed." if success else "\nReprocessing failed. Check the logs for details.",
+              file=info_stream)
+        sys.exit(0 if success else 1)
+    
+    # The other captcha methods open a dialog or wait for typing in the browser
+    if batch_mode and args.captcha != 'offline':
+        parser.error("--batch/--ndjson runs unattended and needs --captcha offline "
+                     "with a captcha_solver set in the config")
+    if args.captcha == 'offline' and scraper.config.get("captcha_solver", "none") == "none":
+        parser.error("--captcha offline needs captcha_solver ('template' or 'tesseract') in the config")
+    
+    if args.archive:
+        scraper.config['archive_pages'] = True
+        scraper.config['archive_dir'] = args.archive
+    
+    partitions = None
+    if args.backfill or args.by_organisation:
+        from scraper.partitioner import parse_date, date_windows, organisation_partitions, discover_organisations
+        partitions = [None]
+        if args.backfill:
+            partitions = date_windows(parse_date(args.backfill[0]), parse_date(args.backfill[1]),
+                                      args.window_days or scraper.config["backfill_window_days"])
+        if args.by_organisation:
+            organisations = scraper.config.get("backfill_organisations") or discover_organisations(scraper)
+            if not organisations:
+                print("Could not determine the organisation list for partitioning.", file=sys.stderr)
+                sys.exit(1)
+            partitions = [p for window in partitions for p in organisation_partitions(organisations, window)]
+        print(f"Partitioned crawl: {len(partitions)} partitions", file=info_stream)
+    
     # Get number of records to scrape
     if args.records:
         max_records = args.records
+    elif partitions:
+        # A backfill window is crawled to the end unless --records caps it
+        max_records = scraper.config["backfill_max_records_per_window"]
     else:
         # Default to 25 records if not specified
         max_records = 25
-        print(f"Using default record count: {max_records}")
-        print("To specify a different number, use: --records N")
+        print(f"Using default record count: {max_records}", file=info_stream)
+        print("To specify a different number, use: --records N", file=info_stream)
     
     # Set max records in scraper
     scraper.set_max_records(max_records)
-    print(f"\nTarget records: {max_records}")
+    print(f"\nTarget records: {max_records}", file=info_stream)
     
-    # Ask user which captcha method to use
-    print("\nChoose captcha handling method:")
-    print("1. Automatic captcha (user enters text in dialog)")
-    print("2. Manual captcha (user types directly in browser) - RECOMMENDED")
-    print("3. GUI captcha (use with GUI application)")
-    
-    while True:
-        choice = input("Enter choice (1, 2, or 3): ").strip()
-        if choice in ['1', '2', '3']:
-            break
-        print("Invalid choice. Please enter 1, 2, or 3.")
+    if args.captcha:
+        captcha_method = args.captcha
+    else:
+        # Ask user which captcha method to use
+        print("\nChoose captcha handling method:")
+        print("1. Automatic captcha (user enters text in dialog)")
+        print("2. Manual captcha (user types directly in browser) - RECOMMENDED")
+        print("3. GUI captcha (use with GUI application)")
+        
+        while True:
+            choice = input("Enter choice (1, 2, or 3): ").strip()
+            if choice in ['1', '2', '3']:
+                break
+            print("Invalid choice. Please enter 1, 2, or 3.")
+        captcha_method = {'1': 'auto', '2': 'manual', '3': 'gui'}[choice]
     
     # Always use paginated scraper for better results
-    print(f"\nUsing enhanced paginated scraper with format compliance...")
-    print("This will scrape multiple pages until target records are reached.")
+    print(f"\nUsing enhanced paginated scraper with format compliance...", file=info_stream)
+    print("This will scrape multiple pages until target records are reached.", file=info_stream)
     
-    if choice == '1':
-        print("Using automatic captcha method...")
-        success = scraper.run_scraper_paginated_with_auto_captcha()
-    elif choice == '2':
-        print("Using manual captcha method (RECOMMENDED)...")
-        success = scraper.run_scraper_paginated()
+    statuses = args.statuses or scraper.config["tender_statuses"]
+    scraper.tender_status = statuses[0]
+    if args.portals or len(statuses) > 1 or partitions:
+        success = run_multi_portal(scraper, args.config, captcha_method, args.ndjson, args.store,
+                                   all_portals=args.portals, statuses=statuses, partitions=partitions)
+    elif batch_mode:
+        success = run_batch(scraper, captcha_method, args.ndjson)
     else:
-        print("Using GUI captcha method...")
-        success = scraper.run_scraper_paginated_with_gui_captcha()
+        success = run_with_captcha_method(scraper, captcha_method)
     
     if success:
-        print("\nScraping completed successfully!")
-        print(f"Check the Excel file: {scraper.excel_file}")
-        print(f"Check downloads in: {scraper.download_folder}")
-        print(f"Target records: {max_records}")
+        print("\nScraping completed successfully!", file=info_stream)
+        print(f"Check the Excel file: {scraper.excel_file}", file=info_stream)
+        print(f"Check downloads in: {scraper.download_folder}", file=info_stream)
+        print(f"Target records: {max_records}", file=info_stream)
     else:
-        print("\nScraping failed. Check the logs for details.")
+        print("\nScraping failed. Check the logs for details.", file=info_stream)
+    
+    if batch_mode:
+        sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from utils.lazy_import import lazy_import
+
+pd = lazy_import('pandas')
+
+# Multipliers for Indian numbering words that appear next to AOC amounts
+UNIT_MULTIPLIERS = {
+    'crore': 1e7, 'crores': 1e7, 'cr': 1e7,
+    'lakh': 1e5, 'lakhs': 1e5, 'lac': 1e5, 'lacs': 1e5,
+    'thousand': 1e3,
+}
+
+CONFIDENCE_HIGH = 'high'      # Well-formed number with a currency marker or unit word
+CONFIDENCE_MEDIUM = 'medium'  # Well-formed number without any currency context
+CONFIDENCE_LOW = 'low'        # Irregular digit grouping or several competing numbers
+CONFIDENCE_NONE = 'none'      # Nothing numeric could be parsed
+
+VALUE_COLUMN = 'Contract_Value_INR'
+CONFIDENCE_COLUMN = 'Contract_Value_Confidence'
+
+# The whole run of digits, commas and points, so ".5" or "1.5." is seen as malformed, not as 5 or 1.5
+_TOKEN = r'(?:(?<![a-z])[.,])?\d[\d,.]*'
+_NUMBER_PATTERN = rf'(?P<number>{_TOKEN})'
+_UNIT_PATTERN = r'(?:\s*(?P<unit>crores?|cr\b\.?|lakhs?|lacs?|thousand))?'
+_AMOUNT_REGEX = _NUMBER_PATTERN + _UNIT_PATTERN
+# 1,23,45,678 (Indian lakh grouping), 12,345,678 (international) or plain digits
+_WELL_GROUPED = r'^(?:\d+|\d{1,2}(?:,\d{2})*,\d{3}|\d{1,3}(?:,\d{3})+)(?:\.\d+)?$'
+_CURRENCY_MARKER = r'\binr\b|₹|\brs\b\.?(?=\s*\d)|\brupees\b'
+
+
+def normalize_contract_values(values: pd.Series) -> pd.DataFrame:
+    """Normalize a column of raw contract value strings into rupees.
+
+    Returns a frame aligned with ``values`` holding the numeric amount in
+    ``Contract_Value_INR`` (NaN when unparsed) and a parse-confidence flag
+    in ``Contract_Value_Confidence``.
+    """
+    text = values.astype('string').fillna('').str.strip()
+    text = text.mask(text == '<empty>', '')
+    lowered = text.str.lower()
+
+    parts = lowered.str.extract(_AMOUNT_REGEX, flags=re.IGNORECASE)
+    number = parts['number'].fillna('')
+    unit = parts['unit'].fillna('').str.rstrip('.')
+
+    amount = pd.to_numeric(number.str.replace(',', '', regex=False), errors='coerce')
+    multiplier = unit.map(UNIT_MULTIPLIERS).fillna(1.0)
+    amount = amount * multiplier
+
+    well_grouped = number.str.match(_WELL_GROUPED)
+    has_context = lowered.str.contains(_CURRENCY_MARKER, regex=True) | (unit != '')
+    # Count distinct numbers so "INR 1,20,000 (EMD 2,400)" is not trusted blindly
+    number_count = lowered.str.count(_TOKEN)
+
+    confidence = pd.Series(CONFIDENCE_NONE, index=values.index, dtype='object')
+    parsed = amount.notna()
+    confidence[parsed] = CONFIDENCE_LOW
+    confidence[parsed & well_grouped & (number_count == 1)] = CONFIDENCE_MEDIUM
+    confidence[parsed & well_grouped & (number_count == 1) & has_context] = CONFIDENCE_HIGH
+
+    return pd.DataFrame({
+        VALUE_COLUMN: amount.astype('float64'),
+        CONFIDENCE_COLUMN: confidence,
+    }, index=values.index)
+
+
+def apply_contract_value_normalization(tender_data: List[Dict]) -> List[Dict]:
+    """Attach normalized contract values to every record in one batch"""
+    if not tender_data:
+        return tender_data
+
+    raw_values = pd.Series([tender.get('Contract_Value') for tender in tender_data], dtype='object')
+    normalized = normalize_contract_values(raw_values)
+
+    for tender, value, confidence in zip(tender_data,
+                                         normalized[VALUE_COLUMN].tolist(),
+                                         normalized[CONFIDENCE_COLUMN].tolist()):
+        tender[VALUE_COLUMN] = None if pd.isna(value) else float(value)
+        tender[CONFIDENCE_COLUMN] = confidence
+    return tender_data
+
+
+def normalize_contract_value(text: Optional[str]) -> Tuple[Optional[float], str]:
+    """Normalize a single contract value string"""
+    normalized = normalize_contract_values(pd.Series([text], dtype='object'))
+    value = normalized[VALUE_COLUMN].iloc[0]
+    return (None if pd.isna(value) else float(value)), normalized[CONFIDENCE_COLUMN].iloc[0]
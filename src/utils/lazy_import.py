@@ -0,0 +1,55 @@
+import importlib
+from typing import Any
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+class LazyObject:
+    """Stand-in for ``from module import name``, resolved on first use"""
+
+    def __init__(self, module: str, name: str):
+        self._module_name = module
+        self._name = name
+        self._object = None
+
+    def _load(self):
+        if self._object is None:
+            self._object = getattr(importlib.import_module(self._module_name), self._name)
+        return self._object
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module_name}.{self._name}>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """``pd = lazy_import('pandas')`` instead of ``import pandas as pd``"""
+    return LazyModule(name)
+
+
+def lazy_from(module: str, name: str) -> LazyObject:
+    """``By = lazy_from('selenium.webdriver.common.by', 'By')`` instead of a from-import"""
+    return LazyObject(module, name)
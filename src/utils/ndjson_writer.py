@@ -0,0 +1,50 @@
+import json
+import sys
+import threading
+import logging
+from typing import Any, Optional, TextIO
+
+from utils.contract_value import apply_contract_value_normalization
+
+
+class NDJSONWriter:
+    """Stream tender records as newline-delimited JSON, one line per record"""
+
+    def __init__(self, path: str = '-', stream: Optional[TextIO] = None):
+        self.path = path
+        self.records_written = 0
+        self._lock = threading.Lock()
+        if stream is not None:
+            self.stream = stream
+            self._owns_stream = False
+        elif path == '-':
+            self.stream = sys.stdout
+            self._owns_stream = False
+        else:
+            self.stream = open(path, 'a', encoding='utf-8')
+            self._owns_stream = True
+
+    def write(self, record: Any):
+        """Write a single record and flush so downstream tools see it immediately"""
+        apply_contract_value_normalization([record])
+        data = record.to_dict(empty=None) if hasattr(record, 'to_dict') else dict(record)
+        line = json.dumps(data, ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+            self.records_written += 1
+
+    def close(self):
+        """Close the underlying file if this writer opened it"""
+        if self._owns_stream:
+            try:
+                self.stream.close()
+            except Exception as e:
+                logging.warning(f"Could not close NDJSON output {self.path}: {e}")
+        logging.info(f"NDJSON output: {self.records_written} records written to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,128 @@
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+PAGES_FILE = "pages.warc.gz"
+INDEX_FILE = "index.sqlite"
+
+_open_archives: Dict[str, 'PageArchive'] = {}
+_open_archives_lock = threading.Lock()
+
+
+def open_archive(directory: str) -> 'PageArchive':
+    """Shared PageArchive for a directory, so parallel sessions append to one file safely"""
+    key = os.path.abspath(directory)
+    with _open_archives_lock:
+        if key not in _open_archives:
+            _open_archives[key] = PageArchive(directory)
+        return _open_archives[key]
+
+
+class PageArchive:
+    """Compressed archive of fetched portal pages with a SQLite index
+
+    Pages are appended to ``pages.warc.gz`` as WARC-style ``resource``
+    records, each its own gzip member, so any record can be read with a
+    single seek. ``index.sqlite`` maps URL, portal, status and Tender ID
+    to the record's offset. A page identical to the latest copy of the
+    same URL is not stored again.
+    """
+
+    def __init__(self, directory: str = "page_archive"):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.pages_path = os.path.join(directory, PAGES_FILE)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, INDEX_FILE), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages (id INTEGER PRIMARY KEY, url TEXT, kind TEXT, portal TEXT, "
+                "status TEXT, tender_id TEXT, fetched_at TEXT, digest TEXT, offset INTEGER, length INTEGER)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_url ON pages (url)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_tender ON pages (portal, tender_id)")
+
+    def record(self, url: str, html: str, kind: str = "detail", portal: Optional[str] = None,
+               status: Optional[str] = None, tender_id: Optional[str] = None) -> bool:
+        """Append a page; returns False when an identical copy is already the latest one"""
+        body = (html or '').encode('utf-8')
+        digest = f"sha1:{hashlib.sha1(body).hexdigest()}"
+        fetched_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        header = (
+            "WARC/1.0\r\n"
+            "WARC-Type: resource\r\n"
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+            f"WARC-Date: {fetched_at}\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Payload-Digest: {digest}\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode('utf-8')
+        data = gzip.compress(header + body + b"\r\n\r\n")
+        with self._lock:
+            latest = self._conn.execute(
+                "SELECT digest, tender_id FROM pages WHERE url = ? ORDER BY id DESC LIMIT 1", (url,)
+            ).fetchone()
+            if latest and latest[0] == digest and latest[1] == tender_id:
+                return False
+            with open(self.pages_path, 'ab') as f:
+                offset = f.tell()
+                f.write(data)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO pages (url, kind, portal, status, tender_id, fetched_at, digest, offset, length) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, kind, portal, status, tender_id, fetched_at, digest, offset, len(data))
+                )
+        return True
+
+    def read(self, page_id: int) -> Optional[str]:
+        """HTML of an indexed page"""
+        with self._lock:
+            row = self._conn.execute("SELECT offset, length FROM pages WHERE id = ?", (page_id,)).fetchone()
+        if not row:
+            return None
+        with open(self.pages_path, 'rb') as f:
+            f.seek(row[0])
+            record = gzip.decompress(f.read(row[1]))
+        header, _, body = record.partition(b"\r\n\r\n")
+        for line in header.split(b"\r\n"):
+            if line.lower().startswith(b"content-length:"):
+                body = body[:int(line.split(b":", 1)[1])]
+        return body.decode('utf-8')
+
+    def get(self, url: str) -> Optional[str]:
+        """Latest archived HTML of a URL (the replay backend's lookup)"""
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM pages WHERE url = ? ORDER BY id DESC LIMIT 1", (url,)).fetchone()
+        return self.read(row[0]) if row else None
+
+    def pages(self, kind: Optional[str] = None, portal: Optional[str] = None,
+              tender_id: Optional[str] = None) -> List[Dict]:
+        """Index entries, oldest first"""
+        query = "SELECT id, url, kind, portal, status, tender_id, fetched_at FROM pages"
+        conditions, params = [], []
+        for column, value in (('kind', kind), ('portal', portal), ('tender_id', tender_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+        return [dict(zip(('id', 'url', 'kind', 'portal', 'status', 'tender_id', 'fetched_at'), row)) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self):
+        with _open_archives_lock:
+            _open_archives.pop(os.path.abspath(self.directory), None)
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,159 @@
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.contract_value import apply_contract_value_normalization
+
+# Store column -> legacy record column
+STORE_COLUMNS = {
+    'portal': 'Portal',
+    'tender_id': 'Tender ID',
+    's_no': 'S.No',
+    'title': 'Title and Ref.No.',
+    'organisation': 'Organisation Chain',
+    'tender_stage': 'Tender Stage',
+    'search_status': 'Search_Status',
+    'status': 'Status',
+    'status_link': 'Status_Link',
+    'aoc_pdf_link': 'AOC_PDF_Link',
+    'aoc_pdf_file': 'AOC_PDF_File',
+    'stage_summary': 'Stage_Summary_Data',
+    'contract_value': 'Contract_Value',
+    'contract_value_inr': 'Contract_Value_INR',
+    'contract_value_confidence': 'Contract_Value_Confidence',
+    'contractor_name': 'Contractor_Name',
+    'email': 'Email',
+    'mobile': 'Mobile',
+    'gst_number': 'GST_Number',
+    'pdf_details': 'PDF_Details',
+}
+
+# Tender lifecycle, earliest first: a later status wins when one tender
+# turns up under several status searches
+STATUS_PRECEDENCE = (
+    'to be opened',
+    'technical bid opening',
+    'technical evaluation',
+    'financial bid opening',
+    'financial evaluation',
+    'retender',
+    'cancelled',
+    'aoc',
+)
+
+
+def status_rank(status: Optional[str]) -> int:
+    """Position of a status in the tender lifecycle (0 when unknown)"""
+    status = (status or '').lower()
+    for rank in range(len(STATUS_PRECEDENCE), 0, -1):
+        if STATUS_PRECEDENCE[rank - 1] in status:
+            return rank
+    return 0
+
+
+class TenderStore:
+    """SQLite store of enriched tenders, one row per (portal, tender ID)
+
+    Safe to share between worker threads; writes are serialized. The
+    normalized contract value is stored as REAL and indexed, so results
+    can be sorted and filtered by value without any string parsing.
+    A stored tender is only replaced by a record at the same or a later
+    lifecycle status, so concurrent status searches merge cleanly.
+    """
+
+    def __init__(self, path: str = "tenders.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        columns = {column: 'REAL' if column == 'contract_value_inr' else 'TEXT' for column in STORE_COLUMNS}
+        columns.update(status_rank='INTEGER', scraped_at='TEXT')
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS tenders "
+                f"({', '.join(f'{name} {kind}' for name, kind in columns.items())}, "
+                "PRIMARY KEY (portal, tender_id))"
+            )
+            # Stores created by older versions lack the newer columns
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(tenders)")}
+            for name, kind in columns.items():
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE tenders ADD COLUMN {name} {kind}")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tenders_value ON tenders (contract_value_inr)")
+
+    def _row(self, record: Any) -> List[Any]:
+        row = []
+        for column in STORE_COLUMNS.values():
+            value = record.get(column)
+            row.append(None if value == '<empty>' else value)
+        row.append(status_rank(record.get('Search_Status') or record.get('Tender Stage')))
+        row.append(datetime.now().isoformat())
+        return row
+
+    def upsert(self, records: Iterable[Any], keep_existing: bool = False) -> int:
+        """Insert or merge records (TenderRecord or legacy dicts), returning the rows written
+
+        Records at an earlier status than the stored tender are skipped.
+        With ``keep_existing``, empty fields do not overwrite stored values
+        (e.g. listing-only records of tenders whose details failed).
+        """
+        records = list(records)
+        if not records:
+            return 0
+        apply_contract_value_normalization(records)
+        rows = [self._row(record) for record in records]
+        columns = list(STORE_COLUMNS) + ['status_rank', 'scraped_at']
+        if keep_existing:
+            updates = ', '.join(f"{column} = COALESCE(excluded.{column}, tenders.{column})" for column in columns)
+        else:
+            updates = ', '.join(f"{column} = excluded.{column}" for column in columns)
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                f"INSERT INTO tenders ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT (portal, tender_id) DO UPDATE SET {updates} "
+                "WHERE excluded.status_rank >= tenders.status_rank OR tenders.status_rank IS NULL",
+                rows
+            )
+        return cursor.rowcount
+
+    def count(self, portal: Optional[str] = None) -> int:
+        with self._lock:
+            if portal:
+                return self._conn.execute("SELECT COUNT(*) FROM tenders WHERE portal = ?", (portal,)).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM tenders").fetchone()[0]
+
+    def fetch(self, where: str = "", params: tuple = (), order_by: str = "portal, tender_id") -> List[Dict]:
+        """Return rows as legacy column dicts"""
+        query = f"SELECT {', '.join(STORE_COLUMNS)} FROM tenders"
+        if where:
+            query += f" WHERE {where}"
+        query += f" ORDER BY {order_by}"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(zip(STORE_COLUMNS.values(), row)) for row in rows]
+
+    def to_dataframe(self):
+        import pandas as pd
+
+        with self._lock:
+            df = pd.read_sql_query("SELECT * FROM tenders ORDER BY portal, tender_id", self._conn)
+        return df.drop(columns=['status_rank']).rename(columns=STORE_COLUMNS)
+
+    def export_excel(self, path: str) -> bool:
+        """Write the whole store to a single Excel sheet"""
+        try:
+            df = self.to_dataframe()
+            df.to_excel(path, sheet_name='Tenders', index=False)
+            logging.info(f"[SAVE] Exported {len(df)} stored tenders to {path}")
+            return True
+        except Exception as e:
+            logging.error(f"Error exporting store to Excel: {e}")
+            return False
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -3,14 +3,93 @@
 Test script for the enhanced tender scraper
 """
 
+import contextlib
+import json
 import sys
 import os
+import tempfile
+import time
 
 # Add the src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from scraper.tender_scrapper import OdishaTenderScraperEnhanced
 
+FIXTURE_PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+
+
+def write_config(workdir, **settings):
+    """Config file that keeps every file the scraper writes inside workdir"""
+    config = {
+        'download_folder': os.path.join(workdir, 'downloads'),
+        'session_cache_file': os.path.join(workdir, 'session_cache.json'),
+        'page_cursor_file': os.path.join(workdir, 'page_cursor.json'),
+        'driver_cache_file': os.path.join(workdir, 'driver_cache.json'),
+        'store_file': os.path.join(workdir, 'tenders.db'),
+        'archive_dir': os.path.join(workdir, 'archive'),
+    }
+    config.update(settings)
+    path = os.path.join(workdir, 'config.json')
+    with open(path, 'w') as f:
+        json.dump(config, f)
+    return path
+
+
+@contextlib.contextmanager
+def temp_scraper(**settings):
+    """Scraper configured by write_config in a temporary directory"""
+    with tempfile.TemporaryDirectory() as workdir:
+        yield OdishaTenderScraperEnhanced(write_config(workdir, **settings))
+
+
+@contextlib.contextmanager
+def patched(target, name, value):
+    """Replace an attribute for the duration of the block"""
+    original = getattr(target, name)
+    setattr(target, name, value)
+    try:
+        yield value
+    finally:
+        setattr(target, name, original)
+
+
+class _NoSleepTime:
+    """The time module, except that sleep returns at once"""
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    @staticmethod
+    def sleep(seconds):
+        pass
+
+
+def no_sleep(module):
+    """Skip the waits of one module without touching the global time.sleep"""
+    return patched(module, 'time', _NoSleepTime())
+
+
+def live_pages(archive):
+    """Replay backend over saved pages that the scraper treats as the live portal (paced, not offline)"""
+    from scraper.fetch_backends import ReplayBackend
+
+    backend = ReplayBackend(archive)
+    backend.offline = False
+    return backend
+
+
+def load_fixture_pages():
+    """[(manifest row, html)] of the saved portal pages"""
+    import csv
+
+    pages = []
+    with open(os.path.join(FIXTURE_PAGES, 'manifest.csv'), newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            with open(os.path.join(FIXTURE_PAGES, row['filename']), encoding='utf-8') as page:
+                pages.append((row, page.read()))
+    return pages
+
+
 def test_scraper():
     """Test the basic functionality"""
     try:
@@ -43,5 +122,1070 @@ def test_scraper():
         print(f"[ERROR] Test failed: {e}")
         return False
 
+def test_contract_value_normalization():
+    """Test INR contract value normalization"""
+    import pandas as pd
+    from utils.contract_value import normalize_contract_values
+
+    values = pd.Series(['INR 1,23,45,678.00', '12.5 Lakh', 'Rs. 2 Crore', '<empty>'])
+    normalized = normalize_contract_values(values)
+    assert normalized['Contract_Value_INR'].tolist()[:3] == [12345678.0, 1250000.0, 20000000.0]
+    assert normalized['Contract_Value_Confidence'].tolist() == ['high', 'high', 'high', 'none']
+    print("[OK] Contract values normalized")
+
+def test_contract_value_units_and_malformed():
+    """Units are applied, only a real currency marker earns 'high', junk is not trusted"""
+    import pandas as pd
+    from utils.contract_value import normalize_contract_values
+
+    values = pd.Series(['12.5 Lakh', 'Rs.2 Crore', '₹ 3.25 Cr.', '1,23,456', '1234567',
+                        'INR .5', 'INR 1.5.', '12,34,5', 'INR 1,20,000 (EMD 2,400)'])
+    normalized = normalize_contract_values(values)
+    amounts = normalized['Contract_Value_INR'].tolist()
+    confidence = normalized['Contract_Value_Confidence'].tolist()
+    assert amounts[:5] == [1250000.0, 20000000.0, 32500000.0, 123456.0, 1234567.0]
+    assert confidence[:5] == ['high', 'high', 'high', 'medium', 'medium']
+    # Malformed decimals and groupings are never trusted
+    assert confidence[5:8] == ['low', 'none', 'low']
+    assert pd.isna(amounts[6])
+    assert confidence[8] == 'low'
+    print("[OK] Contract value units and malformed values handled")
+
+def test_contract_value_cell_kept_raw():
+    """The extractor stores the cell as shown, so the unit survives normalization"""
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.tender_record import TenderRecord
+    from utils.contract_value import normalize_contract_value
+
+    with temp_scraper() as scraper:
+        scraper.fetch_backend = ReplayBackend({})
+        for cell, expected in (('12.5 Lakh', (1250000.0, 'high')), ('4,50,000', (450000.0, 'medium'))):
+            scraper.fetch_backend.load(f"<table><tr><td>AOC Details</td></tr>"
+                                       f"<tr><td>Contract Value</td><td>{cell}</td></tr></table>",
+                                       "https://portal/detail")
+            record = TenderRecord(tender_id='T1')
+            scraper.extract_aoc_contract_details(record)
+            assert record['Contract_Value'] == cell
+            assert normalize_contract_value(record['Contract_Value']) == expected
+    print("[OK] Contract value cell stored as shown")
+
+def test_tender_record_legacy_access():
+    """TenderRecord behaves like the old '<empty>'-filled dict rows"""
+    from scraper.tender_record import TenderRecord, records_to_dicts
+
+    record = TenderRecord(tender_id='2024_WD_1', status_link='https://portal/view?id=1')
+    record['Email'] = 'a@b.in'
+    assert record['Tender ID'] == '2024_WD_1' and record.email == 'a@b.in'
+    assert record.get('Mobile', '') == '' and 'Mobile' in record and 'Bogus' not in record
+    row = record.to_dict()
+    assert row['Mobile'] == '<empty>' and row['Contract_Value_INR'] is None
+    assert TenderRecord.from_dict(row).to_dict() == row
+    assert TenderRecord.from_dict(row).mobile is None
+    assert records_to_dicts([record, {'Tender ID': 'x'}]) == [row, {'Tender ID': 'x'}]
+    print("[OK] TenderRecord legacy access")
+
+def test_rejected_offline_captcha_falls_back_to_human():
+    """A wrong offline answer reloads the form for the human handler and is never kept as a fixture"""
+    import scraper.tender_scrapper as module
+
+    with temp_scraper() as scraper, no_sleep(module):
+        calls = []
+        listing_shown = iter([False, True])
+        scraper.driver = type('Driver', (), {'find_elements': lambda self, by, value: []})()
+        scraper.solve_captcha_offline = lambda: calls.append('offline') or True
+        scraper.remember_captcha_for_fixture = lambda: setattr(scraper, '_pending_captcha_fixture', calls[-1])
+        scraper.click_search_button = lambda: True
+        scraper.has_results_table = lambda timeout=5: next(listing_shown)
+        scraper.reload_search_form = lambda: calls.append('reload') or True
+        human = lambda: calls.append('human') or True
+
+        assert scraper.submit_captcha_search(human)
+        assert calls == ['offline', 'reload', 'human']
+        assert scraper._pending_captcha_fixture == 'human'
+
+        # Unattended: nobody to fall back to
+        listing_shown = iter([False])
+        assert not scraper.submit_captcha_search(None)
+        assert scraper._pending_captcha_fixture is None
+    print("[OK] Rejected offline captcha falls back to the human handler")
+
+def test_captcha_solver_is_abstract():
+    """A solver without solve() fails when created, not mid-scrape"""
+    from scraper.captcha_solver import CaptchaSolver
+
+    class Incomplete(CaptchaSolver):
+        pass
+
+    try:
+        Incomplete()
+    except TypeError:
+        print("[OK] Incomplete captcha solver rejected")
+    else:
+        raise AssertionError("Incomplete solver was instantiated")
+
+def test_ndjson_writer_streams_normalized_records():
+    """One flushed JSON line per record, with the normalized amount attached"""
+    import io
+    import json
+    from scraper.tender_record import TenderRecord
+    from utils.ndjson_writer import NDJSONWriter
+
+    stream = io.StringIO()
+    with NDJSONWriter(stream=stream) as writer:
+        writer.write(TenderRecord(tender_id='T1', contract_value='12.5 Lakh'))
+        writer.write({'Tender ID': 'T2', 'Contract_Value': 'Rs. 2 Crore', 'Title': 'Road à Puri'})
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert writer.records_written == 2 and not stream.closed
+    assert lines[0]['Tender ID'] == 'T1' and lines[0]['Email'] is None
+    assert lines[0]['Contract_Value_INR'] == 1250000.0
+    assert lines[1]['Contract_Value_INR'] == 20000000.0 and lines[1]['Title'] == 'Road à Puri'
+    print("[OK] NDJSON writer streams normalized records")
+
+def test_session_expiry_detection_and_reauth():
+    """The stale-session page is recognised and the tender retried once after re-authenticating"""
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.tender_record import TenderRecord
+    import scraper.tender_scrapper as module
+    from scraper.tender_scrapper import SessionExpiredError
+
+    with temp_scraper() as scraper, no_sleep(module):
+        scraper.fetch_backend = ReplayBackend({})
+        page = scraper.fetch_backend
+        page.load("<html><body><p>Your session has timed out.</p></body></html>", "https://portal/app?page=View")
+        assert scraper.is_session_expired_page()
+        page.load("<html><body><script>alert('session expired')</script><table></table></body></html>",
+                  "https://portal/app?page=View")
+        assert not scraper.is_session_expired_page()
+        page.load("<html><body>Restart</body></html>", "https://portal/app?page=StaleSession")
+        assert scraper.is_session_expired_page()
+
+        scraper.fetch_backend = None
+        attempts = []
+        def extract(tender):
+            attempts.append(tender['Tender ID'])
+            if len(attempts) == 1:
+                raise SessionExpiredError("expired")
+        scraper.extract_with_deadline = extract
+        scraper.reauthenticate = lambda: attempts.append('reauth') or True
+        assert scraper.extract_with_reauth(TenderRecord(tender_id='T1'))
+        assert attempts == ['T1', 'reauth', 'T1']
+    print("[OK] Session expiry detected and re-authenticated")
+
+def test_saved_session_sets_session_cookies():
+    """A reused session leaves its cookies where replacement browsers pick them up"""
+    class FakeDriver:
+        def __init__(self):
+            self.cookies = []
+        def add_cookie(self, cookie):
+            self.cookies.append(cookie)
+        def get(self, url):
+            pass
+        def get_cookies(self):
+            return list(self.cookies)
+
+    with temp_scraper() as scraper:
+        cookies = [{'name': 'JSESSIONID', 'value': 'abc', 'domain': 'portal', 'path': '/'}]
+        scraper.session_cache.save(scraper.session_key, cookies, 'https://portal/app?page=results')
+        scraper.driver = FakeDriver()
+        scraper.has_results_table = lambda timeout=None: True
+        assert scraper.search_with_saved_session()
+        assert [c['name'] for c in scraper.session_cookies] == ['JSESSIONID']
+    print("[OK] Saved session cookies kept for browser replacement")
+
+def test_rate_limiter_spacing_and_activity():
+    """Requests are spaced by min_interval and activity is tracked apart from the slot"""
+    from scraper.rate_limiter import RateLimiter
+
+    limiter = RateLimiter(0.05)
+    started = time.monotonic()
+    with limiter.request():
+        assert not limiter.try_acquire()
+    with limiter.request():
+        pass
+    assert time.monotonic() - started >= 0.05
+    # The pause after a request also applies to background work
+    assert not limiter.try_acquire()
+    time.sleep(0.06)
+    assert limiter.try_acquire()
+    limiter.release()
+
+    with limiter.request():
+        time.sleep(0.03)
+        assert limiter.idle_for() >= 0.03
+        limiter.touch()
+        assert limiter.idle_for() < 0.03
+    print("[OK] Rate limiter spacing and activity tracking")
+
+def test_heartbeat_pings_while_slot_is_held():
+    """A long request holding the limiter slot does not keep the heartbeat from pinging"""
+    from scraper.heartbeat import SessionHeartbeat
+    from scraper.rate_limiter import RateLimiter
+
+    limiter = RateLimiter(0)
+    heartbeat = SessionHeartbeat('https://portal/keepalive', limiter, interval=0.5)
+    pings = []
+    heartbeat.ping = lambda: pings.append(limiter.idle_for()) or True
+    heartbeat.start()
+    try:
+        # A page request that stalls for longer than the keep-alive interval
+        with limiter.request():
+            time.sleep(2.5)
+    finally:
+        heartbeat.stop()
+    assert pings and all(idle >= 0.5 for idle in pings)
+
+    # Nothing to keep alive before the search has produced a session
+    with temp_scraper() as scraper:
+        scraper.start_heartbeat()
+        assert scraper.heartbeat is None
+    print(f"[OK] Heartbeat sent {len(pings)} pings during a long request")
+
+def test_tender_store_status_precedence():
+    """A stored tender is only replaced by a record at the same or a later status"""
+    from utils.tender_store import TenderStore, status_rank
+
+    assert status_rank('AOC') > status_rank('Financial Evaluation') > status_rank('To Be Opened') > status_rank('')
+    with tempfile.TemporaryDirectory() as workdir:
+        store = TenderStore(os.path.join(workdir, 'tenders.db'))
+        aoc = {'Portal': 'P', 'Tender ID': 'T1', 'Search_Status': 'AOC', 'Contractor_Name': 'Acme',
+               'Contract_Value': 'Rs. 1,00,000'}
+        assert store.upsert([aoc]) == 1
+        # An earlier status found by a concurrent search does not overwrite it
+        assert store.upsert([{'Portal': 'P', 'Tender ID': 'T1', 'Search_Status': 'Technical Evaluation'}]) == 0
+        row = store.fetch()[0]
+        assert row['Search_Status'] == 'AOC' and row['Contract_Value_INR'] == 100000.0
+        # Listing-only data at the same status fills in without erasing details
+        listing = {'Portal': 'P', 'Tender ID': 'T1', 'Search_Status': 'AOC', 'Title and Ref.No.': 'Road works'}
+        assert store.upsert([listing], keep_existing=True) == 1
+        row = store.fetch()[0]
+        assert row['Title and Ref.No.'] == 'Road works' and row['Contractor_Name'] == 'Acme'
+        assert store.upsert([listing]) == 1
+        assert store.fetch()[0]['Contractor_Name'] is None
+        # The same tender on another portal is a separate row
+        store.upsert([dict(aoc, Portal='Q')])
+        assert store.count() == 2 and store.count('Q') == 1
+        store.close()
+    print("[OK] Tender store status precedence")
+
+def test_scrape_portal_stores_every_record():
+    """Tenders that never reached the record callback are stored too, and only writes are counted"""
+    from scraper import parallel_runner
+    from scraper.tender_record import TenderRecord
+    from utils.tender_store import TenderStore
+
+    def scrape_records(self, captcha_method='manual'):
+        records = [TenderRecord(portal='P', tender_id=f'T{i}', search_status='AOC') for i in range(3)]
+        # Only the first tender got its details; the others stay listing-only
+        self.emit_record(records[0])
+        return records
+
+    with tempfile.TemporaryDirectory() as workdir, \
+            patched(OdishaTenderScraperEnhanced, 'scrape_records', scrape_records):
+        store = TenderStore(os.path.join(workdir, 'tenders.db'))
+        store.upsert([{'Portal': 'P', 'Tender ID': 'T2', 'Search_Status': 'AOC', 'Contractor_Name': 'Acme'}])
+        portal = {'name': 'P', 'base_url': 'https://portal'}
+        written = parallel_runner.scrape_portal(portal, write_config(workdir), 3, 'manual', store)
+        assert written == 3 and store.count() == 3
+        assert store.fetch("tender_id = 'T2'")[0]['Contractor_Name'] == 'Acme'
+        store.close()
+    print("[OK] scrape_portal stores every record")
+
+def test_portal_sessions_share_pacing():
+    """Sessions on one portal share the request slot but keep their own idle clocks"""
+    from scraper.rate_limiter import RateLimiter, SessionRateLimiter
+
+    portal = RateLimiter(0.05)
+    first, second = SessionRateLimiter(portal), SessionRateLimiter(portal)
+    started = time.monotonic()
+    with first.request():
+        assert not second.try_acquire()
+    with second.request():
+        pass
+    assert time.monotonic() - started >= 0.05
+    second.min_interval = 0
+    assert portal.min_interval == 0
+
+    time.sleep(0.03)
+    with first.request():
+        assert second.idle_for() >= 0.03 > first.idle_for()
+
+    # run_portals hands every job on a portal the same limiter
+    from scraper import parallel_runner
+    from utils.tender_store import TenderStore
+
+    limiters = {}
+    def scrape_records(self, captcha_method='manual'):
+        limiters.setdefault(self.portal_name, set()).add(id(self.rate_limiter.portal))
+        return []
+
+    with tempfile.TemporaryDirectory() as workdir, \
+            patched(OdishaTenderScraperEnhanced, 'scrape_records', scrape_records):
+        store = TenderStore(os.path.join(workdir, 'tenders.db'))
+        portals = [{'name': 'A', 'base_url': 'https://a'}, {'name': 'B', 'base_url': 'https://b'}]
+        parallel_runner.run_portals(portals, write_config(workdir), store=store, statuses=['AOC', 'Retender'])
+        store.close()
+    assert len(limiters['A']) == len(limiters['B']) == 1 and limiters['A'] != limiters['B']
+    print("[OK] Portal sessions share pacing")
+
+def test_html_backend_locators_and_tables():
+    """Selenium locators and table reads behave the same on parsed HTML as in the browser"""
+    from selenium.common.exceptions import NoSuchElementException
+    from scraper.fetch_backends import (FetchBackend, HtmlBackend, PageNotArchivedError, ReplayBackend,
+                                        _xpath_for)
+
+    for backend in (FetchBackend, HtmlBackend):
+        try:
+            backend()
+            assert False, f"{backend.__name__} should be abstract"
+        except TypeError:
+            pass
+
+    assert _xpath_for('id', 'main', relative=False) == "//*[@id='main']"
+    assert _xpath_for('name', 'tenderStatus', relative=True) == ".//*[@name='tenderStatus']"
+    assert _xpath_for('xpath', '//table', relative=True) == '//table'
+    try:
+        _xpath_for('css selector', 'table.list', relative=False)
+        assert False, "CSS selectors are not translated"
+    except ValueError:
+        pass
+
+    url = "https://portal/nicgep/app?page=View"
+    html = """<html><body>
+        <table id="summary" class="list-table wide">
+          <thead><tr><th>Name</th><th>Value</th></tr></thead>
+          <tbody><tr><td>Contract  Value</td><td>INR <b>1,000</b></td></tr>
+                 <tr><td>Bidder<br>Name</td><td><a href="files/aoc_1.pdf">AOC</a></td></tr></tbody>
+        </table>
+        <table class="list-table-old"><tr><td>other</td></tr></table>
+        <div style="display: none"><a id="hidden" href="javascript:void(0)">Next</a></div>
+        </body></html>"""
+    backend = ReplayBackend({url: html})
+    backend.navigate(url)
+    assert backend.current_url == url and backend.page_source == html
+    # A class name matches whole class tokens only
+    assert [t.get_attribute('id') for t in backend.find_elements('class name', 'list-table')] == ['summary']
+    table = backend.find_element('id', 'summary')
+    assert table.find_element('link text', 'AOC').get_attribute('href') == "https://portal/nicgep/files/aoc_1.pdf"
+    assert len(table.find_elements('tag name', 'tr')) == 3
+    hidden = backend.find_element('partial link text', 'Nex')
+    assert hidden.get_attribute('href') == 'javascript:void(0)' and not hidden.is_displayed()
+    try:
+        backend.find_element('id', 'missing')
+        assert False, "missing element should raise"
+    except NoSuchElementException:
+        pass
+
+    # Header cells are not data cells; nested markup and line breaks collapse to spaced text
+    assert backend.read_tables("//table[@id='summary']") == [[[], ['Contract Value', 'INR 1,000'],
+                                                               ['Bidder Name', 'AOC']]]
+    assert len(backend.read_tables()) == 2
+    assert backend.find_links() == ["https://portal/nicgep/files/aoc_1.pdf"]
+    try:
+        backend.navigate("https://portal/nicgep/app?page=Other")
+        assert False, "unrecorded page should raise"
+    except PageNotArchivedError:
+        pass
+    print("[OK] HTML backend locators and tables")
+
+def test_fixture_pages_replay():
+    """The saved listing and detail pages parse completely through the replay backend"""
+    import re
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.tender_record import TenderRecord
+
+    pages = load_fixture_pages()
+    archive = {row['url']: html for row, html in pages}
+    listed = []
+    with temp_scraper() as scraper:
+        scraper.fetch_backend = ReplayBackend(archive)
+        for row, _ in pages:
+            scraper.fetch_backend.navigate(row['url'])
+            if row['kind'] == 'listing':
+                listed += scraper.extract_current_page_data()
+                continue
+            record = TenderRecord(tender_id='T', status_link=row['url'])
+            scraper.extract_aoc_contract_details(record)
+            scraper.extract_contractor_details(record)
+            assert record['Contract_Value'].startswith('INR'), row['filename']
+            assert record['Contractor_Name'] not in (None, '<empty>'), row['filename']
+            assert re.fullmatch(r'\d{2}[A-Z]{5}\d{4}[A-Z]\dZ\d', record['GST_Number']), row['filename']
+    assert len(listed) == 100 and len({r['Tender ID'] for r in listed}) == 100
+    # Listing rows link to the archived detail pages
+    assert all(r['Status_Link'] in archive for r in listed[:30])
+    print(f"[OK] Replayed {len(pages)} fixture pages")
+
+def test_partition_boundaries():
+    """Date windows tile the range exactly, organisation partitions keep the window label"""
+    from datetime import date
+    from scraper.partitioner import date_windows, organisation_partitions, parse_date
+
+    assert parse_date('2024-02-29') == parse_date('29/02/2024') == date(2024, 2, 29)
+    try:
+        parse_date('2024/02/29')
+        assert False, "unknown date format should raise"
+    except ValueError:
+        pass
+
+    windows = date_windows(date(2024, 1, 1), date(2024, 3, 1), window_days=30)
+    assert [w['label'] for w in windows] == ['2024-01-01..2024-01-30', '2024-01-31..2024-02-29',
+                                             '2024-03-01..2024-03-01']
+    assert windows[1]['from_date'] == '31/01/2024' and windows[1]['to_date'] == '29/02/2024'
+    assert len(date_windows(date(2024, 1, 1), date(2024, 1, 30), window_days=30)) == 1
+    assert [w['label'] for w in date_windows(date(2024, 1, 5), date(2024, 1, 5), 1)] == ['2024-01-05..2024-01-05']
+    assert date_windows(date(2024, 1, 2), date(2024, 1, 1)) == []
+    try:
+        date_windows(date(2024, 1, 1), date(2024, 1, 2), window_days=0)
+        assert False, "window_days below 1 should raise"
+    except ValueError:
+        pass
+
+    partitions = organisation_partitions(['Works Department', 'Energy Department'], base=windows[0])
+    assert [p['label'] for p in partitions] == ['2024-01-01..2024-01-30|Works Department',
+                                                '2024-01-01..2024-01-30|Energy Department']
+    assert partitions[0]['from_date'] == '01/01/2024' and 'organisation' not in windows[0]
+    assert organisation_partitions(['Works Department'])[0] == {'organisation': 'Works Department',
+                                                               'label': 'Works Department'}
+    print("[OK] Partition boundaries")
+
+def test_page_cursor_and_page_jump_url():
+    """Each search resumes at its own saved page, and page K's URL is built from a pager link"""
+    from scraper.fetch_backends import ReplayBackend
+
+    with temp_scraper(resume_pagination=True) as scraper:
+        assert scraper.get_start_page() == 1
+
+        scraper.current_page = 7
+        scraper.listing_exhausted = False
+        scraper.save_page_cursor()
+        assert scraper.get_start_page() == 7
+        # Another partition of the same search keeps its own cursor
+        scraper.search_filters = {'label': '2024-01-01..2024-01-30'}
+        assert scraper.get_start_page() == 1
+        scraper.search_filters = {'label': '2024-01-01..2024-01-30', 'start_page': 3}
+        assert scraper.get_start_page() == 3
+        scraper.search_filters = {}
+        scraper.listing_exhausted = True
+        scraper.save_page_cursor()
+        assert scraper.get_start_page() == 1
+
+        url = "https://portal/nicgep/app?page=WebTenderStatusLists&service=direct"
+        backend = ReplayBackend({})
+        backend.load("""<html><body><div>
+            <a href="app?component=%24TablePages&amp;page=WebTenderStatusLists&amp;service=direct&amp;sp=A1&amp;sp=1">1</a>
+            <a href="app?component=%24TablePages&amp;page=WebTenderStatusLists&amp;service=direct&amp;sp=2&amp;sp=2">2</a>
+            <a href="app?component=%24TablePages&amp;page=WebTenderStatusLists&amp;service=direct&amp;sp=A1&amp;sp=3">3</a>
+            </div></body></html>""", url)
+        links = {int(a.text): a for a in backend.find_elements('xpath', "//a[contains(@href, 'page=')]")}
+        assert scraper.page_url(links, 40) == ("https://portal/nicgep/app?component=%24TablePages"
+                                               "&page=WebTenderStatusLists&service=direct&sp=A1&sp=40")
+        # A link whose number appears more than once in its query cannot be rewritten safely
+        assert scraper.page_url({2: links[2]}, 40) is None
+    print("[OK] Page cursor and page jump URL")
+
+def test_page_archive_dedupe_and_reprocess():
+    """Identical pages are archived once, and reprocessing rebuilds the store from the archive"""
+    from scraper.reprocessor import reprocess_archive
+    from utils.page_archive import PageArchive
+    from utils.tender_store import TenderStore
+
+    with tempfile.TemporaryDirectory() as workdir:
+        archive = PageArchive(os.path.join(workdir, 'archive'))
+        url = "https://portal/nicgep/app?page=WebTenderStatusView&id=1"
+        assert archive.record(url, "<html>₹ 1,000</html>", tender_id='T1')
+        assert not archive.record(url, "<html>₹ 1,000</html>", tender_id='T1')
+        # Same page for another tender, or changed content, is a new copy
+        assert archive.record(url, "<html>₹ 1,000</html>", tender_id='T2')
+        assert archive.record(url, "<html>₹ 2,000</html>", tender_id='T2')
+        assert archive.count() == 3 and archive.get(url) == "<html>₹ 2,000</html>"
+        first = archive.pages()[0]
+        assert archive.read(first['id']) == "<html>₹ 1,000</html>" and first['tender_id'] == 'T1'
+        assert [p['tender_id'] for p in archive.pages(tender_id='T2')] == ['T2', 'T2']
+        assert archive.pages(kind='listing') == [] and archive.get("https://portal/other") is None
+        archive.close()
+
+        # Two listing pages and the first five detail pages from the saved fixtures
+        archive = PageArchive(os.path.join(workdir, 'portal_archive'))
+        for row, html in load_fixture_pages()[:7]:
+            archive.record(row['url'], html, kind=row['kind'], portal='Odisha', status='AOC')
+        store = TenderStore(os.path.join(workdir, 'tenders.db'))
+        store.upsert([{'Portal': 'Odisha', 'Tender ID': '2024_RURA_100001_1', 'Search_Status': 'AOC',
+                       'AOC_PDF_File': 'downloads/aoc_1.pdf'}])
+        assert reprocess_archive(archive, store, write_config(workdir), max_workers=2) == 5
+        rows = {row['Tender ID']: row for row in store.fetch("contractor_name IS NOT NULL")}
+        assert len(rows) == 5
+        first = rows['2024_RURA_100001_1']
+        # Offline reprocessing keeps the names of files downloaded by the original run
+        assert first['AOC_PDF_File'] == 'downloads/aoc_1.pdf' and first['Contract_Value_INR'] > 0
+        store.close()
+        archive.close()
+    print("[OK] Page archive dedupe and reprocessing")
+
+def test_batch_mode_requires_offline_captcha():
+    """Batch and NDJSON runs refuse every captcha method that could wait for a person"""
+    import io
+    from scraper import tender_scrapper
+
+    with tempfile.TemporaryDirectory() as workdir:
+        config = write_config(workdir, captcha_solver='template')
+        for args in ([], ['--captcha', 'manual'], ['--captcha', 'gui'], ['--captcha', 'auto'],
+                     ['--ndjson', '-', '--captcha', 'manual']):
+            argv = ['tender_scrapper.py', '--config', config, '--batch'] + args
+            with patched(sys, 'argv', argv), patched(sys, 'stderr', io.StringIO()) as stderr:
+                try:
+                    tender_scrapper.main()
+                    assert False, f"{args} should be rejected"
+                except SystemExit as e:
+                    assert e.code == 2, args
+            assert '--captcha offline' in stderr.getvalue()
+    print("[OK] Batch mode only accepts the offline captcha solver")
+
+def test_reauth_refreshes_stale_detail_links():
+    """After re-authenticating, the retry uses the link from the new session's listing, not the stale one"""
+    import scraper.tender_scrapper as module
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.tender_record import TenderRecord
+
+    class ListingBrowser(ReplayBackend):
+        """Browser stand-in showing the results listing of the new session"""
+        def get_cookies(self):
+            return []
+
+    pages = load_fixture_pages()
+    listing = next(html for row, html in pages if row['kind'] == 'listing')
+    archive = {row['url']: html for row, html in pages}
+    stale = "https://tenders.example.gov.in/nicgep/app?page=WebTenderStatusView&service=direct&id={}&session=old"
+    for tender_number in (1, 2):
+        archive[stale.format(tender_number)] = "<html><body><p>Your session has timed out.</p></body></html>"
+
+    with temp_scraper(maximize_page_size=False) as scraper, no_sleep(module):
+        scraper.fetch_backend = ReplayBackend(archive)
+        scraper.driver = ListingBrowser({})
+        def reauthenticate():
+            scraper.driver.load(listing, "https://tenders.example.gov.in/nicgep/app?page=WebTenderStatusLists")
+            return True
+        scraper.reauthenticate = reauthenticate
+        tender = TenderRecord(tender_id='2024_RURA_100001_1', status_link=stale.format(1))
+        pending = TenderRecord(tender_id='2024_WORK_100002_1', status_link=stale.format(2))
+        scraper.listing_pages = {tender['Tender ID']: 1, pending['Tender ID']: 1}
+
+        assert scraper.extract_with_reauth(tender, [pending])
+        assert tender['Status_Link'] in archive and 'session=old' not in tender['Status_Link']
+        assert tender['Contractor_Name'] not in (None, '<empty>')
+        # The tenders still queued get the new session's links too
+        assert 'session=old' not in pending['Status_Link']
+    print("[OK] Stale detail links refreshed after re-authentication")
+
+def test_portal_sessions_extract_concurrently():
+    """Two sessions on one portal are paced per request, so their detail extraction overlaps"""
+    import threading
+    import scraper.tender_scrapper as module
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.rate_limiter import RateLimiter, SessionRateLimiter
+    from scraper.tender_record import TenderRecord
+
+    pages = load_fixture_pages()
+    archive = {row['url']: html for row, html in pages}
+    details = [row['url'] for row, _ in pages if row['kind'] == 'detail']
+    portal = RateLimiter()
+    spans = {}
+
+    def run(name, urls):
+        with temp_scraper(delay_between_requests=0.05, keepalive_enabled=False) as scraper:
+            scraper.rate_limiter = SessionRateLimiter(portal)
+            scraper.fetch_backend = live_pages(archive)
+            scraper.driver = ReplayBackend({})
+            def download_aoc_pdfs(tender):
+                # Stands in for the PDF downloads after the detail page request
+                started = time.monotonic()
+                time.sleep(0.2)
+                spans.setdefault(name, []).append((started, time.monotonic()))
+            scraper.download_aoc_pdfs = download_aoc_pdfs
+            tenders = [TenderRecord(tender_id=f'{name}{i}', status_link=url) for i, url in enumerate(urls)]
+            scraper.process_tender_details(tenders)
+            assert not scraper.failed_tenders and all(t['Contractor_Name'] for t in tenders)
+
+    with no_sleep(module):
+        threads = [threading.Thread(target=run, args=('AOC', details[:3])),
+                   threading.Thread(target=run, args=('Retender', details[3:6]))]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+    assert len(spans['AOC']) == len(spans['Retender']) == 3
+    assert any(a_start < r_end and r_start < a_end
+               for a_start, a_end in spans['AOC'] for r_start, r_end in spans['Retender'])
+    # Six 0.2s downloads in two sessions, not one after the other
+    assert elapsed < 1.1, elapsed
+    print(f"[OK] Two sessions on one portal extracted concurrently in {elapsed:.2f}s")
+
+def test_partition_jobs_on_one_portal_overlap():
+    """Backfill partitions of one portal run side by side instead of taking turns per tender"""
+    from scraper import parallel_runner
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.tender_record import TenderRecord
+    from utils.tender_store import TenderStore
+
+    pages = load_fixture_pages()
+    archive = {row['url']: html for row, html in pages}
+    details = [row['url'] for row, _ in pages if row['kind'] == 'detail']
+    spans = {}
+
+    def scrape_records(self, captcha_method='manual'):
+        label = self.search_filters['label']
+        urls = details[:3] if label == 'first' else details[3:6]
+        self.fetch_backend = live_pages(archive)
+        self.driver = ReplayBackend({})
+        def download_aoc_pdfs(tender):
+            started = time.monotonic()
+            time.sleep(0.2)
+            spans.setdefault(label, []).append((started, time.monotonic()))
+        self.download_aoc_pdfs = download_aoc_pdfs
+        tenders = [TenderRecord(portal=self.portal_name, tender_id=f'{label}{i}', search_status='AOC', status_link=url)
+                   for i, url in enumerate(urls)]
+        return self.process_tender_details(tenders)
+
+    with tempfile.TemporaryDirectory() as workdir, \
+            patched(OdishaTenderScraperEnhanced, 'scrape_records', scrape_records):
+        store = TenderStore(os.path.join(workdir, 'tenders.db'))
+        config = write_config(workdir, delay_between_requests=0.05, keepalive_enabled=False)
+        results = parallel_runner.run_portals([{'name': 'P', 'base_url': 'https://portal'}], config,
+                                              store=store, max_workers=2,
+                                              partitions=[{'label': 'first'}, {'label': 'second'}])
+        assert sorted(results.values()) == [3, 3] and store.count() == 6
+        store.close()
+    assert any(f_start < s_end and s_start < f_end
+               for f_start, f_end in spans['first'] for s_start, s_end in spans['second'])
+    print("[OK] Partition jobs on one portal overlap")
+
+def test_tender_deadline_covers_browser_calls_only():
+    """A slow PDF download does not use up the tender deadline; a hung page load does"""
+    import scraper.tender_scrapper as module
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.tender_record import TenderRecord
+
+    detail_url, detail = next((row['url'], html) for row, html in load_fixture_pages() if row['kind'] == 'detail')
+
+    class Browser(ReplayBackend):
+        """Browser stand-in whose page loads take load_seconds"""
+        current_window_handle = 'main'
+
+        def __init__(self, load_seconds):
+            super().__init__({})
+            self.load_seconds = load_seconds
+            self.switch_to = type('SwitchTo', (), {'window': staticmethod(lambda handle: None)})()
+
+        def get(self, url):
+            time.sleep(self.load_seconds)
+            self.load(detail, url)
+
+        def execute_script(self, script, *args):
+            return []
+
+    with temp_scraper(tender_deadline_seconds=0.3, delay_between_requests=0, stage_summary_fetch="driver",
+                      keepalive_enabled=False) as scraper, no_sleep(module):
+        scraper.download_aoc_pdfs = lambda tender: time.sleep(0.5)
+        scraper.driver = Browser(load_seconds=0)
+        tender = TenderRecord(tender_id='2024_RURA_100001_1', status_link=detail_url)
+        scraper.extract_with_deadline(tender)
+        assert tender['Contractor_Name'] not in (None, '<empty>')
+        assert scraper.browser_budget is None
+
+        scraper.driver = Browser(load_seconds=0.5)
+        try:
+            scraper.extract_with_deadline(TenderRecord(tender_id='2024_RURA_100001_1', status_link=detail_url))
+            assert False, "hung page load should hit the deadline"
+        except module.PageLoadTimeoutError:
+            pass
+    print("[OK] Tender deadline covers browser calls only")
+
+def test_cached_driver_skipped_after_browser_update():
+    """A cached driver is not started once the installed browser has moved to a new major version"""
+    import scraper.tender_scrapper as module
+
+    started = []
+    with temp_scraper() as scraper:
+        driver_path = os.path.join(os.path.dirname(scraper.driver_cache.path), 'chromedriver')
+        open(driver_path, 'w').close()
+        scraper.setup_chrome_driver = lambda cached=None: started.append(cached) or False
+
+        scraper.driver_cache.save('chrome', driver_path, '120.0.6099.71')
+        with patched(module, 'installed_browser_version', lambda browser, binary=None: '121.0.6167.85'):
+            assert not scraper.launch_cached_driver()
+        assert started == [] and scraper.driver_cache.load() is None
+
+        # A minor update keeps the cached driver
+        scraper.driver_cache.save('chrome', driver_path, '120.0.6099.71')
+        with patched(module, 'installed_browser_version', lambda browser, binary=None: '120.0.6099.130'):
+            scraper.launch_cached_driver()
+        assert [cached['driver_path'] for cached in started] == [driver_path]
+    print("[OK] Cached driver skipped after a browser update")
+
+class FakeBrowser:
+    """Just enough of a WebDriver for the driver pool's health check and reset"""
+    window_handles = ['main']
+    current_url = 'about:blank'
+
+    def __init__(self):
+        self.switch_to = type('SwitchTo', (), {'window': staticmethod(lambda handle: None)})()
+        self.quit_called = False
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_driver_pool_acquire_takes_prewarming_browser():
+    """acquire waits for the replacement release() is already starting instead of starting a second browser"""
+    from scraper.driver_pool import DriverPool
+
+    started = []
+    def factory():
+        time.sleep(0.2)
+        started.append(FakeBrowser())
+        return started[-1]
+
+    pool = DriverPool(factory, size=1)
+    first = pool.acquire()
+    pool.release(first, reusable=False)
+    second = pool.acquire()
+    time.sleep(0.3)
+    assert first.quit_called and second is started[1] and len(started) == 2
+    pool.close()
+    print("[OK] Driver pool acquire takes the prewarming browser")
+
+def test_driver_pool_counts_uses_across_threads():
+    """Concurrent runs never get a browser past max_uses"""
+    import threading
+    from scraper.driver_pool import DriverPool
+
+    handed_out = {}
+    counter_lock = threading.Lock()
+    pool = DriverPool(FakeBrowser, size=2, max_uses=5)
+
+    def run():
+        for _ in range(25):
+            driver = pool.acquire()
+            with counter_lock:
+                handed_out[driver] = handed_out.get(driver, 0) + 1
+            pool.release(driver)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.close()
+    assert sum(handed_out.values()) == 100 and max(handed_out.values()) <= 5
+    print("[OK] Driver pool counts uses across threads")
+
+def test_interrupted_run_resumes_after_consumed_pages():
+    """The page cursor moves on as each listing page's tenders are processed, not only at the end"""
+    from scraper.tender_record import TenderRecord
+
+    tenders = [TenderRecord(tender_id=f'2024_TEST_{page}0{i}_1') for page in (1, 2, 3) for i in (1, 2)]
+    with temp_scraper(resume_pagination=True, keepalive_enabled=False) as scraper:
+        scraper.listing_pages = {tender['Tender ID']: int(tender['Tender ID'][10]) for tender in tenders}
+        scraper.check_browser_health = lambda: True
+        def extract(tender, pending=()):
+            if tender is tenders[4]:
+                raise KeyboardInterrupt
+            return True
+        scraper.extract_with_reauth = extract
+        try:
+            scraper.process_tender_details(tenders)
+            assert False, "run should have been interrupted"
+        except KeyboardInterrupt:
+            pass
+        assert scraper.get_start_page() == 3
+    print("[OK] Interrupted run resumes after the consumed listing pages")
+
+def test_stage_summary_link_without_target_is_clicked():
+    """A script-only details link falls back to clicking it and reading the window it opens"""
+    import scraper.tender_scrapper as module
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.tender_record import TenderRecord
+
+    detail_url = "https://portal/nicgep/app?page=WebTenderStatusView&id=1"
+    pages = {
+        'main': ("""<html><body><a href="javascript:void(0)" onclick="return showSummary();">stage summary Details</a></body></html>""",
+                 detail_url),
+        'details': ("""<html><body><table><tr><td>Stage</td><td>Financial Bid Opening</td></tr></table></body></html>""",
+                    "https://portal/nicgep/app?page=StageSummary&id=1"),
+    }
+
+    class Browser(ReplayBackend):
+        """Browser stand-in whose details link opens a second window"""
+        def __init__(self):
+            super().__init__({})
+            self.windows = ['main']
+            self.current_window_handle = 'main'
+            browser = self
+            class SwitchTo:
+                def window(self, handle):
+                    browser.current_window_handle = handle
+                    browser.load(*pages[handle])
+            self.switch_to = SwitchTo()
+            self.switch_to.window('main')
+
+        @property
+        def window_handles(self):
+            return list(self.windows)
+
+        def execute_script(self, script, *args):
+            self.windows.append('details')
+
+        def close(self):
+            self.windows.remove(self.current_window_handle)
+
+    with temp_scraper(delay_between_requests=0, keepalive_enabled=False) as scraper, no_sleep(module):
+        scraper.driver = Browser()
+        tender = TenderRecord(tender_id='2024_RURA_100001_1', status_link=detail_url)
+        scraper.extract_detailed_stage_summary(tender)
+        assert tender['Stage_Summary_Data'] == "Stage: Financial Bid Opening"
+        assert scraper.driver.window_handles == ['main'] and scraper.driver.current_url == detail_url
+    print("[OK] Script-only stage summary link is clicked")
+
+def test_listing_page_size_selection():
+    """The records-per-page dropdown is set to its largest (or configured) size; year dropdowns are ignored"""
+    import scraper.tender_scrapper as module
+
+    class Option:
+        def __init__(self, text, selected=False):
+            self.text = text
+            self.selected = selected
+
+        def is_selected(self):
+            return self.selected
+
+    class Dropdown:
+        def __init__(self, *texts, selected=None):
+            self.options = [Option(text, text == selected) for text in texts]
+
+    class Select:
+        """Just the part of Selenium's Select that set_max_page_size uses"""
+        def __init__(self, dropdown):
+            self.options = dropdown.options
+
+        def select_by_visible_text(self, text):
+            for option in self.options:
+                option.selected = option.text == text
+
+    class Listing:
+        def __init__(self, *dropdowns):
+            self.dropdowns = list(dropdowns)
+            self.current_url = "https://portal/nicgep/app?page=WebTenderStatusLists&pageSize=10"
+            self.loaded = []
+
+        def find_elements(self, by, value):
+            return self.dropdowns
+
+        def get(self, url):
+            self.loaded.append(url)
+
+    def chosen(dropdown):
+        return [option.text for option in dropdown.options if option.selected]
+
+    years = Dropdown('2023', '2024', '2025')
+    sizes = Dropdown('10', '20', '50', '100', selected='10')
+    with temp_scraper() as scraper, patched(module, 'Select', Select):
+        scraper.has_results_table = lambda timeout=5: True
+        scraper.driver = Listing(years, sizes)
+        assert scraper.set_max_page_size() and chosen(sizes) == ['100'] and chosen(years) == []
+
+        scraper.config["page_size"] = 50
+        assert scraper.set_max_page_size() and chosen(sizes) == ['50']
+
+        # No dropdown: the configured request parameter replaces the existing one
+        scraper.config["page_size_param"] = "pageSize"
+        scraper.config["page_size"] = 200
+        scraper.driver = Listing(years)
+        assert scraper.set_max_page_size()
+        assert scraper.driver.loaded == ["https://portal/nicgep/app?page=WebTenderStatusLists&pageSize=200"]
+
+        scraper.config["page_size_param"] = None
+        assert not scraper.set_max_page_size()
+    print("[OK] Listing page size selection")
+
+def test_lean_browser_profile_and_resource_blocking():
+    """Lean mode loads pages eagerly and blocks assets via DevTools, lifting the block for captchas"""
+    from selenium.webdriver import ChromeOptions
+
+    class Chromium:
+        def __init__(self):
+            self.commands = []
+
+        def execute_cdp_cmd(self, command, params):
+            self.commands.append((command, params))
+
+    with temp_scraper(lean_browser=True) as scraper:
+        options = ChromeOptions()
+        scraper.apply_lean_options(options)
+        assert options.page_load_strategy == 'eager' and '--disable-extensions' in options.arguments
+
+        scraper.driver = Chromium()
+        assert scraper.set_resource_blocking(True)
+        assert scraper.driver.commands[-1] == ("Network.setBlockedURLs",
+                                               {"urls": scraper.config["lean_blocked_url_patterns"]})
+        assert scraper.set_resource_blocking(False)
+        assert scraper.driver.commands[-1] == ("Network.setBlockedURLs", {"urls": []})
+
+        # Firefox has no DevTools URL blocking, and nothing is blocked unless lean mode is on
+        scraper.driver = object()
+        assert not scraper.set_resource_blocking(True)
+        scraper.driver = Chromium()
+        scraper.config["lean_browser"] = False
+        assert not scraper.set_resource_blocking(True) and scraper.driver.commands == []
+    print("[OK] Lean browser profile and resource blocking")
+
+def test_browser_watchdog_recycle_reasons():
+    """The watchdog asks for a new browser after max_pages, a load-time slowdown or too much memory"""
+    from scraper.browser_watchdog import BrowserWatchdog
+
+    watchdog = BrowserWatchdog(max_pages=25, max_rss_mb=None, slowdown_factor=3.0, window=5)
+    for _ in range(5):
+        watchdog.record_page(1.0)
+    for _ in range(4):
+        watchdog.record_page(5.0)
+    # Not enough recent loads yet to judge a slowdown
+    assert watchdog.recycle_reason(None) is None
+    watchdog.record_page(5.0)
+    assert watchdog.recycle_reason(None) == "page loads slowed from 1.0s to 5.0s"
+
+    watchdog.reset()
+    for _ in range(25):
+        watchdog.record_page(1.0)
+    assert watchdog.recycle_reason(None) == "25 pages loaded"
+
+    # This test process stands in for the browser; any real process exceeds 1 MB
+    browser = type('Driver', (), {'service': type('Service', (), {'process': type('Process', (), {'pid': os.getpid()})})})
+    watchdog = BrowserWatchdog(max_pages=0, max_rss_mb=1, slowdown_factor=None, sample_every=2)
+    watchdog.record_page(1.0)
+    assert watchdog.recycle_reason(browser) is None and watchdog.last_rss is None
+    watchdog.record_page(1.0)
+    assert watchdog.recycle_reason(browser).startswith("browser memory at ")
+    print("[OK] Browser watchdog recycle reasons")
+
+def test_html_tables_match_browser_tables():
+    """parse_tables reads saved pages like the browser's table script, and cell_pairs builds "a: b" rows"""
+    from scraper.fetch_backends import ReplayBackend
+    from scraper.html_tables import cell_pairs, parse_tables
+
+    html = """<html><head><title>Stage</title></head><body><table>
+        <tr><th>Field</th><th>Value</th></tr>
+        <tr><td>Tender&nbsp;ID</td><td> 2024_RURA_100001_1 <script>var x = 1;</script></td></tr>
+        <tr><td>Bidder</td><td>ABC<br>Constructions</td></tr>
+        <tr><td>Status</td><td>Status</td></tr>
+        <tr><td>Items</td><td><table><tr><td>Cement</td><td>100 bags</td></tr></table></td></tr>
+        <tr><td>Remarks</td><td></td></tr>
+    </table></body></html>"""
+    tables = parse_tables(html)
+    assert tables == [
+        [[], ['Tender ID', '2024_RURA_100001_1'], ['Bidder', 'ABC Constructions'], ['Status', 'Status'],
+         ['Items', 'Cement 100 bags'], ['Remarks', '']],
+        [['Cement', '100 bags']],
+    ]
+    assert parse_tables(html, cell_tags=('th', 'td'))[0][0] == ['Field', 'Value']
+    assert cell_pairs(tables, distinct=True) == ['Tender ID: 2024_RURA_100001_1', 'Bidder: ABC Constructions',
+                                                 'Items: Cement 100 bags', 'Cement: 100 bags']
+    assert 'Status: Status' in cell_pairs(tables)
+
+    # The replay backend mirrors TABLES_SCRIPT; both readers must agree on every saved page
+    backend = ReplayBackend({})
+    for row, page in [({'url': 'https://portal/stage'}, html)] + load_fixture_pages():
+        backend.load(page, row['url'])
+        assert backend.read_tables() == parse_tables(page), row['url']
+    print("[OK] HTML tables match the browser's tables")
+
+def test_network_pdf_capture():
+    """PDFs come from the browser's performance log first, then from an in-page fetch"""
+    import base64
+    from scraper.network_capture import NetworkCapture, is_pdf_response
+
+    assert is_pdf_response({'mimeType': 'application/pdf'})
+    assert is_pdf_response({'headers': {'Content-Disposition': 'attachment; filename="AOC.PDF"'}})
+    assert is_pdf_response({'url': 'https://portal/docs/aoc.pdf?v=2'})
+    assert not is_pdf_response({'url': 'https://portal/app?page=Home', 'mimeType': 'text/html'})
+
+    pdf = b'%PDF-1.4 award of contract'
+    def log_entry(url, mime_type, request_id):
+        return {'message': json.dumps({'message': {'method': 'Network.responseReceived', 'params': {
+            'requestId': request_id, 'response': {'url': url, 'mimeType': mime_type}}}})}
+
+    class Chromium:
+        def __init__(self):
+            self.log = [log_entry('https://portal/aoc.pdf', 'application/pdf', '7'),
+                        log_entry('https://portal/app', 'text/html', '8'), {'message': 'not json'}]
+            self.bodies = {'7': {'body': base64.b64encode(pdf).decode(), 'base64Encoded': True}}
+            self.fetched = []
+
+        def execute_cdp_cmd(self, command, params):
+            if command == 'Network.getResponseBody':
+                if params['requestId'] not in self.bodies:
+                    raise Exception("No resource with given identifier found")
+                return self.bodies[params['requestId']]
+            return {}
+
+        def get_log(self, kind):
+            entries, self.log = self.log, []
+            return entries
+
+        def execute_async_script(self, script, url):
+            self.fetched.append(url)
+            return {'data': base64.b64encode(pdf).decode()} if url.endswith('fetched.pdf') else {'error': 'HTTP 404'}
+
+    driver = Chromium()
+    capture = NetworkCapture(driver)
+    assert capture.get_pdf('https://portal/aoc.pdf#page=1') == pdf and driver.fetched == []
+    assert capture.pdf_requests == {'https://portal/aoc.pdf': '7'}
+
+    # Evicted from the browser's buffer: fetched from inside the page instead
+    driver.bodies.clear()
+    assert capture.get_pdf('https://portal/aoc.pdf') is None
+    assert 'https://portal/aoc.pdf' not in capture.pdf_requests
+    assert capture.get_pdf('https://portal/fetched.pdf') == pdf
+    assert driver.fetched == ['https://portal/aoc.pdf', 'https://portal/fetched.pdf']
+    print("[OK] Network PDF capture")
+
 if __name__ == "__main__":
-    test_scraper()
\ No newline at end of file
+    test_scraper()
+    test_contract_value_normalization()
+    test_contract_value_units_and_malformed()
+    test_contract_value_cell_kept_raw()
+    test_tender_record_legacy_access()
+    test_rejected_offline_captcha_falls_back_to_human()
+    test_captcha_solver_is_abstract()
+    test_ndjson_writer_streams_normalized_records()
+    test_session_expiry_detection_and_reauth()
+    test_saved_session_sets_session_cookies()
+    test_rate_limiter_spacing_and_activity()
+    test_heartbeat_pings_while_slot_is_held()
+    test_tender_store_status_precedence()
+    test_scrape_portal_stores_every_record()
+    test_portal_sessions_share_pacing()
+    test_html_backend_locators_and_tables()
+    test_fixture_pages_replay()
+    test_partition_boundaries()
+    test_page_cursor_and_page_jump_url()
+    test_page_archive_dedupe_and_reprocess()
+    test_batch_mode_requires_offline_captcha()
+    test_reauth_refreshes_stale_detail_links()
+    test_portal_sessions_extract_concurrently()
+    test_partition_jobs_on_one_portal_overlap()
+    test_tender_deadline_covers_browser_calls_only()
+    test_cached_driver_skipped_after_browser_update()
+    test_driver_pool_acquire_takes_prewarming_browser()
+    test_driver_pool_counts_uses_across_threads()
+    test_interrupted_run_resumes_after_consumed_pages()
+    test_stage_summary_link_without_target_is_clicked()
+    test_listing_page_size_selection()
+    test_lean_browser_profile_and_resource_blocking()
+    test_browser_watchdog_recycle_reasons()
+    test_html_tables_match_browser_tables()
+    test_network_pdf_capture()